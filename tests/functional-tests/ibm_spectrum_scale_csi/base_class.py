@@ -6,7 +6,10 @@ from kubernetes.client.rest import ApiException
 import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_objects_function as kubeobjectfunc
 import ibm_spectrum_scale_csi.kubernetes_apis.csi_object_function as csiobjectfunc
 import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc 
+import ibm_spectrum_scale_csi.kubernetes_apis.bulk_pvc_function as bulkpvcfunc
 import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
 
 LOGGER = logging.getLogger()
 
@@ -248,7 +251,8 @@ class Scaleoperatorobject:
 
 class Driver:
 
-    def __init__(self, kubeconfig_value, value_pvc, value_pod, cluster_id, test_ns, keep_object, image_name, plugin_nodeselector_labels):
+    def __init__(self, kubeconfig_value, value_pvc, value_pod, cluster_id, test_ns, keep_object, image_name, plugin_nodeselector_labels,
+                 parallel_pvc_concurrency=bulkpvcfunc.DEFAULT_CONCURRENCY):
         self.value_pvc = value_pvc
         self.value_pod = value_pod
         self.cluster_id = cluster_id
@@ -256,6 +260,7 @@ class Driver:
         self.keep_objects = keep_object
         self.kubeconfig = kubeconfig_value
         self.image_name = image_name
+        self.parallel_pvc_concurrency = parallel_pvc_concurrency
         csistoragefunc.set_test_namespace_value(self.test_ns)
         csistoragefunc.set_test_nodeselector_value(plugin_nodeselector_labels)
         csistoragefunc.set_keep_objects(self.keep_objects)
@@ -274,10 +279,8 @@ class Driver:
 
         LOGGER.info(
             f"Testing Dynamic Provisioning with following PVC parameters {str(value_pvc_passed)}")
-        sc_name = csistoragefunc.get_random_name("sc")
         config.load_kube_config(config_file=self.kubeconfig)
-        csistoragefunc.create_storage_class(value_sc, sc_name, created_objects)
-        csistoragefunc.check_storage_class(sc_name)
+        sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
         for num, _ in enumerate(value_pvc_passed):
             value_pvc_pass = copy.deepcopy(value_pvc_passed[num])
             if "reason" in value_sc:
@@ -324,9 +327,7 @@ class Driver:
         created_objects = get_cleanup_dict()
         sc_name = ""
         if sc_value is not False:
-            sc_name = csistoragefunc.get_random_name("sc")
-            csistoragefunc.create_storage_class(sc_value,  sc_name, created_objects)
-            csistoragefunc.check_storage_class(sc_name)
+            sc_name = csistoragefunc.get_pooled_storage_class(sc_value, created_objects)
         FSUID = filesetfunc.get_FSUID()
         cluster_id = self.cluster_id
         if wrong is not None:
@@ -338,7 +339,7 @@ class Driver:
 
         mount_point = filesetfunc.get_mount_point()
         if root_volume is False:
-            dir_name = csistoragefunc.get_random_name("dir")
+            dir_name = runcontext.get().dir_prefix + csistoragefunc.get_random_name("dir")
             filesetfunc.create_dir(dir_name)
             created_objects["dir"].append(dir_name)
             pv_value["volumeHandle"] = cluster_id+";"+FSUID + \
@@ -384,10 +385,8 @@ class Driver:
 
     def one_pvc_two_pod(self, value_sc, value_pvc_pass, value_ds_pass):
         created_objects = get_cleanup_dict()
-        sc_name = csistoragefunc.get_random_name("sc")
         config.load_kube_config(config_file=self.kubeconfig)
-        csistoragefunc.create_storage_class(value_sc, sc_name, created_objects)
-        csistoragefunc.check_storage_class(sc_name)
+        sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
         pvc_name = csistoragefunc.get_random_name("pvc")
         csistoragefunc.create_pvc(value_pvc_pass, sc_name, pvc_name, created_objects)
         val = csistoragefunc.check_pvc(value_pvc_pass, pvc_name, created_objects)
@@ -399,10 +398,8 @@ class Driver:
 
     def parallel_pvc(self, value_sc, num_of_pvc, pod_creation=False):
         created_objects = get_cleanup_dict()
-        sc_name = csistoragefunc.get_random_name("sc")
         config.load_kube_config(config_file=self.kubeconfig)
-        csistoragefunc.create_storage_class(value_sc, sc_name, created_objects)
-        csistoragefunc.check_storage_class(sc_name)
+        sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
         pvc_names = []
         number_of_pvc = num_of_pvc
         common_pvc_name = csistoragefunc.get_random_name("pvc")
@@ -412,28 +409,18 @@ class Driver:
         LOGGER.info(100*"-")
         value_pvc_pass["parallel"] = "True"
 
-        for pvc_name in pvc_names:
-            LOGGER.info(100*"-")
-            csistoragefunc.create_pvc(value_pvc_pass, sc_name, pvc_name, created_objects)
-
-        for pvc_name in pvc_names:
-            LOGGER.info(100*"-")
-            csistoragefunc.check_pvc(value_pvc_pass, pvc_name, created_objects)
+        bulkpvcfunc.provision_pvcs(value_pvc_pass, sc_name, pvc_names, created_objects, self.parallel_pvc_concurrency)
+        csistoragefunc.check_pvcs_filesets_batch(value_pvc_pass, pvc_names, created_objects)
 
         if pod_creation is False:
             csistoragefunc.clean_with_created_objects(created_objects)
             return
 
-        pod_names = []
-
-        for pvc_name in pvc_names:
-            LOGGER.info(100*"-")
-            pod_name = csistoragefunc.get_random_name("pod")
-            pod_names.append(pod_name)
-            csistoragefunc.create_pod(self.value_pod[0], pvc_name, pod_name, created_objects, self.image_name)
-            csistoragefunc.check_pod(self.value_pod[0], pod_name, created_objects)
-            csistoragefunc.delete_pod(pod_name, created_objects)
-            csistoragefunc.check_pod_deleted(pod_name, created_objects)
+        pod_names = [csistoragefunc.get_random_name("pod") for _ in pvc_names]
+        LOGGER.info(100*"-")
+        bulkpvcfunc.start_pods(self.value_pod[0], pvc_names, pod_names, created_objects, self.image_name,
+                               self.parallel_pvc_concurrency)
+        bulkpvcfunc.delete_pods(pod_names, created_objects, self.parallel_pvc_concurrency)
 
         csistoragefunc.clean_with_created_objects(created_objects)
 
@@ -469,9 +456,7 @@ class Snapshot():
         for pvc_value in value_pvc:
 
             LOGGER.info("-"*100)
-            sc_name = csistoragefunc.get_random_name("sc")
-            csistoragefunc.create_storage_class(value_sc, sc_name, created_objects)
-            csistoragefunc.check_storage_class(sc_name)
+            sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
 
             pvc_name = csistoragefunc.get_random_name("pvc")
             csistoragefunc.create_pvc(pvc_value, sc_name, pvc_name, created_objects)
@@ -512,7 +497,7 @@ class Snapshot():
             if test_restore:
                 restore_sc_name = sc_name
                 if restore_sc is not None:
-                    restore_sc_name = "restore-" + restore_sc_name
+                    restore_sc_name = "restore-" + csistoragefunc.get_random_name("sc")
                     csistoragefunc.create_storage_class(restore_sc, restore_sc_name, created_objects)
                     csistoragefunc.check_storage_class(restore_sc_name)
                 else:
@@ -562,9 +547,7 @@ class Snapshot():
 
             created_objects = get_cleanup_dict()
             LOGGER.info("-"*100)
-            sc_name = csistoragefunc.get_random_name("sc")
-            csistoragefunc.create_storage_class(value_sc, sc_name, created_objects)
-            csistoragefunc.check_storage_class(sc_name)
+            sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
 
             pvc_name = csistoragefunc.get_random_name("pvc")
             csistoragefunc.create_pvc(pvc_value, sc_name, pvc_name, created_objects)
@@ -607,7 +590,7 @@ class Snapshot():
 
             if test_restore:
                 if restore_sc is not None:
-                    sc_name = "restore-" + sc_name
+                    sc_name = "restore-" + csistoragefunc.get_random_name("sc")
                     csistoragefunc.create_storage_class(restore_sc, sc_name, created_objects)
                     csistoragefunc.check_storage_class(sc_name)
                 if restore_pvc is not None:
@@ -631,21 +614,21 @@ class Snapshot():
 
 
 def get_cleanup_dict():
-    created_object = {
-        "sc": [],
-        "pvc": [],
-        "pod": [],
-        "vs": [],
-        "vsclass": [],
-        "vscontent": [],
-        "scalesnapshot": [],
-        "restore_pod": [],
-        "restore_pvc": [],
-        "clone_pod": [],
-        "clone_pvc": [],
-        "pv": [],
-        "dir": [],
-        "ds": [],
-        "cg": []
-    }
+    created_object = resourceledger.get_ledger([
+        "sc",
+        "pvc",
+        "pod",
+        "vs",
+        "vsclass",
+        "vscontent",
+        "scalesnapshot",
+        "restore_pod",
+        "restore_pvc",
+        "clone_pod",
+        "clone_pvc",
+        "pv",
+        "dir",
+        "ds",
+        "cg"
+    ])
     return created_object
@@ -0,0 +1,76 @@
+import os
+import csv
+import json
+import logging
+import threading
+from datetime import datetime
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+LOGGER = logging.getLogger()
+
+DEFAULT_REPORT_DIR = "benchmark-reports"
+LATENCY_FIELDS = ["count", "min", "mean", "p50", "p95", "p99", "max"]
+
+
+class BenchmarkReport:
+    """
+    Results of benchmark testcases of one session , written as JSON and CSV
+
+    Every result is one operation (e.g. pvc bind) measured with one set of
+    parameters (e.g. volume type and concurrency) , see add.
+    """
+
+    def __init__(self, metadata=None):
+        self.metadata = {"started_at": datetime.now().isoformat(), **(metadata or {})}
+        self.results = []
+        self.lock = threading.Lock()
+
+    def add(self, benchmark, parameters, report):
+        """
+        adds result of benchmark
+
+        Args:
+            param1: benchmark - name of benchmark , e.g. provisioning
+            param2: parameters - dict of parameters of the run , e.g. volume type and concurrency
+            param3: report - report of bulk_pvc_function.get_report (operation , counts , per_second , latency)
+        """
+        with self.lock:
+            self.results.append({"benchmark": benchmark, **parameters, **report})
+        LOGGER.info(f"Benchmark : {benchmark} {parameters} {report}")
+
+    def get_parameter_names(self):
+        names = []
+        for result in self.results:
+            for name in result:
+                if name not in names and name not in ["latency", "benchmark", "operation"]:
+                    names.append(name)
+        return names
+
+    def write(self, report_dir=DEFAULT_REPORT_DIR):
+        """
+        writes results to report_dir as benchmark-<time>.json (metadata and results) and
+        benchmark-<time>.csv (one row per result , latency percentiles as columns)
+
+        Returns:
+           (json path , csv path) , None if there are no results
+        """
+        with self.lock:
+            if len(self.results) == 0:
+                return None
+            os.makedirs(report_dir, exist_ok=True)
+            worker_id = runcontext.get_worker_id()
+            name = f"benchmark-{datetime.now().strftime('%Y%m%d-%H%M%S')}{'-' + worker_id if worker_id else ''}"
+            json_path = os.path.join(report_dir, f"{name}.json")
+            csv_path = os.path.join(report_dir, f"{name}.csv")
+            with open(json_path, "w") as f:
+                json.dump({"metadata": self.metadata, "results": self.results}, f, indent=2, default=str)
+
+            columns = ["benchmark", "operation"] + self.get_parameter_names() + [f"latency_{field}" for field in LATENCY_FIELDS]
+            with open(csv_path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns, restval="")
+                writer.writeheader()
+                for result in self.results:
+                    row = {key: value for key, value in result.items() if key != "latency"}
+                    row.update({f"latency_{field}": value for field, value in result.get("latency", {}).items()})
+                    writer.writerow(row)
+        LOGGER.info(f"Benchmark : report written to {json_path} and {csv_path}")
+        return json_path, csv_path
@@ -0,0 +1,88 @@
+import logging
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.kubernetes_apis.bulk_pvc_function as bulkpvcfunc
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
+import ibm_spectrum_scale_csi.benchmarks.snapshot_benchmark as snapbenchmark
+import ibm_spectrum_scale_csi.common_utils.statistics_functions as statfunc
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+LOGGER = logging.getLogger()
+
+MODES = ["fanout", "chain"]
+# number of clones of source created at the same time in fanout mode
+FAN_OUTS = [1, 4, 16]
+# number of clones in chain mode , every clone is cloned from the previous one
+CHAIN_DEPTHS = [2, 4]
+# nodeClass of storage class used for copies , "" lets the GUI node do the copy
+DEFAULT_NODE_CLASSES = [""]
+
+
+def get_storage_class_values(test_data, node_class):
+    """ return independent fileset storage class parameters with nodeClass node_class if not "" """
+    value_sc = {"volBackendFs": test_data["localFs"], "clusterId": test_data["id"]}
+    if node_class != "":
+        value_sc["nodeClass"] = node_class
+    return value_sc
+
+
+def get_copy_job_report(pvc_names):
+    """ return report of durations of GUI directoryCopy jobs which filled pvcs pvc_names , see fileset_functions.get_copy_job_durations """
+    volume_names = bulkpvcfunc.get_volume_names(pvc_names)
+    durations = filesetfunc.get_copy_job_durations(list(volume_names.values()))
+    report = {"operation": "copy job", "submitted": len(volume_names), "completed": len(durations),
+              "latency": statfunc.summarize(list(durations.values()))}
+    LOGGER.info(f"Bulk Report : {report}")
+    return report
+
+
+def run(test_data, mode, size, file_count, file_size_mb, node_class, report):
+    """
+    fills an independent fileset volume with file_count files of file_size_mb MiB from a pod and
+    clones it , in fanout mode size clones of it are created at the same time , in chain mode
+    size clones are created one after the other , each from the previous clone
+
+    clone-to-Bound latency is taken from the time each pvc is seen Bound by the pvc informer (watch) ,
+    copy job duration from submitted and completed times of the GUI directoryCopy job of each clone ,
+    both are added to report with the data size and nodeClass
+
+    Args:
+        param1: test_data - contents of configuration file
+        param2: mode - one of MODES
+        param3: size - number of clones (fanout) or chain depth (chain)
+        param4: file_count - number of files written in source volume
+        param5: file_size_mb - size of every file in MiB
+        param6: node_class - nodeClass of storage class , "" for none
+        param7: report - BenchmarkReport results are added to
+    """
+    if mode not in MODES:
+        raise ValueError(f"unknown clone benchmark mode {mode} , expected one of {MODES}")
+    if not(filesetfunc.feature_available("clone")):
+        LOGGER.warning("Min required Spectrum Scale version for volume cloning support with CSI is 5.1.2-1")
+        LOGGER.warning("Skipping Testcase")
+        return
+
+    created_objects = resourceledger.get_ledger(csistoragefunc.CLEANUP_DEPENDENCIES)
+    value_sc = get_storage_class_values(test_data, node_class)
+    value_pvc = snapbenchmark.get_pvc_values(file_count, file_size_mb)
+    parameters = {"mode": mode, "size": size, "file_count": file_count, "file_size_mb": file_size_mb,
+                  "data_mb": file_count * file_size_mb, "node_class": node_class}
+    LOGGER.info(f"Benchmark : clone {mode} of {size} with {file_count} files of {file_size_mb} MiB , nodeClass {node_class!r}")
+
+    sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
+    pvc_name, _ = snapbenchmark.create_source_volume(test_data, sc_name, value_pvc, file_count, file_size_mb,
+                                                     parameters, created_objects)
+
+    if mode == "fanout":
+        clone_pvc_names = [f"clone-{pvc_name}-{num}" for num in range(0, size)]
+        report.add("clone", parameters, bulkpvcfunc.clone_pvcs(value_pvc, sc_name, clone_pvc_names, pvc_name,
+                                                               created_objects, size))
+        report.add("clone", parameters, get_copy_job_report(clone_pvc_names))
+    else:
+        from_pvc_name = pvc_name
+        for level in range(1, size + 1):
+            clone_pvc_name = f"clone-{pvc_name}-chain-{level}"
+            level_parameters = {**parameters, "chain_level": level}
+            report.add("clone", level_parameters, bulkpvcfunc.clone_pvcs(value_pvc, sc_name, [clone_pvc_name], from_pvc_name,
+                                                                         created_objects, 1))
+            report.add("clone", level_parameters, get_copy_job_report([clone_pvc_name]))
+            from_pvc_name = clone_pvc_name
+    csistoragefunc.clean_with_created_objects(created_objects)
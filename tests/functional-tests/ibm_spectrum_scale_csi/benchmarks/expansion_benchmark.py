@@ -0,0 +1,49 @@
+import logging
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.kubernetes_apis.bulk_pvc_function as bulkpvcfunc
+import ibm_spectrum_scale_csi.benchmarks.provisioning_benchmark as provbenchmark
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+LOGGER = logging.getLogger()
+
+# volume types with a fileset quota , lightweight volumes have none
+VOLUME_TYPES = ["independent", "dependent"]
+CONCURRENCY_LEVELS = [1, 8, 32]
+# storage pvcs are created with and then expanded to , one step after the other
+INITIAL_STORAGE = "1Gi"
+EXPANSION_STEPS = ["10Gi", "100Gi", "1Ti"]
+
+
+def run(volume_type, test_data, concurrency, report):
+    """
+    creates concurrency pvcs of volume_type and expands all of them at the same time to every
+    storage of EXPANSION_STEPS , one step after the other
+
+    patch-to-resized latency is taken from the time status.capacity of each pvc reaches the new
+    storage with no Resizing / FileSystemResizePending condition , as seen by the pvc informer (watch) ,
+    patch-to-quota latency from the first poll of fileset quotas showing the new blockLimit , polling
+    starts right after the patch requests and runs in parallel with the resize wait ,
+    both are added to report with throughput and percentiles
+
+    Args:
+        param1: volume_type - one of VOLUME_TYPES
+        param2: test_data - contents of configuration file
+        param3: concurrency - number of pvcs expanded at the same time
+        param4: report - BenchmarkReport results are added to
+    """
+    created_objects = resourceledger.get_ledger(csistoragefunc.CLEANUP_DEPENDENCIES)
+    value_sc = {**provbenchmark.get_storage_class_values(volume_type, test_data), "allow_volume_expansion": True}
+    value_pvc = {"access_modes": "ReadWriteMany", "storage": INITIAL_STORAGE}
+    sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
+    common_pvc_name = csistoragefunc.get_random_name("pvc")
+    pvc_names = [f"{common_pvc_name}-{num}" for num in range(0, concurrency)]
+    LOGGER.info(f"Benchmark : expanding {concurrency} {volume_type} volumes to {EXPANSION_STEPS}")
+
+    bulkpvcfunc.provision_pvcs(value_pvc, sc_name, pvc_names, created_objects, concurrency)
+    for storage in EXPANSION_STEPS:
+        parameters = {"volume_type": volume_type, "concurrency": concurrency, "storage": storage}
+        resize_report, quota_report = bulkpvcfunc.expand_pvcs(pvc_names, storage, created_objects, concurrency)
+        report.add("expansion", parameters, resize_report)
+        report.add("expansion", parameters, quota_report)
+
+    bulkpvcfunc.delete_pvcs(pvc_names, created_objects, concurrency)
+    csistoragefunc.clean_with_created_objects(created_objects)
@@ -0,0 +1,43 @@
+import logging
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.benchmarks.provisioning_benchmark as provbenchmark
+import ibm_spectrum_scale_csi.benchmarks.snapshot_benchmark as snapbenchmark
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+LOGGER = logging.getLogger()
+
+VOLUME_TYPES = ["lightweight", "independent", "dependent", "compressed", "tiered"]
+
+
+def get_storage_class_values(volume_type, test_data):
+    """ return storage class parameters for volume_type of VOLUME_TYPES , compressed and tiered volumes are independent filesets """
+    if volume_type == "compressed":
+        return {**provbenchmark.get_storage_class_values("independent", test_data), "compression": "true"}
+    if volume_type == "tiered":
+        return {**provbenchmark.get_storage_class_values("independent", test_data), "tier": test_data["tier"]}
+    return provbenchmark.get_storage_class_values(volume_type, test_data)
+
+
+def run(volume_type, test_data, io_values, report):
+    """
+    creates a volume of volume_type and a pod using it , and runs io probe workloads
+    (sequential and random write and read , see csi_storage_function.run_io_probe) inside the pod ,
+    MB/s and IOPS of every workload are added to report
+
+    Args:
+        param1: volume_type - one of VOLUME_TYPES
+        param2: test_data - contents of configuration file
+        param3: io_values - overrides of csi_storage_function.IO_PROBE_DEFAULTS
+        param4: report - BenchmarkReport results are added to
+    """
+    created_objects = resourceledger.get_ledger(csistoragefunc.CLEANUP_DEPENDENCIES)
+    io_values = {**csistoragefunc.IO_PROBE_DEFAULTS, **(io_values or {})}
+    value_sc = get_storage_class_values(volume_type, test_data)
+    value_pvc = snapbenchmark.get_pvc_values(1, io_values["size_mb"])
+    LOGGER.info(f"Benchmark : io probe of {volume_type} volume with {io_values}")
+
+    sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
+    _, pod_name = snapbenchmark.create_source_volume(test_data, sc_name, value_pvc, 0, 0, {}, created_objects)
+    results = csistoragefunc.run_io_probe(snapbenchmark.VALUE_POD, pod_name, io_values, created_objects)
+    for workload, result in results.items():
+        report.add("io", {"volume_type": volume_type, **io_values}, {"operation": workload, **result})
+    csistoragefunc.clean_with_created_objects(created_objects)
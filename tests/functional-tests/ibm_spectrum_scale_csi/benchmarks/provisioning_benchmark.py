@@ -0,0 +1,60 @@
+import copy
+import logging
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.kubernetes_apis.bulk_pvc_function as bulkpvcfunc
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+LOGGER = logging.getLogger()
+
+VOLUME_TYPES = ["lightweight", "independent", "dependent", "consistency_group"]
+CONCURRENCY_LEVELS = [1, 8, 32, 128]
+
+
+def get_storage_class_values(volume_type, test_data):
+    """ return storage class parameters for volume_type of VOLUME_TYPES on local filesystem of test_data """
+    if volume_type == "lightweight":
+        return {"volBackendFs": test_data["localFs"], "volDirBasePath": test_data["volDirBasePath"]}
+    if volume_type == "independent":
+        return {"volBackendFs": test_data["localFs"], "clusterId": test_data["id"], "filesetType": "independent"}
+    if volume_type == "dependent":
+        return {"volBackendFs": test_data["localFs"], "clusterId": test_data["id"], "filesetType": "dependent"}
+    if volume_type == "consistency_group":
+        return {"volBackendFs": test_data["localFs"], "version": "2"}
+    raise ValueError(f"unknown volume type {volume_type} , expected one of {VOLUME_TYPES}")
+
+
+def run(volume_type, test_data, value_pvc, concurrency, report):
+    """
+    creates concurrency pvcs of volume_type at the same time , waits till all are Bound ,
+    deletes them at the same time and waits till pvcs and pvs are gone
+
+    create-to-Bound and delete-to-gone latencies are taken from the time each change is
+    seen by the pvc / pv informer (watch) and added to report with throughput and percentiles
+
+    Args:
+        param1: volume_type - one of VOLUME_TYPES
+        param2: test_data - contents of configuration file
+        param3: value_pvc - pvc parameters (access mode , size)
+        param4: concurrency - number of pvcs created and deleted at the same time
+        param5: report - BenchmarkReport results are added to
+    """
+    created_objects = resourceledger.get_ledger(csistoragefunc.CLEANUP_DEPENDENCIES)
+    value_sc = get_storage_class_values(volume_type, test_data)
+    sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
+    common_pvc_name = csistoragefunc.get_random_name("pvc")
+    pvc_names = [f"{common_pvc_name}-{num}" for num in range(0, concurrency)]
+    value_pvc_pass = copy.deepcopy(value_pvc)
+    parameters = {"volume_type": volume_type, "concurrency": concurrency}
+    LOGGER.info(f"Benchmark : provisioning {concurrency} {volume_type} volumes")
+
+    if kubeinformer.get_informer("pvc", runcontext.get().namespace) is None:
+        LOGGER.warning("Benchmark : pvc informer is not running , latencies include polling interval")
+
+    report.add("provisioning", parameters, bulkpvcfunc.provision_pvcs(value_pvc_pass, sc_name, pvc_names, created_objects, concurrency))
+    deleted = bulkpvcfunc.delete_pvcs(pvc_names, created_objects, concurrency)
+    if deleted is not None:
+        requested_at, pvc_deleted_at, pv_deleted_at = deleted
+        report.add("provisioning", parameters, bulkpvcfunc.get_report("pvc delete", requested_at, pvc_deleted_at))
+        report.add("provisioning", parameters, bulkpvcfunc.get_report("pv delete", requested_at, pv_deleted_at))
+    csistoragefunc.clean_with_created_objects(created_objects)
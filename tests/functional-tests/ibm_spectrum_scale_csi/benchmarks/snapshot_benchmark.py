@@ -0,0 +1,142 @@
+import math
+import time
+import logging
+import concurrent.futures
+from kubernetes import client
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.kubernetes_apis.bulk_pvc_function as bulkpvcfunc
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+LOGGER = logging.getLogger()
+
+# data written in source volume before snapshots are taken , (number of files , MiB per file)
+DATASETS = [(0, 0), (1000, 1), (10, 100), (100, 100)]
+DEFAULT_SNAPSHOTS = 4
+DEFAULT_SNAPSHOTS_PER_MINUTE = 6
+DEFAULT_RESTORES = 8
+SNAPSHOT_READY_TIMEOUT = 1200
+VALUE_POD = {"mount_path": "/usr/share/nginx/html/scale", "read_only": "False"}
+
+
+def get_pvc_values(file_count, file_size_mb):
+    """ return ReadWriteMany pvc parameters with 20% more space than the dataset , at least 1Gi """
+    storage = max(1, math.ceil(file_count * file_size_mb * 1.2 / 1024))
+    return {"access_modes": "ReadWriteMany", "storage": f"{storage}Gi"}
+
+
+def create_source_volume(test_data, sc_name, value_pvc, file_count, file_size_mb, parameters, created_objects):
+    """
+    creates pvc with storage class sc_name and a pod using it , and fills it with file_count files
+    of file_size_mb MiB from the pod , fill time is added to parameters as fill_seconds
+
+    Returns:
+       (name of created pvc , name of pod using it)
+    """
+    pvc_name = csistoragefunc.get_random_name("pvc")
+    csistoragefunc.create_pvc(value_pvc, sc_name, pvc_name, created_objects)
+    csistoragefunc.check_pvc(value_pvc, pvc_name, created_objects)
+
+    pod_name = csistoragefunc.get_random_name("source-pod")
+    csistoragefunc.create_pod(VALUE_POD, pvc_name, pod_name, created_objects, test_data["image_name"])
+    csistoragefunc.check_pod(VALUE_POD, pod_name, created_objects)
+    if file_count * file_size_mb > 0:
+        fill_time = csistoragefunc.fill_volume(VALUE_POD, pod_name, file_count, file_size_mb, created_objects)
+        parameters["fill_seconds"] = round(fill_time, 3)
+    return pvc_name, pod_name
+
+
+def is_ready_to_use(volume_snapshot):
+    return (volume_snapshot.get("status") or {}).get("readyToUse") is True
+
+
+def create_snapshots(vs_names, vs_class_name, pvc_name, snapshots_per_minute, created_objects):
+    """
+    creates volume snapshots vs_names of pvc_name , one every 60 / snapshots_per_minute seconds
+
+    Returns:
+       dict snapshot name -> time (time.monotonic) at which its create request was sent
+    """
+    interval = 60 / snapshots_per_minute
+    started = time.monotonic()
+    created_at = {}
+    for num, vs_name in enumerate(vs_names):
+        time.sleep(max(0, started + num * interval - time.monotonic()))
+        created_at[vs_name] = time.monotonic()
+        csistoragefunc.create_vs(vs_name, vs_class_name, pvc_name, created_objects)
+    return created_at
+
+
+def take_snapshots(vs_names, vs_class_name, pvc_name, snapshots_per_minute, created_objects):
+    """
+    creates volume snapshots vs_names at snapshots_per_minute from a worker thread while
+    readyToUse of every snapshot is watched , so snapshots get ready while later ones are created
+
+    Returns:
+       report with snapshots/s and create-to-readyToUse latency percentiles , see bulk_pvc_function.get_report
+    """
+    LOGGER.info(f"Volume Snapshot Create : creating {len(vs_names)} snapshots of {pvc_name} , {snapshots_per_minute} per minute")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        creating = executor.submit(runcontext.bind(create_snapshots), vs_names, vs_class_name, pvc_name,
+                                   snapshots_per_minute, created_objects)
+        ready_at = bulkpvcfunc.wait_for_condition("vs", client.CustomObjectsApi().list_namespaced_custom_object, vs_names,
+                                                  is_ready_to_use, SNAPSHOT_READY_TIMEOUT, f"{len(vs_names)} vs readyToUse",
+                                                  group="snapshot.storage.k8s.io", version="v1", plural="volumesnapshots",
+                                                  namespace=runcontext.get().namespace)
+        created_at = creating.result()
+    report = bulkpvcfunc.get_report("snapshot ready", created_at, ready_at)
+    bulkpvcfunc.check_all_completed(vs_names, ready_at, "Volume Snapshot Check", created_objects)
+    return report
+
+
+def run(test_data, file_count, file_size_mb, report, number_of_snapshots=DEFAULT_SNAPSHOTS,
+        snapshots_per_minute=DEFAULT_SNAPSHOTS_PER_MINUTE, number_of_restores=DEFAULT_RESTORES):
+    """
+    fills an independent fileset volume with file_count files of file_size_mb MiB from a pod ,
+    takes number_of_snapshots snapshots of it at snapshots_per_minute and restores
+    number_of_restores pvcs from the last snapshot at the same time
+
+    create-to-readyToUse and restore-to-Bound latencies are taken from the time each change
+    is seen by the volumesnapshot / pvc informer (watch) and added to report with the data size
+
+    Args:
+        param1: test_data - contents of configuration file
+        param2: file_count - number of files written in source volume
+        param3: file_size_mb - size of every file in MiB
+        param4: report - BenchmarkReport results are added to
+        param5: number_of_snapshots - number of snapshots taken of source volume
+        param6: snapshots_per_minute - rate at which snapshots are created
+        param7: number_of_restores - number of pvcs restored from last snapshot at the same time
+    """
+    if not(filesetfunc.feature_available("snapshot")):
+        LOGGER.warning("Min required Spectrum Scale version for snapshot support with CSI is 5.1.1-0")
+        LOGGER.warning("Skipping Testcase")
+        return
+
+    created_objects = resourceledger.get_ledger(csistoragefunc.CLEANUP_DEPENDENCIES)
+    value_sc = {"volBackendFs": test_data["localFs"], "clusterId": test_data["id"]}
+    value_pvc = get_pvc_values(file_count, file_size_mb)
+    parameters = {"file_count": file_count, "file_size_mb": file_size_mb, "data_mb": file_count * file_size_mb,
+                  "snapshots": number_of_snapshots, "snapshots_per_minute": snapshots_per_minute,
+                  "restores": number_of_restores}
+    LOGGER.info(f"Benchmark : snapshot and restore of {file_count} files of {file_size_mb} MiB")
+
+    if kubeinformer.get_informer("vs", runcontext.get().namespace) is None:
+        LOGGER.warning("Benchmark : volumesnapshot informer is not running , latencies include polling interval")
+
+    sc_name = csistoragefunc.get_pooled_storage_class(value_sc, created_objects)
+    pvc_name, _ = create_source_volume(test_data, sc_name, value_pvc, file_count, file_size_mb, parameters, created_objects)
+
+    vs_class_name = csistoragefunc.get_random_name("vsclass")
+    csistoragefunc.create_vs_class(vs_class_name, {"deletionPolicy": "Delete"}, created_objects)
+    csistoragefunc.check_vs_class(vs_class_name)
+
+    vs_name = csistoragefunc.get_random_name("vs")
+    vs_names = [f"{vs_name}-{num}" for num in range(0, number_of_snapshots)]
+    report.add("snapshot", parameters, take_snapshots(vs_names, vs_class_name, pvc_name, snapshots_per_minute, created_objects))
+
+    restored_pvc_names = [f"restored-pvc{vs_name[2:]}-{num}" for num in range(0, number_of_restores)]
+    report.add("snapshot", parameters, bulkpvcfunc.restore_pvcs(value_pvc, sc_name, restored_pvc_names, vs_names[-1],
+                                                                created_objects, number_of_restores))
+    csistoragefunc.clean_with_created_objects(created_objects)
@@ -182,6 +182,7 @@ def get_remote_data(data_passed):
             remote_sec_name = cluster["secrets"]
             remote_data["username"] = remote_data["remote_username"][remote_sec_name]
             remote_data["password"] = remote_data["remote_password"][remote_sec_name]
+            remote_data["cacert_path"] = remote_data["remote_cacert_path"].get(cluster.get("cacert"), "")
 
     remote_data["volDirBasePath"] = remote_data["r_volDirBasePath"]
     remote_data["parentFileset"] = remote_data["r_parentFileset"]
@@ -194,10 +195,31 @@ def get_remote_data(data_passed):
     remote_data["type_remote"] = {"username": data_passed["username"],
                                   "password": data_passed["password"],
                                   "port": data_passed["port"],
-                                  "guiHost": data_passed["guiHost"]}
+                                  "guiHost": data_passed["guiHost"],
+                                  "cacert_path": data_passed["cacert_path"]}
     return remote_data
 
 
+def get_default_kubeconfig():
+    """ return kubeconfig used when --kubeconfig is not given """
+    if 'TOKEN' in os.environ and 'APISERVER' in os.environ:
+        kubeconfig_value = f"ibm_spectrum_scale_csi/common_utils/{os.environ['APISERVER'].translate({ord(i): None for i in ':/'})}"
+        create_kubeconfig_file(os.environ["TOKEN"], os.environ["APISERVER"], kubeconfig_value)
+        return kubeconfig_value
+    if os.path.isfile('config/kubeconfig'):
+        return 'config/kubeconfig'
+    if os.path.isfile('/root/auth/kubeconfig'):
+        return '/root/auth/kubeconfig'
+    return '~/.kube/config'
+
+
+def get_default_clusterconfig():
+    """ return cr file used when --clusterconfig is not given """
+    if os.path.isfile('config/csiscaleoperators.csi.ibm.com_cr.yaml'):
+        return 'config/csiscaleoperators.csi.ibm.com_cr.yaml'
+    return '../../operator/config/samples/csiscaleoperators.csi.ibm.com_cr.yaml'
+
+
 def get_pytest_cmd_values(request):
     """
     Get pytest commmand line parameters and convert them to dict
@@ -207,22 +229,11 @@ def get_pytest_cmd_values(request):
 
     kubeconfig_value = request.config.option.kubeconfig
     if kubeconfig_value is None:
-        if 'TOKEN' in os.environ and 'APISERVER' in os.environ:
-            kubeconfig_value = f"ibm_spectrum_scale_csi/common_utils/{os.environ['APISERVER'].translate({ord(i): None for i in ':/'})}"
-            create_kubeconfig_file(os.environ['TOKEN'], os.environ['APISERVER'], kubeconfig_value) 
-        elif os.path.isfile('config/kubeconfig'):
-            kubeconfig_value = 'config/kubeconfig'
-        elif os.path.isfile('/root/auth/kubeconfig'):
-            kubeconfig_value = '/root/auth/kubeconfig'
-        else:
-            kubeconfig_value = '~/.kube/config'
+        kubeconfig_value = get_default_kubeconfig()
 
     clusterconfig_value = request.config.option.clusterconfig
     if clusterconfig_value is None:
-        if os.path.isfile('config/csiscaleoperators.csi.ibm.com_cr.yaml'):
-            clusterconfig_value = 'config/csiscaleoperators.csi.ibm.com_cr.yaml'
-        else:
-            clusterconfig_value = '../../operator/config/samples/csiscaleoperators.csi.ibm.com_cr.yaml'
+        clusterconfig_value = get_default_clusterconfig()
 
     test_namespace = request.config.option.testnamespace
 
@@ -0,0 +1,166 @@
+import os
+import copy
+import json
+import glob
+import socket
+import logging
+import threading
+from datetime import datetime
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+LOGGER = logging.getLogger()
+
+DEFAULT_LEDGER_DIR = "ledger"
+
+journal = None
+
+
+class Journal:
+    """
+    Append-only record of objects created and deleted during one test session
+
+    One JSON line is written and flushed per change , so the file is complete up to
+    the last change even if the session is killed. Replaying it gives the objects
+    which were created but not deleted (see read_journal).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "a")
+        self.write({"op": "start", "host": socket.gethostname(), "pid": os.getpid(),
+                    "time": datetime.now().isoformat()})
+
+    def write(self, entry):
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(json.dumps(entry) + "\n")
+            self.file.flush()
+
+    def record(self, op, category, name):
+        self.write({"op": op, "category": category, "name": name, **get_context()})
+
+    def close(self):
+        """ closes journal , journal is removed if every recorded object has been deleted """
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.close()
+            self.file = None
+        if len(read_journal(self.path)[1]) == 0:
+            os.remove(self.path)
+        else:
+            LOGGER.warning(f"Resource Ledger : objects left by this session are recorded in {self.path}")
+
+
+class LedgerList(list):
+    """ list of created objects of one category , appends and removes are recorded in the session journal """
+
+    def __init__(self, category, items=()):
+        super().__init__(items)
+        self.category = category
+
+    def append(self, name):
+        super().append(name)
+        if journal is not None:
+            journal.record("add", self.category, name)
+
+    def extend(self, names):
+        for name in names:
+            self.append(name)
+
+    def remove(self, name):
+        super().remove(name)
+        if journal is not None:
+            journal.record("remove", self.category, name)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+
+def get_ledger(categories):
+    """ return created objects dict with an empty LedgerList for every category """
+    return {category: LedgerList(category) for category in categories}
+
+
+def get_context():
+    """ return values recorded with every entry , namespace , GUI host and filesystem of running test """
+    context = runcontext.get()
+    test_data = context.test_data or {}
+    return {"namespace": context.namespace, "guiHost": test_data.get("guiHost"), "filesystem": test_data.get("primaryFs")}
+
+
+def start_journal(ledger_dir=DEFAULT_LEDGER_DIR):
+    """ starts journal of this session in ledger_dir """
+    global journal
+    os.makedirs(ledger_dir, exist_ok=True)
+    path = os.path.join(ledger_dir, f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.jsonl")
+    journal = Journal(path)
+    LOGGER.info(f"Resource Ledger : recording created objects in {path}")
+    return journal
+
+
+def close_journal():
+    global journal
+    if journal is not None:
+        journal.close()
+        journal = None
+
+
+def read_journal(path):
+    """
+    replays journal path
+
+    Returns:
+       (start entry of the session , list of entries of objects created and not deleted)
+    """
+    start = {}
+    live = {}
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # last line of a killed session may be incomplete
+                continue
+            if entry["op"] == "start":
+                start = entry
+                continue
+            key = (entry["category"], json.dumps(entry["name"]), entry.get("namespace"))
+            if entry["op"] == "add":
+                live[key] = entry
+            elif entry["op"] == "remove":
+                live.pop(key, None)
+    return start, list(live.values())
+
+
+def is_running(start):
+    """ return True if session which wrote start entry is still running on this host """
+    if start.get("host") != socket.gethostname() or "pid" not in start:
+        return False
+    if start["pid"] == os.getpid():
+        return True
+    try:
+        os.kill(start["pid"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def get_orphans(ledger_dir=DEFAULT_LEDGER_DIR):
+    """
+    return dict journal path -> entries of objects not deleted , for journals in ledger_dir
+    written by sessions which are no longer running
+    """
+    orphans = {}
+    for path in sorted(glob.glob(os.path.join(ledger_dir, "*.jsonl"))):
+        if journal is not None and path == journal.path:
+            continue
+        start, entries = read_journal(path)
+        if is_running(start):
+            LOGGER.info(f"Resource Ledger : skipping {path} , session is still running")
+            continue
+        orphans[path] = entries
+    return orphans
@@ -0,0 +1,135 @@
+import os
+import re
+import copy
+import threading
+import contextlib
+import multiprocessing
+import logging
+LOGGER = logging.getLogger()
+
+
+class TestContext:
+    """
+    Values library functions use for the running test
+
+    One context is active per thread (see activate) , so tests run in parallel by
+    pytest-parallel threads each see their own namespace , storage class parameters
+    and deadline. Functions read the active context with get().
+    """
+
+    # not a test class for pytest collection
+    __test__ = False
+
+    def __init__(self, namespace=None, nodeselector=None, keep_objects=False, test_data=None, dir_prefix=""):
+        self.namespace = namespace
+        self.nodeselector = nodeselector if nodeselector is not None else {}
+        self.keep_objects = keep_objects
+        # Spectrum Scale configuration (guiHost , primaryFs ...) used by fileset functions
+        self.test_data = test_data
+        # prepended to names of Spectrum Scale directories created by the test
+        self.dir_prefix = dir_prefix
+        # parameters of last storage class created or reused by the test
+        self.storage_class_parameters = None
+        self.test_name = None
+        self.test_deadline = None
+        self.timeouts = []
+        self.cleanup_running = False
+        # seconds spent in each phase (create , bind , pod , teardown) and phases entered , see timing_database.phase
+        self.phase_times = {}
+        self.phase_stack = []
+        self.phase_started = None
+
+    def copy(self, **kwargs):
+        """ return copy of context for a new test , values set during a test are not copied """
+        context = copy.copy(self)
+        context.storage_class_parameters = None
+        context.test_name = None
+        context.test_deadline = None
+        context.timeouts = []
+        context.cleanup_running = False
+        context.phase_times = {}
+        context.phase_stack = []
+        context.phase_started = None
+        for key, value in kwargs.items():
+            setattr(context, key, value)
+        return context
+
+
+local = threading.local()
+# context of threads which have not activated one , holds values set for the whole session
+default_context = TestContext()
+
+
+def get():
+    """ return context active in calling thread , session default context if none is active """
+    context = getattr(local, "context", None)
+    if context is None:
+        return default_context
+    return context
+
+
+@contextlib.contextmanager
+def activate(context):
+    """ makes context active in calling thread till end of with block """
+    previous = getattr(local, "context", None)
+    local.context = context
+    try:
+        yield context
+    finally:
+        local.context = previous
+
+
+def bind(function):
+    """ return function which runs with context of calling thread , for functions submitted to worker threads """
+    context = get()
+
+    def bound(*args, **kwargs):
+        with activate(context):
+            return function(*args, **kwargs)
+    return bound
+
+
+def get_number(name):
+    numbers = re.findall(r"\d+", name)
+    return numbers[0] if len(numbers) > 0 else "0"
+
+
+def get_process_id():
+    """
+    return id of pytest worker process , "" when tests are not run by worker processes
+    pytest-xdist workers are named by PYTEST_XDIST_WORKER , pytest-parallel workers by process number
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        return os.environ["PYTEST_XDIST_WORKER"].lower()
+    process = multiprocessing.current_process()
+    if process.name == "MainProcess":
+        return ""
+    return f"p{get_number(process.name)}"
+
+
+def get_worker_id():
+    """
+    return id of pytest worker running calling thread , "" when tests run sequentially
+    threads of pytest-parallel --tests-per-worker get their own id within worker process
+    """
+    worker_id = get_process_id()
+    thread = threading.current_thread()
+    if thread is not threading.main_thread():
+        worker_id = f"{worker_id}t{get_number(thread.name)}"
+    return worker_id
+
+
+def get_worker_namespace(namespace):
+    """ return namespace of calling worker , namespace itself when tests run sequentially """
+    worker_id = get_worker_id()
+    if worker_id == "":
+        return namespace
+    return f"{namespace[:62 - len(worker_id)]}-{worker_id}"
+
+
+def get_worker_dir_prefix():
+    """ return prefix of Spectrum Scale directories created by calling worker , "" when tests run sequentially """
+    worker_id = get_worker_id()
+    if worker_id == "":
+        return ""
+    return f"{worker_id}-"
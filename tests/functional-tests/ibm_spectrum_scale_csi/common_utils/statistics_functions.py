@@ -0,0 +1,34 @@
+import math
+
+
+def percentile(values, percent):
+    """
+    return percent-th percentile of values using nearest rank , None if values is empty
+
+    Args:
+        param1: values - list of numbers
+        param2: percent - percentile between 0 and 100
+
+    Returns:
+       value of values at rank ceil(percent/100 * len(values))
+    """
+    if len(values) == 0:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    """ return count , min , mean , p50 , p95 , p99 and max of values (seconds) rounded to milliseconds """
+    if len(values) == 0:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min": round(min(values), 3),
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(max(values), 3),
+    }
@@ -0,0 +1,154 @@
+import os
+import json
+import time
+import heapq
+import sqlite3
+import threading
+import contextlib
+import logging
+from datetime import datetime
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+import ibm_spectrum_scale_csi.common_utils.statistics_functions as statfunc
+LOGGER = logging.getLogger()
+
+DEFAULT_TIMING_DB = "test_timing.db"
+# number of latest runs of a test used to estimate its duration
+HISTORY_RUNS = 5
+
+
+@contextlib.contextmanager
+def phase(name):
+    """
+    charges time spent in with block (or decorated function) to phase name of current test
+    time of a phase entered inside it , like teardown of a failing create , is charged to that phase only
+    """
+    context = runcontext.get()
+    charge(context)
+    context.phase_stack.append(name)
+    try:
+        yield
+    finally:
+        charge(context)
+        context.phase_stack.pop()
+
+
+def charge(context):
+    """ adds time since last change of phase to phase currently entered in context """
+    now = time.monotonic()
+    if len(context.phase_stack) > 0 and context.phase_started is not None:
+        name = context.phase_stack[-1]
+        context.phase_times[name] = context.phase_times.get(name, 0) + now - context.phase_started
+    context.phase_started = now
+
+
+class TimingDatabase:
+    """
+    SQLite database of durations of earlier test runs , one row per run of a test
+
+    Every write opens its own connection , so worker threads and processes of a
+    parallel run can record into the same file.
+    """
+
+    def __init__(self, path=DEFAULT_TIMING_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        if os.path.dirname(path) != "":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.execute("""CREATE TABLE IF NOT EXISTS test_runs (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            nodeid TEXT NOT NULL,
+                            finished_at TEXT NOT NULL,
+                            outcome TEXT NOT NULL,
+                            duration REAL NOT NULL,
+                            phases TEXT NOT NULL)""")
+        self.execute("CREATE INDEX IF NOT EXISTS test_runs_nodeid ON test_runs (nodeid)")
+
+    def execute(self, statement, parameters=()):
+        with self.lock, contextlib.closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                return connection.execute(statement, parameters).fetchall()
+
+    def record(self, nodeid, outcome, duration, phases):
+        """ records run of test nodeid which took duration seconds , phases is dict phase -> seconds """
+        self.execute("INSERT INTO test_runs (nodeid, finished_at, outcome, duration, phases) VALUES (?, ?, ?, ?, ?)",
+                     (nodeid, datetime.now().isoformat(), outcome, round(duration, 3),
+                      json.dumps({name: round(seconds, 3) for name, seconds in phases.items()})))
+
+    def get_estimates(self):
+        """ return dict nodeid -> median duration of its latest HISTORY_RUNS runs which were not skipped """
+        history = {}
+        for nodeid, duration in self.execute("SELECT nodeid, duration FROM test_runs WHERE outcome != 'skipped' ORDER BY id DESC"):
+            durations = history.setdefault(nodeid, [])
+            if len(durations) < HISTORY_RUNS:
+                durations.append(duration)
+        return {nodeid: statfunc.percentile(durations, 50) for nodeid, durations in history.items()}
+
+
+def get_durations(nodeids, estimates):
+    """
+    return dict nodeid -> estimated duration , tests without history get the median of
+    known estimates (0 if there is no history at all)
+    """
+    default = statfunc.percentile(list(estimates.values()), 50) or 0
+    return {nodeid: estimates.get(nodeid, default) for nodeid in nodeids}
+
+
+def order_longest_first(items, durations):
+    """ return items sorted by durations (dict nodeid -> seconds) longest first , ties keep collection order """
+    return sorted(items, key=lambda item: -durations[item.nodeid])
+
+
+def assign_shards(items, durations, count):
+    """
+    splits items into count shards of about equal total duration , longest processing time first :
+    every item , longest first , goes to the shard with least total duration so far
+    (fewest items on equal duration , so tests without history are spread evenly)
+
+    Returns:
+       list of count lists of items , each ordered longest first
+    """
+    shards = [[] for _ in range(count)]
+    loads = [(0, 0, index) for index in range(count)]
+    for item in order_longest_first(items, durations):
+        load, number_of_items, index = heapq.heappop(loads)
+        shards[index].append(item)
+        heapq.heappush(loads, (load + durations[item.nodeid], number_of_items + 1, index))
+    return shards
+
+
+def parse_shard(value):
+    """ return (index , count) of shard value "K/N" , K from 1 to N """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"shard {value} is not of form K/N")
+    if count < 1 or not(1 <= index <= count):
+        raise ValueError(f"shard {value} is not of form K/N with 1 <= K <= N")
+    return index, count
+
+
+def schedule(items, path, order=True, shard=None):
+    """
+    reorders items longest first by durations recorded in timing database path and keeps
+    only items of shard "K/N" if shard is given
+
+    Returns:
+       (items to run , deselected items)
+    """
+    estimates = TimingDatabase(path).get_estimates() if os.path.exists(path) else {}
+    durations = get_durations([item.nodeid for item in items], estimates)
+    LOGGER.info(f"Test Schedule : durations of {len(set(durations) & set(estimates))} of {len(items)} tests known from {path}")
+    if shard is None:
+        return order_longest_first(items, durations) if order else list(items), []
+
+    index, count = parse_shard(shard)
+    shards = assign_shards(items, durations, count)
+    selected = shards[index - 1]
+    if not(order):
+        positions = {id(item): position for position, item in enumerate(items)}
+        selected = sorted(selected, key=lambda item: positions[id(item)])
+    selected_ids = {id(item) for item in selected}
+    deselected = [item for item in items if id(item) not in selected_ids]
+    LOGGER.info(f"Test Schedule : shard {index}/{count} runs {len(selected)} tests , estimated "
+                f"{round(sum(durations[item.nodeid] for item in selected), 1)} seconds")
+    return selected, deselected
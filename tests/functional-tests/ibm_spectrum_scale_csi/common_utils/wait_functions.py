@@ -0,0 +1,133 @@
+import time
+import random
+import logging
+from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+LOGGER = logging.getLogger()
+
+DEFAULT_INTERVAL = 1
+DEFAULT_MAX_INTERVAL = 30
+DEFAULT_BACKOFF = 2
+DEFAULT_JITTER = 0.2
+
+
+def set_test_deadline(seconds, name=None):
+    """
+    sets overall deadline for current test , every wait_until ends at this deadline
+    even if its own timeout is longer. seconds None or 0 removes the deadline.
+    """
+    context = runcontext.get()
+    context.test_deadline = time.monotonic() + float(seconds) if seconds else None
+    context.test_name = name
+
+
+def clear_test_deadline():
+    """ removes deadline of current test and returns timeouts recorded during it """
+    context = runcontext.get()
+    context.test_deadline, context.test_name = None, None
+    recorded = list(context.timeouts)
+    context.timeouts.clear()
+    return recorded
+
+
+def remaining_test_time():
+    """ return seconds left till test deadline , None if no deadline is set """
+    test_deadline = runcontext.get().test_deadline
+    if test_deadline is None:
+        return None
+    return test_deadline - time.monotonic()
+
+
+def wait_until(predicate, timeout, description, interval=DEFAULT_INTERVAL, max_interval=DEFAULT_MAX_INTERVAL,
+               backoff=DEFAULT_BACKOFF, jitter=DEFAULT_JITTER):
+    """
+    calls predicate until it returns a truthy value or timeout expires
+
+    first call is made immediately , wait between calls starts at interval and
+    is multiplied by backoff after every call up to max_interval , each wait is
+    randomized by +/- jitter fraction so parallel waiters do not poll in lockstep.
+    wait also ends at the test deadline set by set_test_deadline.
+    with timeout 0 predicate is called only once. on timeout diagnostics are
+    logged and recorded in timeouts , callers decide whether timeout is an error.
+
+    Args:
+        param1: predicate - function without arguments , polled until truthy
+        param2: timeout - maximum seconds to wait
+        param3: description - what is waited for , used in timeout diagnostics
+        param4: interval - first wait in seconds
+        param5: max_interval - maximum wait in seconds
+        param6: backoff - factor applied to wait after every call
+        param7: jitter - fraction of wait added or subtracted at random
+
+    Returns:
+       last value returned by predicate , falsy value means timeout
+
+    Raises:
+       exceptions raised by predicate are not handled
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    test_deadline = runcontext.get().test_deadline
+    if test_deadline is not None:
+        deadline = min(deadline, test_deadline)
+    wait_time = interval
+    attempts = 0
+    while True:
+        attempts += 1
+        result = predicate()
+        if result:
+            LOGGER.debug(f"Wait : {description} satisfied after {attempts} attempts in {time.monotonic() - start:.2f}s")
+            return result
+
+        if timeout <= 0:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        sleep_time = wait_time * (1 + random.uniform(-jitter, jitter))
+        time.sleep(max(min(sleep_time, remaining), 0))
+        wait_time = min(wait_time * backoff, max_interval)
+
+    record_timeout(description, timeout, start, attempts, test_deadline is not None and deadline == test_deadline, result)
+    return result
+
+
+def record_timeout(description, timeout, start, attempts, test_deadline_reached, result):
+    """ logs and records diagnostics of a wait which ended without its condition being met """
+    diagnostics = {
+        "description": description,
+        "test": runcontext.get().test_name,
+        "timeout": timeout,
+        "elapsed": round(time.monotonic() - start, 2),
+        "attempts": attempts,
+        "test_deadline_reached": test_deadline_reached,
+        "last_result": repr(result),
+    }
+    runcontext.get().timeouts.append(diagnostics)
+    LOGGER.info(f"Wait Timeout : {diagnostics}")
+
+
+def wait_for_deletion(read_object, timeout, object_description, max_interval=DEFAULT_MAX_INTERVAL):
+    """
+    waits till read_object raises ApiException (object is not found)
+
+    Args:
+        param1: read_object - function reading the object from kubernetes
+        param2: timeout - maximum seconds to wait
+        param3: object_description - kind and name of object , used in logs
+        param4: max_interval - maximum seconds between reads
+
+    Returns:
+       True , if object is deleted within timeout
+       False , otherwise
+    """
+    def object_deleted():
+        try:
+            api_response = read_object()
+            LOGGER.debug(str(api_response))
+            LOGGER.info(f'Still deleting {object_description}')
+            return False
+        except ApiException:
+            return True
+
+    return wait_until(object_deleted, timeout, f"{object_description} deletion", max_interval=max_interval)
@@ -0,0 +1,394 @@
+import time
+import logging
+import concurrent.futures
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.statistics_functions as statfunc
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+import ibm_spectrum_scale_csi.common_utils.timing_database as timingdb
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.kubernetes_apis.pod_exec_session as podexec
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
+LOGGER = logging.getLogger()
+
+DEFAULT_CONCURRENCY = 16
+BIND_TIMEOUT = 1200
+POD_RUNNING_TIMEOUT = 600
+POD_DELETE_TIMEOUT = 300
+PVC_DELETE_TIMEOUT = 600
+PV_DELETE_TIMEOUT = 1200
+QUOTA_UPDATE_TIMEOUT = 600
+
+
+def run_concurrently(function, arguments, concurrency):
+    """
+    calls function(argument) for every argument from up to concurrency threads
+
+    Returns:
+       dict argument -> (submission time , exception raised by function or None)
+    """
+    def timed_call(argument):
+        started_at = time.monotonic()
+        try:
+            function(argument)
+        except Exception as e:
+            return started_at, e
+        return started_at, None
+
+    workers = max(min(int(concurrency), len(arguments)), 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {argument: executor.submit(runcontext.bind(timed_call), argument) for argument in arguments}
+    return {argument: future.result() for argument, future in futures.items()}
+
+
+def check_failures(results, operation, created_objects):
+    """ logs exceptions in results of run_concurrently , cleans created objects and asserts if there is any """
+    failures = {argument: e for argument, (_, e) in results.items() if e is not None}
+    if len(failures) == 0:
+        return
+    for argument, e in failures.items():
+        LOGGER.error(f"{operation} of {argument} failed : {e}")
+    csistoragefunc.clean_with_created_objects(created_objects)
+    assert False
+
+
+@timingdb.phase("create")
+def create_pvcs(pvc_values, sc_name, pvc_names, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """
+    creates pvcs pvc_names from concurrency threads
+
+    Returns:
+       dict pvc name -> time (time.monotonic) at which its create request was sent
+    """
+    api_instance = client.CoreV1Api()
+    LOGGER.info(f'PVC Create : Creating {len(pvc_names)} pvcs with parameters {str(pvc_values)} and storageclass {sc_name} , {concurrency} at a time')
+    pvc_bodies = {pvc_name: csistoragefunc.get_pvc_body(pvc_values, sc_name, pvc_name) for pvc_name in pvc_names}
+    results = run_concurrently(lambda pvc_name: api_instance.create_namespaced_persistent_volume_claim(
+        namespace=runcontext.get().namespace, body=pvc_bodies[pvc_name]), pvc_names, concurrency)
+    created_objects["pvc"].extend(pvc_name for pvc_name in pvc_names if results[pvc_name][1] is None)
+    check_failures(results, "PVC Create", created_objects)
+    return {pvc_name: started_at for pvc_name, (started_at, _) in results.items()}
+
+
+def wait_for_phase(kind, list_function, names, phase, timeout):
+    """
+    waits till all objects names of kind are in phase , answered from the informer store of kind
+    (one watch for all objects) or from one listing per poll when no informer is running
+
+    Returns:
+       dict name -> time (time.monotonic) at which object was first seen in phase
+    """
+    return wait_for_condition(kind, list_function, names, lambda kube_object: kube_object.status.phase == phase,
+                              timeout, f"{len(names)} {kind} {phase}", namespace=runcontext.get().namespace)
+
+
+def wait_for_condition(kind, list_function, names, condition, timeout, description, **kwargs):
+    """
+    waits till condition(object) is True for all objects names of kind , see wait_for_phase
+
+    Returns:
+       dict name -> time (time.monotonic) at which condition was first seen True for object
+    """
+    pending = set(names)
+    reached_at = {}
+
+    def all_reached():
+        kube_objects = kubeinformer.list_objects(kind, list_function,
+                                                 lambda kube_object: kubeinformer.get_name(kube_object) in pending, **kwargs)
+        now = time.monotonic()
+        for kube_object in kube_objects:
+            if condition(kube_object):
+                reached_at[kubeinformer.get_name(kube_object)] = now
+                pending.discard(kubeinformer.get_name(kube_object))
+        return len(pending) == 0
+
+    kubeinformer.wait_until(kind, all_reached, timeout, description, namespace=kwargs.get("namespace"), max_wait=5)
+    return reached_at
+
+
+def create_pods(value_pod, pvc_names, pod_names, created_objects, image_name, concurrency=DEFAULT_CONCURRENCY):
+    """ creates pod pod_names[i] using pvc pvc_names[i] from concurrency threads """
+    api_instance = client.CoreV1Api()
+    LOGGER.info(f'POD Create : Creating {len(pod_names)} pods with {image_name} image , {concurrency} at a time')
+    pod_bodies = {pod_name: csistoragefunc.get_pod_body(value_pod, pvc_name, pod_name, image_name)
+                  for pvc_name, pod_name in zip(pvc_names, pod_names)}
+    results = run_concurrently(lambda pod_name: api_instance.create_namespaced_pod(
+        namespace=runcontext.get().namespace, body=pod_bodies[pod_name]), pod_names, concurrency)
+    created_objects["pod"].extend(pod_name for pod_name in pod_names if results[pod_name][1] is None)
+    check_failures(results, "POD Create", created_objects)
+    return {pod_name: started_at for pod_name, (started_at, _) in results.items()}
+
+
+@timingdb.phase("teardown")
+def delete_pods(pod_names, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """ deletes pods pod_names from concurrency threads and waits till all are deleted """
+    if runcontext.get().keep_objects:
+        return
+    api_instance = client.CoreV1Api()
+
+    def delete_pod(pod_name):
+        podexec.close_session(runcontext.get().namespace, pod_name)
+        try:
+            api_instance.delete_namespaced_pod(name=pod_name, namespace=runcontext.get().namespace, grace_period_seconds=0)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+
+    LOGGER.info(f'POD Delete : Deleting {len(pod_names)} pods , {concurrency} at a time')
+    results = run_concurrently(delete_pod, pod_names, concurrency)
+    for pod_name in pod_names:
+        if results[pod_name][1] is None:
+            created_objects["pod"].remove(pod_name)
+    check_failures(results, "POD Delete", created_objects)
+
+    deleted_at = wait_for_deletion("pod", api_instance.list_namespaced_pod, pod_names, POD_DELETE_TIMEOUT,
+                                   namespace=runcontext.get().namespace)
+    check_all_completed(pod_names, deleted_at, "POD Delete", created_objects)
+    LOGGER.info(f"POD Delete : {len(pod_names)} pods have been deleted")
+
+
+def wait_for_deletion(kind, list_function, names, timeout, **kwargs):
+    """
+    waits till all objects names of kind are deleted , answered from the informer store of kind
+    (one watch for all objects) or from one listing per poll when no informer is running
+
+    Returns:
+       dict name -> time (time.monotonic) at which object was first seen deleted
+    """
+    remaining = set(names)
+    deleted_at = {}
+
+    def all_deleted():
+        existing = {kubeinformer.get_name(kube_object) for kube_object in kubeinformer.list_objects(
+            kind, list_function, lambda kube_object: kubeinformer.get_name(kube_object) in remaining, **kwargs)}
+        now = time.monotonic()
+        for name in remaining - existing:
+            deleted_at[name] = now
+        remaining.intersection_update(existing)
+        return len(remaining) == 0
+
+    kubeinformer.wait_until(kind, all_deleted, timeout, f"{len(names)} {kind} deletion",
+                            namespace=kwargs.get("namespace"), max_wait=5)
+    return deleted_at
+
+
+def get_volume_names(pvc_names):
+    """ return dict pvc name -> name of pv bound to it , for pvcs of pvc_names which are bound """
+    pvcs = kubeinformer.list_objects("pvc", client.CoreV1Api().list_namespaced_persistent_volume_claim,
+                                     lambda pvc: pvc.metadata.name in pvc_names, namespace=runcontext.get().namespace)
+    return {pvc.metadata.name: pvc.spec.volume_name for pvc in pvcs if pvc.spec.volume_name}
+
+
+@timingdb.phase("teardown")
+def delete_pvcs(pvc_names, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """
+    deletes pvcs pvc_names from concurrency threads and waits till pvcs and their pvs
+    (with fileset or directory , reclaimPolicy Delete) are deleted
+
+    Returns:
+       (dict pvc name -> time its delete request was sent , dict pvc name -> time pvc was first seen deleted ,
+        dict pvc name -> time its pv was first seen deleted) , times are time.monotonic() , None if objects are kept
+    """
+    if runcontext.get().keep_objects:
+        return None
+    api_instance = client.CoreV1Api()
+    volume_names = get_volume_names(pvc_names)
+
+    def delete_pvc(pvc_name):
+        try:
+            api_instance.delete_namespaced_persistent_volume_claim(name=pvc_name, namespace=runcontext.get().namespace)
+        except ApiException as e:
+            if e.status != 404:
+                raise
+
+    LOGGER.info(f'PVC Delete : Deleting {len(pvc_names)} pvcs , {concurrency} at a time')
+    results = run_concurrently(delete_pvc, pvc_names, concurrency)
+    for pvc_name in pvc_names:
+        if results[pvc_name][1] is None:
+            created_objects["pvc"].remove(pvc_name)
+    check_failures(results, "PVC Delete", created_objects)
+
+    pvc_deleted_at = wait_for_deletion("pvc", api_instance.list_namespaced_persistent_volume_claim, pvc_names,
+                                       PVC_DELETE_TIMEOUT, namespace=runcontext.get().namespace)
+    check_all_completed(pvc_names, pvc_deleted_at, "PVC Delete", created_objects)
+    pv_deleted_at = wait_for_deletion("pv", api_instance.list_persistent_volume, list(volume_names.values()), PV_DELETE_TIMEOUT)
+    check_all_completed(list(volume_names.values()), pv_deleted_at, "PV Delete", created_objects)
+    LOGGER.info(f"PVC Delete : {len(pvc_names)} pvcs and their pvs have been deleted")
+    requested_at = {pvc_name: started_at for pvc_name, (started_at, _) in results.items()}
+    pv_deleted_at = {pvc_name: pv_deleted_at[pv_name] for pvc_name, pv_name in volume_names.items()}
+    return requested_at, pvc_deleted_at, pv_deleted_at
+
+
+def get_report(operation, started_at, finished_at):
+    """
+    return throughput and latency summary for objects which finished
+    started_at and finished_at are dicts name -> time.monotonic()
+    """
+    latencies = [finished_at[name] - started_at[name] for name in finished_at]
+    report = {"operation": operation, "submitted": len(started_at), "completed": len(finished_at)}
+    if len(finished_at) > 0:
+        elapsed = max(finished_at.values()) - min(started_at.values())
+        report["elapsed"] = round(elapsed, 3)
+        report["per_second"] = round(len(finished_at) / elapsed, 3) if elapsed > 0 else None
+    report["latency"] = statfunc.summarize(latencies)
+    LOGGER.info(f"Bulk Report : {report}")
+    return report
+
+
+def check_all_completed(names, completed_at, description, created_objects):
+    """ asserts if any of names is missing in completed_at """
+    missing = sorted(set(names) - set(completed_at))
+    if len(missing) == 0:
+        return
+    LOGGER.error(f"{description} : {len(missing)} of {len(names)} did not complete in time : {missing}")
+    csistoragefunc.clean_with_created_objects(created_objects)
+    assert False
+
+
+def provision_pvcs(pvc_values, sc_name, pvc_names, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """
+    creates pvcs pvc_names concurrently and waits till all of them are Bound
+
+    Returns:
+       report with PVC/s and bind latency percentiles , see get_report
+    """
+    created_at = create_pvcs(pvc_values, sc_name, pvc_names, created_objects, concurrency)
+    with timingdb.phase("bind"):
+        bound_at = wait_for_phase("pvc", client.CoreV1Api().list_namespaced_persistent_volume_claim, pvc_names,
+                                  "Bound", BIND_TIMEOUT)
+    report = get_report("pvc bind", created_at, bound_at)
+    check_all_completed(pvc_names, bound_at, "PVC Check", created_objects)
+    LOGGER.info(f"PVC Check : {len(pvc_names)} PVCs are BOUND succesfully")
+    return report
+
+
+@timingdb.phase("create")
+def create_pvcs_from_data_source(pvc_values, sc_name, pvc_names, data_source, category, created_objects,
+                                 concurrency=DEFAULT_CONCURRENCY):
+    """
+    creates pvcs pvc_names from data_source (volume snapshot or pvc , see csi_storage_function.get_pvc_body)
+    from concurrency threads , created pvcs are added to created_objects[category]
+
+    Returns:
+       dict pvc name -> time (time.monotonic) at which its create request was sent
+    """
+    api_instance = client.CoreV1Api()
+    LOGGER.info(f'PVC Create from {data_source.kind} : Creating {len(pvc_names)} pvcs from {data_source.name} '
+                f'with storageclass {sc_name} , {concurrency} at a time')
+    pvc_bodies = {pvc_name: csistoragefunc.get_pvc_body(pvc_values, sc_name, pvc_name, data_source=data_source)
+                  for pvc_name in pvc_names}
+    results = run_concurrently(lambda pvc_name: api_instance.create_namespaced_persistent_volume_claim(
+        namespace=runcontext.get().namespace, body=pvc_bodies[pvc_name]), pvc_names, concurrency)
+    created_objects[category].extend(pvc_name for pvc_name in pvc_names if results[pvc_name][1] is None)
+    check_failures(results, f"PVC Create from {data_source.kind}", created_objects)
+    return {pvc_name: started_at for pvc_name, (started_at, _) in results.items()}
+
+
+def bind_pvcs_from_data_source(operation, pvc_values, sc_name, pvc_names, data_source, category, created_objects,
+                               concurrency=DEFAULT_CONCURRENCY):
+    """
+    creates pvcs pvc_names from data_source concurrently and waits till all of them are Bound
+
+    Returns:
+       report operation with PVC/s and create-to-Bound latency percentiles , see get_report
+    """
+    created_at = create_pvcs_from_data_source(pvc_values, sc_name, pvc_names, data_source, category, created_objects, concurrency)
+    with timingdb.phase("bind"):
+        bound_at = wait_for_phase("pvc", client.CoreV1Api().list_namespaced_persistent_volume_claim, pvc_names,
+                                  "Bound", BIND_TIMEOUT)
+    report = get_report(operation, created_at, bound_at)
+    check_all_completed(pvc_names, bound_at, "PVC Check", created_objects)
+    LOGGER.info(f"PVC Check : {len(pvc_names)} PVCs created from {data_source.name} are BOUND succesfully")
+    return report
+
+
+def restore_pvcs(pvc_values, sc_name, pvc_names, snap_name, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """ creates pvcs pvc_names from volume snapshot snap_name concurrently , see bind_pvcs_from_data_source """
+    return bind_pvcs_from_data_source("restore bind", pvc_values, sc_name, pvc_names,
+                                      csistoragefunc.get_snapshot_data_source(snap_name), "restore_pvc",
+                                      created_objects, concurrency)
+
+
+def clone_pvcs(pvc_values, sc_name, pvc_names, from_pvc_name, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """ creates pvcs pvc_names as clones of pvc from_pvc_name concurrently , see bind_pvcs_from_data_source """
+    return bind_pvcs_from_data_source("clone bind", pvc_values, sc_name, pvc_names,
+                                      csistoragefunc.get_clone_data_source(from_pvc_name), "clone_pvc",
+                                      created_objects, concurrency)
+
+
+def patch_pvcs_storage(pvc_names, storage, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """
+    patches requested storage of pvcs pvc_names to storage from concurrency threads
+
+    Returns:
+       dict pvc name -> time (time.monotonic) at which its patch request was sent
+    """
+    api_instance = client.CoreV1Api()
+    body = {"spec": {"resources": {"requests": {"storage": storage}}}}
+    LOGGER.info(f'PVC Patch : Expanding {len(pvc_names)} pvcs to {storage} , {concurrency} at a time')
+    results = run_concurrently(lambda pvc_name: api_instance.patch_namespaced_persistent_volume_claim(
+        name=pvc_name, namespace=runcontext.get().namespace, body=body), pvc_names, concurrency)
+    check_failures(results, "PVC Patch", created_objects)
+    return {pvc_name: started_at for pvc_name, (started_at, _) in results.items()}
+
+
+def get_fileset_names(pvc_names):
+    """ return dict pvc name -> name of fileset of its volume , for pvcs bound to a volume """
+    volume_names = get_volume_names(pvc_names)
+    volume_handles = {pv.metadata.name: pv.spec.csi.volume_handle for pv in kubeinformer.list_objects(
+        "pv", client.CoreV1Api().list_persistent_volume, lambda pv: pv.metadata.name in volume_names.values())}
+    return {pvc_name: csistoragefunc.get_filesetname_from_volume_handle(volume_handles[volume_name])
+            for pvc_name, volume_name in volume_names.items() if volume_name in volume_handles}
+
+
+def expand_pvcs(pvc_names, storage, created_objects, concurrency=DEFAULT_CONCURRENCY):
+    """
+    expands pvcs pvc_names to storage concurrently and waits till status.capacity of all of them
+    reaches storage with no Resizing / FileSystemResizePending condition (see csi_storage_function.is_pvc_resized)
+    and till quota of their filesets is at least storage
+
+    driver sets fileset quota during controller expansion , before pvcs are seen resized , so quotas are
+    polled from a worker thread started right after the patch requests , in parallel with the resize wait ,
+    quotas of all filesets are fetched with one listing per poll (see fileset_functions.wait_for_fileset_quotas)
+
+    Returns:
+       (report with PVC/s and patch-to-resized latency percentiles ,
+        report with patch-to-quota-seen latency percentiles , see get_report)
+    """
+    fileset_names = get_fileset_names(pvc_names)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        patched_at = patch_pvcs_storage(pvc_names, storage, created_objects, concurrency)
+        quota_future = executor.submit(runcontext.bind(filesetfunc.wait_for_fileset_quotas),
+                                       {fileset_name: storage for fileset_name in fileset_names.values()}, QUOTA_UPDATE_TIMEOUT)
+        resized_at = wait_for_condition("pvc", client.CoreV1Api().list_namespaced_persistent_volume_claim, pvc_names,
+                                        lambda pvc: csistoragefunc.is_pvc_resized(pvc, storage), csistoragefunc.RESIZE_TIMEOUT,
+                                        f"{len(pvc_names)} pvc resized to {storage}", namespace=runcontext.get().namespace)
+        updated_at = quota_future.result()
+    quota_at = {pvc_name: updated_at[fileset_name] for pvc_name, fileset_name in fileset_names.items() if fileset_name in updated_at}
+
+    resize_report = get_report("resize", patched_at, resized_at)
+    quota_report = get_report("quota update", patched_at, quota_at)
+    check_all_completed(pvc_names, resized_at, "PVC Resize Check", created_objects)
+    LOGGER.info(f"PVC Check : {len(pvc_names)} PVCs are resized to {storage} succesfully")
+    check_all_completed(pvc_names, quota_at, "Fileset Quota Check", created_objects)
+    LOGGER.info(f"PVC Check : quota of filesets of {len(pvc_names)} PVCs is at least {storage}")
+    return resize_report, quota_report
+
+
+@timingdb.phase("pod")
+def start_pods(value_pod, pvc_names, pod_names, created_objects, image_name, concurrency=DEFAULT_CONCURRENCY):
+    """
+    creates one pod per pvc concurrently , waits till all of them are Running and checks
+    a file can be created in each of them
+
+    Returns:
+       report with pods/s and start latency percentiles , see get_report
+    """
+    created_at = create_pods(value_pod, pvc_names, pod_names, created_objects, image_name, concurrency)
+    running_at = wait_for_phase("pod", client.CoreV1Api().list_namespaced_pod, pod_names, "Running", POD_RUNNING_TIMEOUT)
+    report = get_report("pod start", created_at, running_at)
+    check_all_completed(pod_names, running_at, "POD Check", created_objects)
+    for pod_name in pod_names:
+        csistoragefunc.check_pod_execution(value_pod, pod_name, created_objects)
+    return report
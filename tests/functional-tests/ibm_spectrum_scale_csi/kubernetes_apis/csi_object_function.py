@@ -1,4 +1,3 @@
-import time
 import logging
 import base64
 import string
@@ -6,6 +5,7 @@ import random
 import urllib3
 from kubernetes import client
 from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 LOGGER = logging.getLogger()
 
@@ -98,9 +98,9 @@ def check_scaleoperatorobject_is_deleted():
     check  csiscaleoperator deleted or not
     if csiscaleoperator not deleted in 300 seconds , asserts
     """
-    count = 30
     list_co_api_instance = client.CustomObjectsApi()
-    while (count > 0):
+
+    def scaleoperatorobject_deleted():
         try:
             list_co_api_response = list_co_api_instance.get_namespaced_custom_object(group="csi.ibm.com",
                                                                                      version="v1",
@@ -110,11 +110,13 @@ def check_scaleoperatorobject_is_deleted():
                                                                                      )
             LOGGER.info("Waiting for custom object deletion")
             LOGGER.debug(str(list_co_api_response))
-            count = count-1
-            time.sleep(20)
+            return False
         except ApiException:
-            LOGGER.info("SpectrumScale CSI custom object has been deleted")
-            return
+            return True
+
+    if waitfunc.wait_until(scaleoperatorobject_deleted, 600, "custom object ibm-spectrum-scale-csi deletion", max_interval=20):
+        LOGGER.info("SpectrumScale CSI custom object has been deleted")
+        return
 
     LOGGER.error("SpectrumScale CSI custom object is not deleted")
     assert False
@@ -171,22 +173,21 @@ def check_scaleoperatorobject_statefulsets_state(stateful_name):
 
     """
     read_statefulsets_api_instance = client.AppsV1Api()
-    num = 0
-    while (num < 30):
+
+    def statefulset_ready():
         try:
             read_statefulsets_api_response = read_statefulsets_api_instance.read_namespaced_stateful_set(
                 name=stateful_name, namespace=namespace_value, pretty=True)
             LOGGER.debug(read_statefulsets_api_response)
             ready_replicas = read_statefulsets_api_response.status.ready_replicas
             replicas = read_statefulsets_api_response.status.replicas
-            if ready_replicas == replicas:
-                LOGGER.info(f"CSI driver statefulset {stateful_name} is up")
-                return
-            num += 1
-            time.sleep(10)
+            return ready_replicas == replicas
         except ApiException:
-            num += 1
-            time.sleep(10)
+            return False
+
+    if waitfunc.wait_until(statefulset_ready, 300, f"statefulset {stateful_name} ready", max_interval=10):
+        LOGGER.info(f"CSI driver statefulset {stateful_name} is up")
+        return
     LOGGER.info(f"CSI driver statefulset {stateful_name} does not exist")
     assert False
 
@@ -211,8 +212,9 @@ def check_scaleoperatorobject_daemonsets_state(csiscaleoperator_name="ibm-spectr
 
     """
     read_daemonsets_api_instance = client.AppsV1Api()
-    num = 0
-    while (num < 15):
+    daemonset_status = {"desired_number_scheduled": None}
+
+    def daemonset_running():
         try:
             read_daemonsets_api_response = read_daemonsets_api_instance.read_namespaced_daemon_set(
                 name=csiscaleoperator_name, namespace=namespace_value, pretty=True)
@@ -220,21 +222,21 @@ def check_scaleoperatorobject_daemonsets_state(csiscaleoperator_name="ibm-spectr
             current_number_scheduled = read_daemonsets_api_response.status.current_number_scheduled
             desired_number_scheduled = read_daemonsets_api_response.status.desired_number_scheduled
             number_available = read_daemonsets_api_response.status.number_available
+            daemonset_status["desired_number_scheduled"] = desired_number_scheduled
             if number_available == current_number_scheduled == desired_number_scheduled:
-                LOGGER.info("CSI driver daemonset ibm-spectrum-scale-csi's pods are Running")
-                return True, desired_number_scheduled
-
-            time.sleep(20)
-            num += 1
-            LOGGER.info("waiting for daemonsets")
+                return True
         except ApiException:
-            time.sleep(20)
-            num += 1
-            LOGGER.info("waiting for daemonsets")
+            pass
+        LOGGER.info("waiting for daemonsets")
+        return False
+
+    if waitfunc.wait_until(daemonset_running, 300, f"daemonset {csiscaleoperator_name} pods running", max_interval=20):
+        LOGGER.info("CSI driver daemonset ibm-spectrum-scale-csi's pods are Running")
+        return True, daemonset_status["desired_number_scheduled"]
 
     LOGGER.error(
         "Expected CSI driver daemonset ibm-spectrum-scale-csi's pods are not Running")
-    return False, desired_number_scheduled
+    return False, daemonset_status["desired_number_scheduled"]
 
     
 def get_scaleoperatorobject_values(namespace_value, csiscaleoperator_name="ibm-spectrum-scale-csi"):
@@ -2,6 +2,10 @@ import time
 import re
 import logging
 import copy
+import json
+import hashlib
+import threading
+import concurrent.futures
 import urllib3
 from datetime import datetime, timezone
 from kubernetes import client
@@ -9,23 +13,67 @@ from kubernetes.client.rest import ApiException
 from kubernetes.stream import stream
 import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
 import ibm_spectrum_scale_csi.common_utils.namegenerator as namegenerator
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+import ibm_spectrum_scale_csi.common_utils.timing_database as timingdb
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.kubernetes_apis.pod_timeline as podtimeline
+import ibm_spectrum_scale_csi.kubernetes_apis.pod_exec_session as podexec
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 LOGGER = logging.getLogger()
 
+# categories of created_objects and categories which must be deleted before them
+CLEANUP_DEPENDENCIES = {
+    "ds": [],
+    "restore_pod": [],
+    "clone_pod": [],
+    "pod": [],
+    "restore_pvc": ["ds", "restore_pod"],
+    "clone_pvc": ["ds", "clone_pod"],
+    "vs": ["restore_pvc"],
+    "vscontent": ["vs"],
+    "scalesnapshot": ["vscontent"],
+    "vsclass": ["vs", "vscontent"],
+    "pvc": ["ds", "pod", "restore_pvc", "clone_pvc", "vs", "vscontent", "scalesnapshot"],
+    "pv": ["pvc", "restore_pvc", "clone_pvc"],
+    "dir": ["pv"],
+    "sc": ["pvc", "restore_pvc", "clone_pvc", "pv"],
+    "cg": ["pvc", "restore_pvc", "clone_pvc", "pv", "dir", "sc"],
+}
+# conditions of pvc while it is being resized , resize is complete when none of them is True
+RESIZE_CONDITIONS = ["Resizing", "FileSystemResizePending"]
+# seconds to wait for status.capacity of an expanded pvc to reach requested storage
+RESIZE_TIMEOUT = 300
+# workloads of run_io_probe and their default size , block sizes and number of parallel random workers
+IO_PROBE_WORKLOADS = ["seq_write", "seq_read", "random_write", "random_read"]
+IO_PROBE_DEFAULTS = {"size_mb": 256, "seq_block_size_kb": 1024, "random_block_size_kb": 4, "random_ops": 2000, "depth": 4}
+IO_PROBE_TIMEOUT = 1800
+# maximum number of objects deleted at the same time by clean_with_created_objects
+CLEANUP_WORKERS = 16
+
+SC_PARAMETERS = ["volBackendFs", "clusterId", "volDirBasePath", "uid", "gid",
+                 "filesetType", "parentFileset", "inodeLimit", "nodeClass", "permissions",
+                 "version", "compression", "tier", "consistencyGroup"]
+SC_OPTIONS = ["allow_volume_expansion", "allowed_topologies", "mount_options", "volume_binding_mode"]
+
+# storage classes shared by all tests of the session , fingerprint of values -> storage class name
+storage_class_pool = {}
+storage_class_pool_lock = threading.Lock()
+pooled_objects = resourceledger.get_ledger(CLEANUP_DEPENDENCIES)
+
 
 def set_test_namespace_value(namespace_name=None):
-    """ sets the test namespace global for use in later functions"""
-    global namespace_value
-    namespace_value = namespace_name
+    """ sets the test namespace in current test context for use in later functions"""
+    runcontext.get().namespace = namespace_name
 
 
 def set_test_nodeselector_value(plugin_node_selector):
-    """ sets the nodeselector global for use in create_pod functions"""
-    global nodeselector
+    """ sets the nodeselector in current test context for use in create_pod functions"""
     node_selector_labels = {}
     for label_val in plugin_node_selector:
         node_selector_labels[label_val["key"]] = label_val["value"]
-    nodeselector = node_selector_labels
+    runcontext.get().nodeselector = node_selector_labels
 
 
 def get_random_name(type_of):
@@ -33,33 +81,79 @@ def get_random_name(type_of):
     return f"{type_of}-{namegenerator.name_generator()}"
 
 
-def create_storage_class(values, sc_name, created_objects):
+def get_storage_class_parameters(values):
+    """ return storage class parameters from values , random consistencyGroup is added to values for version 2 """
+    if "version" in values and values["version"] == "2" and "consistencyGroup" not in values:
+        values["consistencyGroup"] = get_random_name("cg")
+    return {sc_parameter: values[sc_parameter] for sc_parameter in SC_PARAMETERS if sc_parameter in values}
+
+
+def get_storage_class_fingerprint(values):
+    """ return hash of storage class parameters and options in values , same for equal storage classes """
+    sc_values = {key: values[key] for key in SC_PARAMETERS + SC_OPTIONS if key in values}
+    return hashlib.sha1(json.dumps(sc_values, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def get_pooled_storage_class(values, created_objects):
+    """
+    return name of a storage class with values , created once and shared by all tests of the session
+    storage classes with version 2 get a random consistencyGroup , they are created for calling test only
+
+    Args:
+        param1: values - storage class parameters
+        param2: created_objects - objects of calling test , used for per test storage class and cleanup
+    """
+    if "version" in values and values["version"] == "2":
+        sc_name = get_random_name("sc")
+        create_storage_class(values, sc_name, created_objects)
+        check_storage_class(sc_name)
+        return sc_name
+
+    fingerprint = get_storage_class_fingerprint(values)
+    with storage_class_pool_lock:
+        sc_name = storage_class_pool.get(fingerprint)
+        if sc_name is None:
+            # worker processes delete their pool at end of their session , so each one has its own
+            process_id = runcontext.get_process_id()
+            sc_name = f"sc-pool-{process_id}-{fingerprint}" if process_id else f"sc-pool-{fingerprint}"
+            create_storage_class(values, sc_name, created_objects, pooled=True)
+            check_storage_class(sc_name)
+            storage_class_pool[fingerprint] = sc_name
+            return sc_name
+    storage_class_parameters = get_storage_class_parameters(values)
+    runcontext.get().storage_class_parameters = storage_class_parameters
+    LOGGER.info(f'SC Create : reusing storageclass {sc_name} with parameters {str(storage_class_parameters)}')
+    return sc_name
+
+
+def delete_pooled_storage_classes():
+    """ deletes storage classes of the session pool """
+    with storage_class_pool_lock:
+        storage_class_pool.clear()
+        if len(pooled_objects["sc"]) > 0:
+            clean_with_created_objects(pooled_objects)
+
+
+@timingdb.phase("create")
+def create_storage_class(values, sc_name, created_objects, pooled=False):
     """
     creates storage class
     Args:
         param1: values - storage class parameters
         param2: config_value - configuration file
         param3: sc_name - name of storage class to be created
+        param4: pooled - storage class belongs to session pool (see get_pooled_storage_class) ,
+                         it is not deleted with created_objects and existing one is reused
     Returns:
         None
     Raises:
         Raises an exception on kubernetes client api failure and asserts
     """
-    global storage_class_parameters
     api_instance = client.StorageV1Api()
     storage_class_metadata = client.V1ObjectMeta(name=sc_name)
 
-    storage_class_parameters = {}
-    list_parameters = ["volBackendFs", "clusterId", "volDirBasePath", "uid", "gid", 
-                       "filesetType", "parentFileset", "inodeLimit", "nodeClass", "permissions",
-                       "version", "compression", "tier", "consistencyGroup"]
-    
-    if "version" in values and values["version"] == "2" and "consistencyGroup" not in values:
-        values["consistencyGroup"] = get_random_name("cg")
-
-    for sc_parameter in list_parameters:
-        if sc_parameter in values:
-            storage_class_parameters[sc_parameter] = values[sc_parameter]
+    storage_class_parameters = get_storage_class_parameters(values)
+    runcontext.get().storage_class_parameters = storage_class_parameters
 
     additional_sc_options = {'allow_volume_expansion': None, 'allowed_topologies': None,
                              'mount_options': None, 'volume_binding_mode': None}
@@ -85,8 +179,15 @@ def create_storage_class(values, sc_name, created_objects):
         api_response = api_instance.create_storage_class(
             body=storage_class_body, pretty=True)
         LOGGER.debug(str(api_response))
-        created_objects["sc"].append(sc_name)
+        if pooled:
+            pooled_objects["sc"].append(sc_name)
+        else:
+            created_objects["sc"].append(sc_name)
     except ApiException as e:
+        if pooled and e.status == 409:
+            LOGGER.info(f'SC Create : storageclass {sc_name} with same parameters already exists , reusing it')
+            pooled_objects["sc"].append(sc_name)
+            return
         LOGGER.error(
             f"Exception when calling StorageV1Api->create_storage_class: {e}")
         clean_with_created_objects(created_objects)
@@ -208,6 +309,32 @@ def check_pv(pv_name):
         return False
 
 
+def get_pvc_body(pvc_values, sc_name, pvc_name, pv_name=None, data_source=None):
+    """
+    return V1PersistentVolumeClaim for pvc_name , see create_pvc for arguments
+    data_source is V1TypedLocalObjectReference of snapshot or pvc to restore or clone from
+    """
+    pvc_metadata = client.V1ObjectMeta(name=pvc_name)
+    pvc_resources = client.V1ResourceRequirements(
+        requests={"storage": pvc_values["storage"]})
+
+    pvc_spec = client.V1PersistentVolumeClaimSpec(
+        access_modes=[pvc_values["access_modes"]],
+        resources=pvc_resources,
+        storage_class_name=sc_name,
+        volume_name=pv_name,
+        data_source=data_source
+    )
+
+    return client.V1PersistentVolumeClaim(
+        api_version="v1",
+        kind="PersistentVolumeClaim",
+        metadata=pvc_metadata,
+        spec=pvc_spec
+    )
+
+
+@timingdb.phase("create")
 def create_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
     """
     creates persistent volume claim
@@ -227,24 +354,9 @@ def create_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
         Raises an exception on kubernetes client api failure and asserts
 
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    pvc_metadata = client.V1ObjectMeta(name=pvc_name)
-    pvc_resources = client.V1ResourceRequirements(
-        requests={"storage": pvc_values["storage"]})
-
-    pvc_spec = client.V1PersistentVolumeClaimSpec(
-        access_modes=[pvc_values["access_modes"]],
-        resources=pvc_resources,
-        storage_class_name=sc_name,
-        volume_name=pv_name
-    )
-
-    pvc_body = client.V1PersistentVolumeClaim(
-        api_version="v1",
-        kind="PersistentVolumeClaim",
-        metadata=pvc_metadata,
-        spec=pvc_spec
-    )
+    pvc_body = get_pvc_body(pvc_values, sc_name, pvc_name, pv_name)
 
     try:
         LOGGER.info(
@@ -261,6 +373,16 @@ def create_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
         assert False
 
 
+def get_snapshot_data_source(snap_name):
+    """ return data source of a pvc restored from volume snapshot snap_name """
+    return client.V1TypedLocalObjectReference(
+        api_group="snapshot.storage.k8s.io",
+        kind="VolumeSnapshot",
+        name=snap_name
+    )
+
+
+@timingdb.phase("create")
 def create_pvc_from_snapshot(pvc_values, sc_name, pvc_name, snap_name, created_objects):
     """
     creates persistent volume claim from snapshot
@@ -278,29 +400,9 @@ def create_pvc_from_snapshot(pvc_values, sc_name, pvc_name, snap_name, created_o
         Raises an exception on kubernetes client api failure and asserts
 
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    pvc_metadata = client.V1ObjectMeta(name=pvc_name)
-    pvc_resources = client.V1ResourceRequirements(
-        requests={"storage": pvc_values["storage"]})
-    pvc_data_source = client.V1TypedLocalObjectReference(
-        api_group="snapshot.storage.k8s.io",
-        kind="VolumeSnapshot",
-        name=snap_name
-    )
-
-    pvc_spec = client.V1PersistentVolumeClaimSpec(
-        access_modes=[pvc_values["access_modes"]],
-        resources=pvc_resources,
-        storage_class_name=sc_name,
-        data_source=pvc_data_source
-    )
-
-    pvc_body = client.V1PersistentVolumeClaim(
-        api_version="v1",
-        kind="PersistentVolumeClaim",
-        metadata=pvc_metadata,
-        spec=pvc_spec
-    )
+    pvc_body = get_pvc_body(pvc_values, sc_name, pvc_name, data_source=get_snapshot_data_source(snap_name))
 
     try:
         LOGGER.info(
@@ -317,29 +419,19 @@ def create_pvc_from_snapshot(pvc_values, sc_name, pvc_name, snap_name, created_o
         assert False
 
 
-def create_clone_pvc(pvc_values, sc_name, pvc_name, from_pvc_name, created_objects):
-    api_instance = client.CoreV1Api()
-    pvc_metadata = client.V1ObjectMeta(name=pvc_name)
-    pvc_resources = client.V1ResourceRequirements(
-        requests={"storage": pvc_values["storage"]})
-    pvc_data_source = client.V1TypedLocalObjectReference(
+def get_clone_data_source(from_pvc_name):
+    """ return data source of a pvc cloned from pvc from_pvc_name """
+    return client.V1TypedLocalObjectReference(
         kind="PersistentVolumeClaim",
         name=from_pvc_name
     )
 
-    pvc_spec = client.V1PersistentVolumeClaimSpec(
-        access_modes=[pvc_values["access_modes"]],
-        resources=pvc_resources,
-        storage_class_name=sc_name,
-        data_source=pvc_data_source
-    )
 
-    pvc_body = client.V1PersistentVolumeClaim(
-        api_version="v1",
-        kind="PersistentVolumeClaim",
-        metadata=pvc_metadata,
-        spec=pvc_spec
-    )
+@timingdb.phase("create")
+def create_clone_pvc(pvc_values, sc_name, pvc_name, from_pvc_name, created_objects):
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+    pvc_body = get_pvc_body(pvc_values, sc_name, pvc_name, data_source=get_clone_data_source(from_pvc_name))
 
     try:
         LOGGER.info(
@@ -361,6 +453,7 @@ def pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created
     calculates bound time for pvc and checks fileset created by
     pvc on spectrum scale
     """
+    storage_class_parameters = runcontext.get().storage_class_parameters
     now1 = api_response.metadata.creation_timestamp
     now = datetime.now(timezone.utc)
     timediff = now-now1
@@ -372,7 +465,7 @@ def pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created
     if volume_name == pv_name:
         LOGGER.info(f"PVC Check : It is case of static pvc , pv {pv_name} is already created")
         return True
-    if 'storage_class_parameters' in globals():
+    if storage_class_parameters is not None:
         if "volDirBasePath" in storage_class_parameters and "volBackendFs" in storage_class_parameters:
             return True
         if "version" in storage_class_parameters and storage_class_parameters["version"] == "2":
@@ -385,24 +478,51 @@ def pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created
                 created_objects["cg"].append(cg_fileset_name)
 
     fileset_name = get_filesetname_from_pv(volume_name, created_objects)
-    if not(filesetfunc.created_fileset_exists(fileset_name)):
+    # one projected fileset document is used for existence , inode and name suffix checks
+    fileset = filesetfunc.get_fileset(fileset_name, fields="filesetName,config.maxNumInodes")
+    if fileset is None:
         LOGGER.error(f'PVC Check : Fileset {fileset_name} doesn\'t exists')
         return False
+    fileset_name = fileset["filesetName"]
 
     if not(check_pvc_size(pvc_name, pvc_values["storage"])):
         LOGGER.error(f'PVC Check : PVC {pvc_name} storage does not match storage in PVC status')
         return False
 
+    inode, fileset_append_check = get_expected_fileset_attributes()
+
+    if not(filesetfunc.check_fileset_quota(fileset_name, pvc_values["storage"], inode, fileset)):
+        LOGGER.error(f'PVC Check : Fileset {fileset_name} quota does not match requested storage or maxinode is not as expected')
+        return False
+
+    LOGGER.info(f'PVC Check : Fileset {fileset_name} has been created successfully')
+
+    if fileset_append_check != "":
+        search_result = re.search(fileset_append_check, fileset_name)
+        if search_result is None:
+            LOGGER.error(f"PVC Check : {fileset_append_check} is not matched for fileset name {fileset_name}")
+            return False
+        LOGGER.info(f"PVC Check : For compression and/or tier in {storage_class_parameters}, Fileset name {fileset_name} is appended with correct value {fileset_append_check}")
+
+    return True
+
+
+def get_expected_fileset_attributes():
+    """
+    return maximum inodes expected for filesets of current storage class (None for default)
+    and suffix expected in fileset name for compression and/or tier
+    """
+    storage_class_parameters = runcontext.get().storage_class_parameters
     inode = None
     fileset_append_check = ""
-    if 'storage_class_parameters' in globals():
+    if storage_class_parameters is not None:
         if "inodeLimit" in storage_class_parameters:
             inode = storage_class_parameters["inodeLimit"]
         elif "filesetType" in storage_class_parameters and storage_class_parameters["filesetType"] == "dependent":
             inode = 0
         if "version" in storage_class_parameters and storage_class_parameters["version"] == "2":
             inode = 0
-        
+
         if "compression" in storage_class_parameters:
             if storage_class_parameters["compression"] == "true":
                 comp = "Z"
@@ -413,153 +533,243 @@ def pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created
                 fileset_append_check = ""
         if "tier" in storage_class_parameters:
             fileset_append_check = f"{fileset_append_check}-T{storage_class_parameters['tier']}csi"
+    return inode, fileset_append_check
 
-    if not(filesetfunc.check_fileset_quota(fileset_name, pvc_values["storage"], inode)):
-        LOGGER.error(f'PVC Check : Fileset {fileset_name} quota does not match requested storage or maxinode is not as expected')
-        return False
 
-    LOGGER.info(f'PVC Check : Fileset {fileset_name} has been created successfully')
+def check_pvcs_filesets_batch(pvc_values, pvc_names, created_objects):
+    """
+    checks filesets of many BOUND pvcs together
+    pvcs and pvs are listed once from kubernetes , filesets and quotas once from spectrum scale
+
+    Args:
+        param1: pvc_values - values used for creation of pvcs
+        param2: pvc_names - names of BOUND pvcs
+        param3: created_objects - dict of created objects , used for cleanup on failure
+
+    Returns:
+        None
+
+    Raises:
+        asserts if any pvc or its fileset is not as expected
+    """
+    storage_class_parameters = runcontext.get().storage_class_parameters
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+    try:
+        pvc_list = kubeinformer.list_objects("pvc", api_instance.list_namespaced_persistent_volume_claim,
+                                             lambda pvc: pvc.metadata.name in pvc_names, namespace=namespace_value)
+        pv_list = kubeinformer.list_objects("pv", api_instance.list_persistent_volume, lambda pv: pv.spec.csi is not None)
+    except ApiException as e:
+        LOGGER.error(f"Exception when listing PVCs/PVs : {e}")
+        clean_with_created_objects(created_objects)
+        assert False
+
+    pvcs = {pvc.metadata.name: pvc for pvc in pvc_list}
+    volume_handles = {pv.metadata.name: pv.spec.csi.volume_handle for pv in pv_list}
+
+    if storage_class_parameters is not None:
+        if "volDirBasePath" in storage_class_parameters and "volBackendFs" in storage_class_parameters:
+            return
+    inode, fileset_append_check = get_expected_fileset_attributes()
+
+    volumes = {}
+    fileset_names = []
+    for pvc_name in pvc_names:
+        pvc = pvcs.get(pvc_name)
+        if pvc is None or pvc.spec.volume_name not in volume_handles:
+            LOGGER.error(f"PVC Check : PVC {pvc_name} or its PV is not found")
+            clean_with_created_objects(created_objects)
+            assert False
+        volume_handle = volume_handles[pvc.spec.volume_name]
+        if pvc.status.capacity.get("storage") != pvc_values["storage"] and not(check_pvc_size(pvc_name, pvc_values["storage"])):
+            LOGGER.error(f'PVC Check : PVC {pvc_name} storage does not match storage in PVC status')
+            clean_with_created_objects(created_objects)
+            assert False
+        if storage_class_parameters is not None and storage_class_parameters.get("version") == "2":
+            cg_fileset_name = volume_handle.split(";")[4]
+            volumes[cg_fileset_name] = {"storage": None, "max_inode": None}
+            if cg_fileset_name not in created_objects["cg"]:
+                created_objects["cg"].append(cg_fileset_name)
+        fileset_name = get_filesetname_from_volume_handle(volume_handle)
+        fileset_names.append(fileset_name)
+        volumes[fileset_name] = {"storage": pvc_values["storage"], "max_inode": inode}
+
+    if not(filesetfunc.check_filesets_batch(volumes)):
+        LOGGER.error('PVC Check : Filesets are missing , quota does not match requested storage or maxinode is not as expected')
+        clean_with_created_objects(created_objects)
+        assert False
 
     if fileset_append_check != "":
-        search_result = re.search(fileset_append_check, fileset_name)
-        if search_result is None:
-            LOGGER.error(f"PVC Check : {fileset_append_check} is not matched for fileset name {fileset_name}")
+        for fileset_name in fileset_names:
+            if re.search(fileset_append_check, fileset_name) is None:
+                LOGGER.error(f"PVC Check : {fileset_append_check} is not matched for fileset name {fileset_name}")
+                clean_with_created_objects(created_objects)
+                assert False
+    LOGGER.info(f'PVC Check : Filesets of {len(pvc_names)} PVCs have been created successfully')
+
+
+def get_events(object_name):
+    """ return events of object_name in test namespace , from informer store when available """
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+    if kubeinformer.get_informer("event", namespace_value) is None:
+        return api_instance.list_namespaced_event(
+            namespace=namespace_value, pretty=True, field_selector="involvedObject.name="+object_name)
+    events = kubeinformer.list_objects("event", api_instance.list_namespaced_event,
+                                       lambda event: event.involved_object.name == object_name, namespace=namespace_value)
+    return client.CoreV1EventList(items=events)
+
+
+def is_pvc_resized(pvc, expected_size):
+    """
+    return True if status.capacity of pvc is at least expected_size (1Gi at least , as provisioned by the driver)
+    and no resize of pvc is in progress (Resizing or FileSystemResizePending condition)
+    """
+    if pvc is None or pvc.status.capacity is None or "storage" not in pvc.status.capacity:
+        return False
+    for condition in pvc.status.conditions or []:
+        if condition.type in RESIZE_CONDITIONS and condition.status == "True":
             return False
-        LOGGER.info(f"PVC Check : For compression and/or tier in {storage_class_parameters}, Fileset name {fileset_name} is appended with correct value {fileset_append_check}")
 
-    return True
+    pvc_status_storage = pvc.status.capacity["storage"]
+    if pvc_status_storage == expected_size:
+        return True
+
+    power_of_10 = {"M": int(1000**2 / 1024), "G": int(1000**3 / 1024), "T": int(1000**4 / 1024)}
+    power_of_2 = {"Ki": 1, "Mi": int(1024), "Gi": int(1024**2), "Ti": int(1024**3)}
+
+    expected_size_in_Ki = 0
+    if expected_size[-1:] in power_of_10:
+        expected_size_in_Ki = int(expected_size[:-1]) * power_of_10[expected_size[-1:]]
+    if expected_size[-2:] in power_of_2:
+        expected_size_in_Ki = int(expected_size[:-2]) * power_of_2[expected_size[-2:]]
+    if expected_size_in_Ki < int(1024**2):
+        expected_size_in_Ki = int(1024**2)
+    if pvc_status_storage[-2:] in power_of_2:
+        pvc_status_storage = int(pvc_status_storage[:-2]) * power_of_2[pvc_status_storage[-2:]]
+        return pvc_status_storage >= expected_size_in_Ki
+    return False
 
 
-def check_pvc_size(pvc_name, expected_size):
+def check_pvc_size(pvc_name, expected_size, timeout=10):
     """
-    Check PVC size in status matches passed PVC size or not"
+    Check PVC size in status matches passed PVC size or not , see is_pvc_resized
+    waits up to timeout seconds , re-checked on every change of the pvc seen by the informer (watch)
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    count = 12
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_persistent_volume_claim(
-                name=pvc_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'PVC Check: Checking size for pvc {pvc_name}')
-
-            if "storage" in api_response.status.capacity:
-                pvc_status_storage = api_response.status.capacity["storage"]
-
-                if pvc_status_storage == expected_size:
-                    return True
-
-                power_of_10 = {"M": int(1000**2 / 1024), "G": int(1000**3 / 1024), "T": int(1000**4 / 1024)}
-                power_of_2 = {"Ki": 1, "Mi": int(1024), "Gi": int(1024**2), "Ti": int(1024**3)}
-
-                expected_size_in_Ki = 0
-                if expected_size[-1:] in power_of_10:
-                    expected_size_in_Ki = int(expected_size[:-1]) * power_of_10[expected_size[-1:]]
-                if expected_size[-2:] in power_of_2:
-                    expected_size_in_Ki = int(expected_size[:-2]) * power_of_2[expected_size[-2:]]
-                if expected_size_in_Ki < int(1024**2):
-                    expected_size_in_Ki = int(1024**2)
-                if pvc_status_storage[-2:] in power_of_2:
-                    pvc_status_storage = int(pvc_status_storage[:-2]) * power_of_2[pvc_status_storage[-2:]]
-
-                if pvc_status_storage >= expected_size_in_Ki:
-                    return True
-            count -= 1
-        except ApiException as e:
-            count -= 1
 
-    return False
+    def pvc_size_matched(api_response):
+        LOGGER.info(f'PVC Check: Checking size for pvc {pvc_name}')
+        LOGGER.debug(str(api_response))
+        return is_pvc_resized(api_response, expected_size)
 
+    try:
+        return bool(kubeinformer.wait_for_object("pvc", api_instance.list_namespaced_persistent_volume_claim, pvc_name,
+                                                 pvc_size_matched, timeout, f"pvc {pvc_name} size {expected_size}",
+                                                 namespace=namespace_value))
+    except ApiException:
+        return False
 
-def check_pvc(pvc_values,  pvc_name, created_objects, pv_name="pvnotavailable"):
+
+@timingdb.phase("bind")
+def check_pvc(pvc_values,  pvc_name, created_objects, pv_name="pvnotavailable", verify_fileset=True):
     """ checks pvc is BOUND or not
         need to reduce complextity of this function
+        fileset of pvc is not checked if verify_fileset is False (see check_pvcs_filesets_batch)
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    con = True
-    var = 0
-    while (con is True):
-        try:
-            api_response = api_instance.read_namespaced_persistent_volume_claim(
-                name=pvc_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'PVC Check: Checking for pvc {pvc_name}')
-        except ApiException as e:
-            LOGGER.error(
-                f"Exception when calling CoreV1Api->read_namespaced_persistent_volume_claim: {e}")
+
+    def pvc_bound(api_response):
+        if api_response is None:
             LOGGER.info(f"PVC Check : PVC {pvc_name} does not exists on the cluster")
             clean_with_created_objects(created_objects)
             assert False
-
+        LOGGER.debug(str(api_response))
+        LOGGER.info(f'PVC Check: Checking for pvc {pvc_name} , phase {api_response.status.phase}')
         if api_response.status.phase == "Bound":
-            if "reason" in pvc_values:
-                LOGGER.error(f'PVC Check : {pvc_name} is BOUND but as the failure reason is provided so\
-                asserting the test')
-                clean_with_created_objects(created_objects)
-                assert False
-            if(pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created_objects)):
-                return True
-            clean_with_created_objects(created_objects)
-            assert False
-        else:
-            var += 1
-            time.sleep(5)
-            if "reason" in pvc_values:
-                time_count = 8
-            elif "parallel" in pvc_values:
-                time_count = 240
-            elif "clone" in pvc_values:
-                time_count = 120
-            else:
-                time_count = 20
-            if(var > time_count):
-                LOGGER.info("PVC Check : PVC is not BOUND,checking if failure reason is expected")
-                field = "involvedObject.name="+pvc_name
-                reason = api_instance.list_namespaced_event(
-                    namespace=namespace_value, pretty=True, field_selector=field)
-                if "reason" not in pvc_values:
-                    clean_with_created_objects(created_objects)
-                    LOGGER.error(str(reason))
-                    LOGGER.error(
-                        "FAILED as reason for Failure not provides")
-                    assert False
-                search_result = None
-                for item in reason.items:
-                    search_result = re.search(
-                        pvc_values["reason"], str(item.message))
-                    if search_result is not None:
-                        break
-                if search_result is None:
-                    clean_with_created_objects(created_objects)
-                    LOGGER.error(f"Failed reason : {str(reason)}")
-                    LOGGER.error("PVC Check : PVC is not Bound but FAILED reason does not match")
-                    assert False
-                else:
-                    LOGGER.debug(search_result)
-                    LOGGER.info(f"PVC Check : PVC is not Bound and FAILED with expected error {pvc_values['reason']}")
-                    con = False
+            return api_response
+        return None
 
+    if "reason" in pvc_values:
+        check_pvc_failure_reason(pvc_values["reason"], pvc_name, created_objects)
+        return
 
-def create_pod(value_pod, pvc_name, pod_name, created_objects, image_name="nginx:1.19.0"):
+    if "parallel" in pvc_values:
+        timeout = 1200
+    elif "clone" in pvc_values:
+        timeout = 600
+    else:
+        timeout = 100
+    try:
+        api_response = kubeinformer.wait_for_object("pvc", api_instance.list_namespaced_persistent_volume_claim, pvc_name,
+                                                    pvc_bound, timeout, f"pvc {pvc_name} Bound", namespace=namespace_value)
+    except ApiException as e:
+        LOGGER.error(
+            f"Exception when calling CoreV1Api->list_namespaced_persistent_volume_claim: {e}")
+        clean_with_created_objects(created_objects)
+        assert False
+
+    if api_response is not None:
+        if verify_fileset is False:
+            LOGGER.info(f'PVC Check : {pvc_name} is BOUND succesfully')
+            return True
+        if(pvc_bound_fileset_check(api_response, pv_name, pvc_name, pvc_values, created_objects)):
+            return True
+        clean_with_created_objects(created_objects)
+        assert False
+
+    reason = get_events(pvc_name)
+    clean_with_created_objects(created_objects)
+    LOGGER.error(str(reason))
+    LOGGER.error(f"PVC Check : PVC {pvc_name} is not BOUND and failure reason is not provided")
+    assert False
+
+
+def check_pvc_failure_reason(expected_reason, pvc_name, created_objects):
     """
-    creates pod
-    Args:
-        param1: value_pod - values required for creation of pod
-        param2: pvc_name - name of pvc , pod associated with
-        param3: pod_name - name of pod to be created
-        param4: image_name - name of the pod image (Default:"nginx:1.19.0")
-        param5: run_as_user - value for pod securityContext spec runAsUser
-        param6: run_as_group - value for pod securityContext spec runAsGroup
-    Returns:
-        None
-    Raises:
-        Raises an exception on kubernetes client api failure and asserts
+    checks pvc pvc_name fails with expected_reason , warning events (ProvisioningFailed) of pvc
+    are matched as they arrive , asserts as soon as pvc is Bound or if no event matches in time
     """
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+
+    def failure_matched():
+        try:
+            api_response = kubeinformer.read_object("pvc", api_instance.read_namespaced_persistent_volume_claim,
+                                                    pvc_name, namespace=namespace_value)
+        except ApiException:
+            api_response = None
+        if api_response is not None and api_response.status.phase == "Bound":
+            return "Bound"
+        for event in get_events(pvc_name).items:
+            if event.type == "Warning" and re.search(expected_reason, str(event.message)) is not None:
+                return event
+        return None
+
+    result = kubeinformer.wait_until("event", failure_matched, 120, f"pvc {pvc_name} failure reason {expected_reason}",
+                                     namespace=namespace_value, max_wait=5)
+    if result == "Bound":
+        LOGGER.error(f'PVC Check : {pvc_name} is BOUND but as the failure reason is provided so asserting the test')
+        clean_with_created_objects(created_objects)
+        assert False
+    if not result:
+        LOGGER.error(f"Failed reason : {str(get_events(pvc_name))}")
+        LOGGER.error("PVC Check : PVC is not Bound but FAILED reason does not match")
+        clean_with_created_objects(created_objects)
+        assert False
+    LOGGER.debug(f"{result.reason} : {result.message}")
+    LOGGER.info(f"PVC Check : PVC is not Bound and FAILED with expected error {expected_reason}")
+
+
+def get_pod_body(value_pod, pvc_name, pod_name, image_name="nginx:1.19.0"):
+    """ return V1Pod for pod_name using pvc_name , see create_pod for arguments """
+    nodeselector = runcontext.get().nodeselector
     if value_pod["read_only"] == "True":
         value_pod["read_only"] = True
     elif value_pod["read_only"] == "False":
         value_pod["read_only"] = False
-    api_instance = client.CoreV1Api()
     pod_metadata = client.V1ObjectMeta(name=pod_name, labels={"app": "nginx"})
 
     pod_persistent_volume_claim = client.V1PersistentVolumeClaimVolumeSource(
@@ -596,13 +806,34 @@ def create_pod(value_pod, pvc_name, pod_name, created_objects, image_name="nginx
         pod_spec = client.V1PodSpec(
             containers=[pod_containers], volumes=[pod_volumes], node_selector=nodeselector)
 
-    pod_body = client.V1Pod(
+    return client.V1Pod(
         api_version="v1",
         kind="Pod",
         metadata=pod_metadata,
         spec=pod_spec
     )
 
+
+@timingdb.phase("pod")
+def create_pod(value_pod, pvc_name, pod_name, created_objects, image_name="nginx:1.19.0"):
+    """
+    creates pod
+    Args:
+        param1: value_pod - values required for creation of pod
+        param2: pvc_name - name of pvc , pod associated with
+        param3: pod_name - name of pod to be created
+        param4: image_name - name of the pod image (Default:"nginx:1.19.0")
+        param5: run_as_user - value for pod securityContext spec runAsUser
+        param6: run_as_group - value for pod securityContext spec runAsGroup
+    Returns:
+        None
+    Raises:
+        Raises an exception on kubernetes client api failure and asserts
+    """
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+    pod_body = get_pod_body(value_pod, pvc_name, pod_name, image_name)
+
     try:
         LOGGER.info(f'POD Create : creating pod {pod_name} using {pvc_name} with {image_name} image with parameters {value_pod}')
         api_response = api_instance.create_namespaced_pod(
@@ -625,19 +856,10 @@ def create_file_inside_pod(value_pod, pod_name, created_objects):
     """
     create snaptestfile inside the pod using touch
     """
-    api_instance = client.CoreV1Api()
+    namespace_value = runcontext.get().namespace
     LOGGER.info("POD Check : Trying to create snaptestfile on SpectrumScale mount point inside the pod")
-    exec_command1 = "touch "+value_pod["mount_path"]+"/snaptestfile"
-    exec_command = [
-        '/bin/sh',
-        '-c',
-        exec_command1]
-    resp = stream(api_instance.connect_get_namespaced_pod_exec,
-                  pod_name,
-                  namespace_value,
-                  command=exec_command,
-                  stderr=True, stdin=False,
-                  stdout=True, tty=False)
+    exec_command = "touch "+value_pod["mount_path"]+"/snaptestfile"
+    resp = podexec.run(namespace_value, pod_name, exec_command)
 
     if resp == "":
         LOGGER.info("file snaptestfile created successfully on SpectrumScale mount point inside the pod")
@@ -653,25 +875,157 @@ def create_file_inside_pod(value_pod, pod_name, created_objects):
     assert False
 
 
-def check_file_inside_pod(value_pod, pod_name, created_objects, volume_name=None):
+def fill_volume(value_pod, pod_name, file_count, file_size_mb, created_objects):
     """
-    check snaptestfile inside the pod using ls
+    writes file_count files of file_size_mb MiB random data in directory benchdata on
+    SpectrumScale mount point inside the pod using dd
+
+    Returns:
+       seconds taken to write and sync the files
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    if volume_name is None:
-        exec_command1 = "ls "+value_pod["mount_path"]
-    else:
-        exec_command1 = "ls "+value_pod["mount_path"]+"/"+volume_name+"-data"
+    data_dir = value_pod["mount_path"] + "/benchdata"
+    LOGGER.info(f"POD Fill : writing {file_count} files of {file_size_mb} MiB in {data_dir} inside pod {pod_name}")
+    exec_command1 = (f"mkdir -p {data_dir} && i=0 && while [ $i -lt {int(file_count)} ]; do "
+                     f"dd if=/dev/urandom of={data_dir}/file-$i bs=1M count={int(file_size_mb)} 2>/dev/null || exit 1; "
+                     f"i=$((i+1)); done && sync && echo fill-done")
     exec_command = [
         '/bin/sh',
         '-c',
         exec_command1]
+    start_time = time.monotonic()
     resp = stream(api_instance.connect_get_namespaced_pod_exec,
                   pod_name,
                   namespace_value,
                   command=exec_command,
                   stderr=True, stdin=False,
-                  stdout=True, tty=False)
+                  stdout=True, tty=False,
+                  _request_timeout=3600)
+    fill_time = time.monotonic() - start_time
+
+    if "fill-done" in resp:
+        LOGGER.info(f"POD Fill : {file_count * file_size_mb} MiB written in {round(fill_time, 1)} seconds")
+        return fill_time
+
+    LOGGER.error(f"POD Fill : writing files in pod {pod_name} failed")
+    LOGGER.error(resp)
+    clean_with_created_objects(created_objects)
+    assert False
+
+
+def get_io_probe_command(mount_path, size_mb, seq_block_size_kb, random_block_size_kb, random_ops, depth):
+    """
+    return sh command running io probe workloads with dd in directory ioprobe of mount_path ,
+    see run_io_probe , one line "io-probe <workload> <bytes> <operations> <nanoseconds>" is printed per workload
+    """
+    seq_bs = int(seq_block_size_kb) * 1024
+    seq_count = max(1, int(size_mb) * 1024 // int(seq_block_size_kb))
+    random_bs = int(random_block_size_kb) * 1024
+    blocks = max(1, int(size_mb) * 1024 // int(random_block_size_kb))
+    ops_per_worker = max(1, int(random_ops) // int(depth))
+    random_ops = ops_per_worker * int(depth)
+    data = f"{mount_path}/ioprobe/data"
+    # dash has no $RANDOM , offsets are generated by awk , one stream per worker
+    random_offsets = f"awk -v n={ops_per_worker} -v m={blocks} -v seed=$1 'BEGIN{{srand(seed); for(i=0;i<n;i++) print int(rand()*m)}}'"
+
+    def random_workload(name, dd_command, seed_base):
+        return (f"s=$(t); i=0; while [ $i -lt {int(depth)} ]; do offsets $(({seed_base}+i)) | while read o; do "
+                f"{dd_command} 2>/dev/null; done & i=$((i+1)); done; wait; e=$(t); "
+                f"echo \"io-probe {name} {random_ops * random_bs} {random_ops} $((e-s))\"; ")
+
+    return (f"t() {{ date +%s%N; }}; offsets() {{ {random_offsets}; }}; "
+            f"mkdir -p {mount_path}/ioprobe || exit 1; "
+            f"s=$(t); dd if=/dev/zero of={data} bs={seq_bs} count={seq_count} oflag=direct conv=fsync 2>/dev/null || exit 1; e=$(t); "
+            f"echo \"io-probe seq_write {seq_count * seq_bs} {seq_count} $((e-s))\"; "
+            f"s=$(t); dd if={data} of=/dev/null bs={seq_bs} count={seq_count} iflag=direct 2>/dev/null || exit 1; e=$(t); "
+            f"echo \"io-probe seq_read {seq_count * seq_bs} {seq_count} $((e-s))\"; "
+            + random_workload("random_write", f"dd if=/dev/zero of={data} bs={random_bs} count=1 seek=$o conv=notrunc oflag=direct", 1)
+            + random_workload("random_read", f"dd if={data} of=/dev/null bs={random_bs} count=1 skip=$o iflag=direct", 1001)
+            + f"rm -rf {mount_path}/ioprobe")
+
+
+def parse_io_probe_line(line):
+    """ return (workload , {"mb_per_second" , "iops"}) of io probe output line , None for other lines """
+    fields = line.split()
+    if len(fields) != 5 or fields[0] != "io-probe":
+        return None
+    workload, num_bytes, operations, nanoseconds = fields[1], int(fields[2]), int(fields[3]), max(int(fields[4]), 1)
+    seconds = nanoseconds / 1e9
+    return workload, {"mb_per_second": round(num_bytes / 1024**2 / seconds, 3), "iops": round(operations / seconds, 1),
+                      "seconds": round(seconds, 3)}
+
+
+def run_io_probe(value_pod, pod_name, io_values, created_objects):
+    """
+    runs sequential write , sequential read , random write and random read workloads with dd
+    (direct I/O) inside the pod on SpectrumScale mount point , results are streamed back and
+    logged as each workload finishes
+
+    random workloads run depth dd loops at the same time , one dd process per block , so their
+    IOPS include process start time , which is the same for every volume type
+
+    Args:
+        param1: value_pod - values used for creation of pod
+        param2: pod_name - name of running pod
+        param3: io_values - overrides of IO_PROBE_DEFAULTS (size_mb , seq_block_size_kb ,
+                            random_block_size_kb , random_ops , depth)
+        param4: created_objects - dict of created objects , used for cleanup on failure
+
+    Returns:
+       dict workload -> {"mb_per_second" , "iops" , "seconds"}
+    """
+    namespace_value = runcontext.get().namespace
+    api_instance = client.CoreV1Api()
+    io_values = {**IO_PROBE_DEFAULTS, **(io_values or {})}
+    LOGGER.info(f"POD IO Probe : running {io_values} inside pod {pod_name} on {value_pod['mount_path']}")
+    exec_command = [
+        '/bin/sh',
+        '-c',
+        get_io_probe_command(value_pod["mount_path"], **io_values)]
+    resp = stream(api_instance.connect_get_namespaced_pod_exec,
+                  pod_name,
+                  namespace_value,
+                  command=exec_command,
+                  stderr=True, stdin=False,
+                  stdout=True, tty=False,
+                  _preload_content=False)
+
+    results = {}
+    output = ""
+    deadline = time.monotonic() + IO_PROBE_TIMEOUT
+    while True:
+        resp.update(timeout=5)
+        output += resp.read_stdout(timeout=0)
+        lines = output.split("\n")
+        output = lines.pop()
+        for line in lines:
+            result = parse_io_probe_line(line)
+            if result is not None:
+                LOGGER.info(f"POD IO Probe : {pod_name} {result[0]} {result[1]}")
+                results[result[0]] = result[1]
+        if not(resp.is_open()) or time.monotonic() > deadline:
+            break
+    resp.close()
+
+    if len(results) == len(IO_PROBE_WORKLOADS):
+        return results
+    LOGGER.error(f"POD IO Probe : only {list(results)} of {IO_PROBE_WORKLOADS} finished in pod {pod_name}")
+    LOGGER.error(resp.read_stderr(timeout=0))
+    clean_with_created_objects(created_objects)
+    assert False
+
+
+def check_file_inside_pod(value_pod, pod_name, created_objects, volume_name=None):
+    """
+    check snaptestfile inside the pod using ls
+    """
+    namespace_value = runcontext.get().namespace
+    if volume_name is None:
+        exec_command = "ls "+value_pod["mount_path"]
+    else:
+        exec_command = "ls "+value_pod["mount_path"]+"/"+volume_name+"-data"
+    resp = podexec.run(namespace_value, pod_name, exec_command)
     if resp[0:12] == "snaptestfile":
         LOGGER.info("POD Check : snaptestfile is succesfully restored from snapshot or clone")
         return
@@ -685,6 +1039,7 @@ def check_file_inside_pod(value_pod, pod_name, created_objects, volume_name=None
     assert False
 
 
+@timingdb.phase("pod")
 def check_pod_execution(value_pod, pod_name, created_objects):
     """
     checks can file be created in pod
@@ -703,33 +1058,15 @@ def check_pod_execution(value_pod, pod_name, created_objects):
     Raises:
         None
     """
-    api_instance = client.CoreV1Api()
+    namespace_value = runcontext.get().namespace
     LOGGER.info("POD Check : Trying to create testfile on SpectrumScale mount point inside the pod")
-    exec_command1 = "touch "+value_pod["mount_path"]+"/testfile"
-    exec_command = [
-        '/bin/sh',
-        '-c',
-        exec_command1]
-    resp = stream(api_instance.connect_get_namespaced_pod_exec,
-                  pod_name,
-                  namespace_value,
-                  command=exec_command,
-                  stderr=True, stdin=False,
-                  stdout=True, tty=False)
+    exec_command = "touch "+value_pod["mount_path"]+"/testfile"
+    resp = podexec.run(namespace_value, pod_name, exec_command)
     if resp == "":
         LOGGER.info("POD Check : Create testfile operation completed successfully")
         LOGGER.info("POD Check : Deleting testfile from pod's SpectrumScale mount point")
-        exec_command1 = "rm -rvf "+value_pod["mount_path"]+"/testfile"
-        exec_command = [
-            '/bin/sh',
-            '-c',
-            exec_command1]
-        resp = stream(api_instance.connect_get_namespaced_pod_exec,
-                      pod_name,
-                      namespace_value,
-                      command=exec_command,
-                      stderr=True, stdin=False,
-                      stdout=True, tty=False)
+        exec_command = "rm -rvf "+value_pod["mount_path"]+"/testfile"
+        resp = podexec.run(namespace_value, pod_name, exec_command)
         if "reason" in value_pod:
             clean_with_created_objects(created_objects)
             LOGGER.error("Pod should not be able to create file inside the pod as failure REASON provided, so asserting")
@@ -756,6 +1093,7 @@ def check_pod_execution(value_pod, pod_name, created_objects):
         assert False
 
 
+@timingdb.phase("pod")
 def check_pod(value_pod, pod_name, created_objects):
     """
     checks pod running or not
@@ -774,51 +1112,53 @@ def check_pod(value_pod, pod_name, created_objects):
     Raises:
         None
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
-    con = True
-    var = 0
-    while (con is True):
-        try:
-            api_response = api_instance.read_namespaced_pod(
-                name=pod_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'POD Check: Checking for pod {pod_name}')
-            if api_response.status.phase == "Running":
-                LOGGER.info(f'POD Check : POD {pod_name} is Running')
-                check_pod_execution(value_pod, pod_name, created_objects)
-                con = False
-            else:
-                var += 1
-                if(var > 20):
-                    LOGGER.error(f'POD Check : POD {pod_name} is not running')
-                    field = "involvedObject.name="+pod_name
-                    reason = api_instance.list_namespaced_event(
-                        namespace=namespace_value, pretty=True, field_selector=field)
-                    if "reason" not in value_pod:
-                        LOGGER.error('FAILED as reason of failure not provided')
-                        LOGGER.error(f"POD Check : Reason of failure is : {str(reason)}")
-                        clean_with_created_objects(created_objects)
-                        assert False
-                    search_result = re.search(value_pod["reason"], str(reason))
-                    if search_result is None:
-                        LOGGER.error(f'Failed as reason of failure does not match {value_pod["reason"]}')
-                        LOGGER.error(f"POD Check : Reason of failure is : {str(reason)}")
-                        clean_with_created_objects(created_objects)
-                        assert False
-                    else:
-                        LOGGER.info(f'POD failed with expected reason {value_pod["reason"]}')
-                        return
-                time.sleep(5)
-        except ApiException as e:
-            LOGGER.error(
-                f"Exception when calling CoreV1Api->read_namespaced_pod: {e}")
+
+    def pod_running(api_response):
+        if api_response is None:
             LOGGER.error("POD Check : POD does not exists on Cluster")
             clean_with_created_objects(created_objects)
             assert False
+        LOGGER.debug(str(api_response))
+        LOGGER.info(f'POD Check: Checking for pod {pod_name} , phase {api_response.status.phase}')
+        return api_response.status.phase == "Running"
+
+    try:
+        running = kubeinformer.wait_for_object("pod", api_instance.list_namespaced_pod, pod_name, pod_running, 100,
+                                               f"pod {pod_name} Running", namespace=namespace_value)
+    except ApiException as e:
+        LOGGER.error(
+            f"Exception when calling CoreV1Api->list_namespaced_pod: {e}")
+        clean_with_created_objects(created_objects)
+        assert False
+
+    if running:
+        LOGGER.info(f'POD Check : POD {pod_name} is Running')
+        podtimeline.log_timeline(namespace_value, pod_name)
+        check_pod_execution(value_pod, pod_name, created_objects)
+        return
+
+    LOGGER.error(f'POD Check : POD {pod_name} is not running')
+    reason = get_events(pod_name)
+    if "reason" not in value_pod:
+        LOGGER.error('FAILED as reason of failure not provided')
+        LOGGER.error(f"POD Check : Reason of failure is : {str(reason)}")
+        clean_with_created_objects(created_objects)
+        assert False
+    search_result = re.search(value_pod["reason"], str(reason))
+    if search_result is None:
+        LOGGER.error(f'Failed as reason of failure does not match {value_pod["reason"]}')
+        LOGGER.error(f"POD Check : Reason of failure is : {str(reason)}")
+        clean_with_created_objects(created_objects)
+        assert False
+    LOGGER.info(f'POD failed with expected reason {value_pod["reason"]}')
 
 
 def create_ds(ds_values, ds_name, pvc_name, created_objects):
 
+    nodeselector = runcontext.get().nodeselector
+    namespace_value = runcontext.get().namespace
     api_instance = client.AppsV1Api()
     if ds_values["read_only"] == "True":
         ds_values["read_only"] = True
@@ -893,40 +1233,42 @@ def create_ds(ds_values, ds_name, pvc_name, created_objects):
 
 
 def check_ds(ds_name, value_ds, created_objects):
+    namespace_value = runcontext.get().namespace
     read_daemonsets_api_instance = client.AppsV1Api()
-    num = 0
-    while (num < 11):
+    status = {"current_number_scheduled": None, "desired_number_scheduled": None, "number_available": None}
+
+    def ds_pods_running():
         try:
             read_daemonsets_api_response = read_daemonsets_api_instance.read_namespaced_daemon_set(
                 name=ds_name, namespace=namespace_value, pretty=True)
             LOGGER.debug(read_daemonsets_api_response)
             LOGGER.info(f"Daemonset Check : Checking for daemonset {ds_name}")
-            current_number_scheduled = read_daemonsets_api_response.status.current_number_scheduled
-            desired_number_scheduled = read_daemonsets_api_response.status.desired_number_scheduled
-            number_available = read_daemonsets_api_response.status.number_available
-
-            if number_available == current_number_scheduled == desired_number_scheduled:
-                if desired_number_scheduled < 2:
-                    LOGGER.error(f"Not enough nodes for this test, only {desired_number_scheduled} nodes are there")
-                    clean_with_created_objects(created_objects)
-                    assert False
+            status["current_number_scheduled"] = read_daemonsets_api_response.status.current_number_scheduled
+            status["desired_number_scheduled"] = read_daemonsets_api_response.status.desired_number_scheduled
+            status["number_available"] = read_daemonsets_api_response.status.number_available
+            return status["number_available"] == status["current_number_scheduled"] == status["desired_number_scheduled"]
+        except ApiException:
+            LOGGER.info(f"Daemonset Check : waiting for daemonsets {ds_name}")
+            return False
 
-                if "reason" in value_ds:
-                    LOGGER.error(f"failure reason provided  {value_ds} , still all pods are running")
-                    clean_with_created_objects(created_objects)
-                    assert False
+    all_running = waitfunc.wait_until(ds_pods_running, 220, f"daemonset {ds_name} pods Running", max_interval=20)
+    current_number_scheduled = status["current_number_scheduled"]
+    desired_number_scheduled = status["desired_number_scheduled"]
+    number_available = status["number_available"]
 
-                LOGGER.info(f"Daemonset Check : daemonset {ds_name} all {current_number_scheduled} pods are Running")
+    if all_running:
+        if desired_number_scheduled < 2:
+            LOGGER.error(f"Not enough nodes for this test, only {desired_number_scheduled} nodes are there")
+            clean_with_created_objects(created_objects)
+            assert False
 
-                return
+        if "reason" in value_ds:
+            LOGGER.error(f"failure reason provided  {value_ds} , still all pods are running")
+            clean_with_created_objects(created_objects)
+            assert False
 
-            time.sleep(20)
-            num += 1
-            LOGGER.info(f"Daemonset Check : waiting for daemonsets {ds_name}")
-        except ApiException:
-            time.sleep(20)
-            num += 1
-            LOGGER.info(f"Daemonset Check : waiting for daemonsets {ds_name}")
+        LOGGER.info(f"Daemonset Check : daemonset {ds_name} all {current_number_scheduled} pods are Running")
+        return
 
     if "reason" not in value_ds:
         LOGGER.error(
@@ -949,6 +1291,7 @@ def check_ds(ds_name, value_ds, created_objects):
 
 
 def check_ds_pod(ds_name, value_ds, created_objects):
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
     selector = "ownerReferences="+ds_name
     running_pod_list, pod_list = [], []
@@ -979,6 +1322,7 @@ def check_ds_pod(ds_name, value_ds, created_objects):
 
 def create_deployment_object():
 
+    namespace_value = runcontext.get().namespace
     deployment_apps_api_instance = client.AppsV1Api()
 
     deployment_labels = {
@@ -1021,6 +1365,7 @@ def get_pv_for_pvc(pvc_name, created_objects):
     """ 
     return pv name associated with pvc
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
     try:
         api_response = api_instance.read_namespaced_persistent_volume_claim(
@@ -1058,6 +1403,7 @@ def expand_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
     """
     expand pvc size
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CoreV1Api()
     pvc_metadata = client.V1ObjectMeta(name=pvc_name)
     pvc_resources = client.V1ResourceRequirements(
@@ -1084,7 +1430,6 @@ def expand_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
         api_response = api_instance.patch_namespaced_persistent_volume_claim(
             name=pvc_name, namespace=namespace_value, body=pvc_body, pretty=True)
         LOGGER.debug(str(api_response))
-        time.sleep(30)
     except ApiException as e:
         LOGGER.info(f'PVC {pvc_name} patch operation has been failed')
         LOGGER.error(
@@ -1092,6 +1437,9 @@ def expand_pvc(pvc_values, sc_name, pvc_name, created_objects, pv_name=None):
         clean_with_created_objects(created_objects)
         assert False
 
+    if not(check_pvc_size(pvc_name, pvc_values["storage"], RESIZE_TIMEOUT)):
+        LOGGER.warning(f'PVC Patch : pvc {pvc_name} is not resized to {pvc_values["storage"]} in {RESIZE_TIMEOUT} seconds')
+
 
 def expand_and_check_pvc(sc_name, pvc_name, value_pvc, expansion_key, pod_name, value_pod, created_objects):
 
@@ -1208,6 +1556,7 @@ def create_vs(vs_name, vs_class_name, pvc_name, created_objects):
     create volume snapshot vs_name using volume snapshot class vs_class_name
     and pvc pvc_name
     """
+    namespace_value = runcontext.get().namespace
     class_body = {
         "apiVersion": "snapshot.storage.k8s.io/v1",
         "kind": "VolumeSnapshot",
@@ -1246,6 +1595,7 @@ def create_vs_from_content(vs_name, vs_content_name, created_objects):
     """
     create volume snapshot vs_name from volume snapshot content vs_content_name
     """
+    namespace_value = runcontext.get().namespace
     class_body = {
         "apiVersion": "snapshot.storage.k8s.io/v1",
         "kind": "VolumeSnapshot",
@@ -1285,6 +1635,7 @@ def check_vs(vs_name):
     return True , if exists
     else return False
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CustomObjectsApi()
     try:
         api_response = api_instance.get_namespaced_custom_object(
@@ -1303,6 +1654,7 @@ def check_vs(vs_name):
 
 
 def check_vs_detail_for_static(vs_name, created_objects):
+    namespace_value = runcontext.get().namespace
     api_instance = client.CustomObjectsApi()
     try:
         api_response = api_instance.get_namespaced_custom_object(
@@ -1333,6 +1685,7 @@ def check_vs_detail(vs_name, pvc_name, body_params, reason, created_objects):
     checks volume snapshot content for vs_name is created
     check snapshot is created on spectrum scale
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CustomObjectsApi()
     try:
         api_response = api_instance.get_namespaced_custom_object(
@@ -1353,10 +1706,7 @@ def check_vs_detail(vs_name, pvc_name, body_params, reason, created_objects):
         LOGGER.info("volume snapshot status ReadyToUse is true")
     else:
         LOGGER.error("volume snapshot status ReadyToUse is not true")
-        api_instance_events = client.CoreV1Api()
-        field = "involvedObject.name="+vs_name
-        failure_reason = api_instance_events.list_namespaced_event(
-                namespace=namespace_value, pretty=True, field_selector=field)
+        failure_reason = get_events(vs_name)
         LOGGER.debug(failure_reason)
         if reason is not None:
             search_result = None
@@ -1373,9 +1723,9 @@ def check_vs_detail(vs_name, pvc_name, body_params, reason, created_objects):
 
     uid_name = api_response["metadata"]["uid"]
     snapcontent_name = "snapcontent-" + uid_name
-    time.sleep(2)
 
-    if not(check_vs_content(snapcontent_name)):
+    if not(waitfunc.wait_until(lambda: check_vs_content(snapcontent_name), 10,
+                               f"volume snapshot content {snapcontent_name} exists", interval=0.5, max_interval=2)):
         clean_with_created_objects(created_objects)
         assert False
 
@@ -1399,28 +1749,25 @@ def check_snapshot_status(vs_name):
     if status True , return True
     else return False
     """
+    namespace_value = runcontext.get().namespace
     api_instance = client.CustomObjectsApi()
-    val = 0
-    while val < 14:
-        try:
-            api_response = api_instance.get_namespaced_custom_object_status(
-                group="snapshot.storage.k8s.io",
-                version="v1",
-                plural="volumesnapshots",
-                name=vs_name,
-                namespace=namespace_value
-            )
-            LOGGER.debug(api_response)
-            LOGGER.info(f"Volume Snapshot Check: Checking for snapshot status of {vs_name}")
-            if "status" in api_response.keys() and "readyToUse" in api_response["status"].keys():
-                if api_response["status"]["readyToUse"] is True:
-                    return True
-            time.sleep(15)
-            val += 1
-        except ApiException:
-            time.sleep(15)
-            val += 1
-    return False
+
+    def snapshot_ready(api_response):
+        if api_response is None:
+            return False
+        LOGGER.debug(api_response)
+        LOGGER.info(f"Volume Snapshot Check: Checking for snapshot status of {vs_name}")
+        if "status" in api_response.keys() and "readyToUse" in api_response["status"].keys():
+            return api_response["status"]["readyToUse"] is True
+        return False
+
+    try:
+        return bool(kubeinformer.wait_for_object("vs", api_instance.list_namespaced_custom_object, vs_name, snapshot_ready, 210,
+                                                 f"volume snapshot {vs_name} readyToUse", group="snapshot.storage.k8s.io",
+                                                 version="v1", plural="volumesnapshots", namespace=namespace_value))
+    except ApiException as e:
+        LOGGER.error(f"Exception when calling CustomObjectsApi->list_namespaced_custom_object: {e}")
+        return False
 
 
 def create_vs_content(vs_content_name, vs_name, body_params, created_objects):
@@ -1428,6 +1775,7 @@ def create_vs_content(vs_content_name, vs_name, body_params, created_objects):
     create volume snapshot content with vs_content_name
     body_params contains configurable parameters
     """
+    namespace_value = runcontext.get().namespace
     content_body = {
         "apiVersion": "snapshot.storage.k8s.io/v1",
         "kind": "VolumeSnapshotContent",
@@ -1474,12 +1822,9 @@ def check_vs_content(vs_content_name):
     """
     api_instance = client.CustomObjectsApi()
     try:
-        api_response = api_instance.get_cluster_custom_object(
-            group="snapshot.storage.k8s.io",
-            version="v1",
-            plural="volumesnapshotcontents",
-            name=vs_content_name
-        )
+        api_response = kubeinformer.read_object("vscontent", api_instance.get_cluster_custom_object, vs_content_name,
+                                                group="snapshot.storage.k8s.io", version="v1",
+                                                plural="volumesnapshotcontents")
         LOGGER.debug(api_response)
         LOGGER.info(f"Volume Snapshot Content Check : {vs_content_name} exists")
         return True
@@ -1525,82 +1870,107 @@ def get_snapshot_and_related_fileset(vs_content_name, pvc_name, created_objects)
 
 
 def set_keep_objects(keep_object):
-    """ sets the keep_objects global for use in later functions"""
-    global keep_objects
-    keep_objects = keep_object
-
-
-def clean_with_created_objects(created_objects):
-
-    for ds_name in copy.deepcopy(created_objects["ds"]):
-        delete_ds(ds_name, created_objects)
-        check_ds_deleted(ds_name, created_objects)
-
-    for pod_name in copy.deepcopy(created_objects["restore_pod"]):
-        delete_pod(pod_name, created_objects)
-        check_pod_deleted(pod_name, created_objects)
-
-    for pvc_name in copy.deepcopy(created_objects["restore_pvc"]):
-        vol_name = delete_pvc(pvc_name, created_objects)
-        check_pvc_deleted(pvc_name, vol_name, created_objects)
-
-    for pod_name in copy.deepcopy(created_objects["clone_pod"]):
-        delete_pod(pod_name, created_objects)
-        check_pod_deleted(pod_name, created_objects)
-
-    for pvc_name in copy.deepcopy(created_objects["clone_pvc"]):
-        vol_name = delete_pvc(pvc_name, created_objects)
-        check_pvc_deleted(pvc_name, vol_name, created_objects)
-
-    for vs_name in copy.deepcopy(created_objects["vs"]):
-        delete_vs(vs_name, created_objects)
-        check_vs_deleted(vs_name, created_objects)
-
-    for vs_content_name in copy.deepcopy(created_objects["vscontent"]):
-        delete_vs_content(vs_content_name, created_objects)
-        check_vs_content_deleted(vs_content_name, created_objects)
-
-    for scale_snap_data in copy.deepcopy(created_objects["scalesnapshot"]):
-        filesetfunc.delete_snapshot(scale_snap_data[0], scale_snap_data[1], created_objects)
-        if filesetfunc.check_snapshot_deleted(scale_snap_data[0], scale_snap_data[1]):
-            LOGGER.info(f"Scale Snapshot Delete : snapshot {scale_snap_data[0]} of volume {scale_snap_data[1]} deleted successfully")
-        else:
-            LOGGER.error(f"Scale Snapshot Delete : snapshot {scale_snap_data[0]} of {scale_snap_data[1]} not deleted, asserting")
-            clean_with_created_objects(created_objects)
+    """ sets keep_objects in current test context for use in later functions"""
+    runcontext.get().keep_objects = keep_object
+
+
+def get_cleanup_levels():
+    """ return categories of CLEANUP_DEPENDENCIES grouped in levels , every category comes after its dependencies """
+    levels = []
+    done = set()
+    while len(done) < len(CLEANUP_DEPENDENCIES):
+        level = [category for category, dependencies in CLEANUP_DEPENDENCIES.items()
+                 if category not in done and all(dependency in done for dependency in dependencies)]
+        levels.append(level)
+        done.update(level)
+    return levels
+
+
+def clean_object(category, name, created_objects):
+    """ deletes object name of category in created_objects and waits till it is deleted , asserts on failure """
+    if category == "ds":
+        delete_ds(name, created_objects)
+        check_ds_deleted(name, created_objects)
+    elif category in ["pod", "restore_pod", "clone_pod"]:
+        delete_pod(name, created_objects)
+        check_pod_deleted(name, created_objects)
+    elif category in ["pvc", "restore_pvc", "clone_pvc"]:
+        vol_name = delete_pvc(name, created_objects)
+        check_pvc_deleted(name, vol_name, created_objects)
+    elif category == "vs":
+        delete_vs(name, created_objects)
+        check_vs_deleted(name, created_objects)
+    elif category == "vscontent":
+        delete_vs_content(name, created_objects)
+        check_vs_content_deleted(name, created_objects)
+    elif category == "scalesnapshot":
+        filesetfunc.delete_snapshot(name[0], name[1], created_objects)
+        if not(filesetfunc.check_snapshot_deleted(name[0], name[1])):
+            LOGGER.error(f"Scale Snapshot Delete : snapshot {name[0]} of {name[1]} not deleted, asserting")
             assert False
+        LOGGER.info(f"Scale Snapshot Delete : snapshot {name[0]} of volume {name[1]} deleted successfully")
+    elif category == "vsclass":
+        delete_vs_class(name, created_objects)
+        check_vs_class_deleted(name, created_objects)
+    elif category == "pv":
+        delete_pv(name, created_objects)
+        check_pv_deleted(name, created_objects)
+    elif category == "dir":
+        if filesetfunc.delete_dir(name):
+            created_objects["dir"].remove(name)
+    elif category == "sc":
+        delete_storage_class(name, created_objects)
+        check_storage_class_deleted(name, created_objects)
+    elif category == "cg":
+        check_cg_fileset_deleted(name, created_objects)
+
+
+@timingdb.phase("teardown")
+def clean_with_created_objects(created_objects):
+    """
+    deletes all objects in created_objects
 
-    for vs_class_name in copy.deepcopy(created_objects["vsclass"]):
-        delete_vs_class(vs_class_name, created_objects)
-        check_vs_class_deleted(vs_class_name, created_objects)
-
-    for pod_name in copy.deepcopy(created_objects["pod"]):
-        delete_pod(pod_name, created_objects)
-        check_pod_deleted(pod_name, created_objects)
-
-    for pvc_name in copy.deepcopy(created_objects["pvc"]):
-        vol_name = delete_pvc(pvc_name, created_objects)
-        check_pvc_deleted(pvc_name, vol_name, created_objects)
-
-    for pv_name in copy.deepcopy(created_objects["pv"]):
-        delete_pv(pv_name, created_objects)
-        check_pv_deleted(pv_name, created_objects)
-
-    for dir_name in copy.deepcopy(created_objects["dir"]):
-        filesetfunc.delete_dir(dir_name)
-
-    for sc_name in copy.deepcopy(created_objects["sc"]):
-        delete_storage_class(sc_name, created_objects)
-        check_storage_class_deleted(sc_name, created_objects)
-
-    for cg_fileset_name in copy.deepcopy(created_objects["cg"]):
-        check_cg_fileset_deleted(cg_fileset_name, created_objects)
+    categories are deleted level by level (see CLEANUP_DEPENDENCIES) , so pods go before
+    their pvcs , snapshots before their source pvcs , pvs after pvcs and cg filesets are
+    checked last. all objects of one level are deleted and confirmed concurrently.
+    failure of one object does not stop deletion of others , it is asserted at the end.
+    called again from a failing deletion while cleanup of the same test is running , it returns immediately.
+    """
+    context = runcontext.get()
+    if context.cleanup_running:
+        return
+    context.cleanup_running = True
+    failures = []
+    try:
+        for level in get_cleanup_levels():
+            objects = [(category, name) for category in level for name in copy.deepcopy(created_objects[category])]
+            if len(objects) == 0:
+                continue
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(CLEANUP_WORKERS, len(objects))) as executor:
+                futures = {executor.submit(runcontext.bind(clean_object), category, name, created_objects): (category, name)
+                           for category, name in objects}
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failures.append((*futures[future], e))
+    finally:
+        context.cleanup_running = False
+
+    if len(failures) > 0:
+        for category, name, e in failures:
+            LOGGER.error(f"Cleanup : deletion of {category} {name} failed {e!r}")
+        assert False
 
 
 def delete_pod(pod_name, created_objects):
     """ deletes pod pod_name """
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
     api_instance = client.CoreV1Api()
+    podexec.close_session(namespace_value, pod_name)
     try:
         LOGGER.info(f'POD Delete : Deleting pod {pod_name}')
         api_response = api_instance.delete_namespaced_pod(
@@ -1622,21 +1992,15 @@ def delete_pod(pod_name, created_objects):
 
 def check_pod_deleted(pod_name, created_objects):
     """ checks pod deleted or not , if not deleted , asserts """
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
-    count = 12
     api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_pod(
-                name=pod_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(15)
-            LOGGER.info(f'POD Delete : Checking deletion for Pod {pod_name}')
-        except ApiException:
-            LOGGER.info(f'POD Delete : Pod {pod_name} has been deleted')
-            return
+    if kubeinformer.wait_for_deletion("pod", api_instance.list_namespaced_pod, pod_name, 180, f"pod {pod_name}",
+                                      namespace=namespace_value):
+        LOGGER.info(f'POD Delete : Pod {pod_name} has been deleted')
+        return
 
     LOGGER.error(f'Pod {pod_name} is still not deleted')
     clean_with_created_objects(created_objects)
@@ -1645,6 +2009,8 @@ def check_pod_deleted(pod_name, created_objects):
 
 def delete_pvc(pvc_name, created_objects):
     """ deletes pvc pvc_name and return name of pv associated with it"""
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
 
     api_instance = client.CoreV1Api()
     try:
@@ -1686,22 +2052,16 @@ def delete_pvc(pvc_name, created_objects):
 
 def check_pvc_deleted(pvc_name, volume_name, created_objects):
     """ check pvc deleted or not , if not deleted , asserts """
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
-    count = 30
     api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_persistent_volume_claim(
-                name=pvc_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(15)
-            LOGGER.info(f'PVC Delete : Checking deletion for pvc {pvc_name}')
-        except ApiException:
-            LOGGER.info(f'PVC Delete : pvc {pvc_name} deleted')
-            filesetfunc.delete_created_fileset(volume_name)
-            return
+    if kubeinformer.wait_for_deletion("pvc", api_instance.list_namespaced_persistent_volume_claim, pvc_name, 450,
+                                      f"pvc {pvc_name}", namespace=namespace_value):
+        LOGGER.info(f'PVC Delete : pvc {pvc_name} deleted')
+        filesetfunc.delete_created_fileset(volume_name)
+        return
 
     LOGGER.error(f'pvc {pvc_name} is not deleted')
     clean_with_created_objects(created_objects)
@@ -1710,6 +2070,7 @@ def check_pvc_deleted(pvc_name, volume_name, created_objects):
 
 def delete_pv(pv_name, created_objects):
     """ delete pv pv_name """
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
     api_instance = client.CoreV1Api()
@@ -1728,21 +2089,13 @@ def delete_pv(pv_name, created_objects):
 
 def check_pv_deleted(pv_name, created_objects):
     """ checks pv is deleted or not , if not deleted ,asserts"""
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
-    count = 12
     api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_persistent_volume(
-                name=pv_name, pretty=True)
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(15)
-            LOGGER.info(f'PV Delete : Checking deletion for PV {pv_name}')
-        except ApiException:
-            LOGGER.info(f'PV Delete : PV {pv_name} has been deleted')
-            return
+    if kubeinformer.wait_for_deletion("pv", api_instance.list_persistent_volume, pv_name, 180, f"pv {pv_name}"):
+        LOGGER.info(f'PV Delete : PV {pv_name} has been deleted')
+        return
 
     LOGGER.error(f'PV {pv_name} is still not deleted')
     clean_with_created_objects(created_objects)
@@ -1751,6 +2104,7 @@ def check_pv_deleted(pv_name, created_objects):
 
 def delete_storage_class(sc_name, created_objects):
     """deletes storage class sc_name"""
+    keep_objects = runcontext.get().keep_objects
     if sc_name == "" or keep_objects:
         return
     api_instance = client.StorageV1Api()
@@ -1772,21 +2126,13 @@ def check_storage_class_deleted(sc_name, created_objects):
     checks storage class sc_name deleted
     if sc not deleted , asserts
     """
+    keep_objects = runcontext.get().keep_objects
     if sc_name == "" or keep_objects:
         return
-    count = 12
     api_instance = client.StorageV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_storage_class(
-                name=sc_name, pretty=True)
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(15)
-            LOGGER.info(f'SC Delete : Checking deletion for StorageClass {sc_name}')
-        except ApiException:
-            LOGGER.info(f'SC Delete : StorageClass {sc_name} has been deleted')
-            return
+    if kubeinformer.wait_for_deletion("sc", api_instance.list_storage_class, sc_name, 180, f"StorageClass {sc_name}"):
+        LOGGER.info(f'SC Delete : StorageClass {sc_name} has been deleted')
+        return
 
     LOGGER.error(f'StorageClass {sc_name} is not deleted')
     clean_with_created_objects(created_objects)
@@ -1797,6 +2143,7 @@ def delete_vs_content(vs_content_name, created_objects):
     """
     deletes volume snapshot content vs_content_name
     """
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
     custom_object_api_instance = client.CustomObjectsApi()
@@ -1820,25 +2167,15 @@ def check_vs_content_deleted(vs_content_name, created_objects):
     """
     if volume snapshot content vs_content_name  exists ,  assert
     """
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
     api_instance = client.CustomObjectsApi()
-    val = 0
-    while val < 12:
-        try:
-            api_response = api_instance.get_cluster_custom_object(
-                group="snapshot.storage.k8s.io",
-                version="v1beta1",
-                plural="volumesnapshotcontents",
-                name=vs_content_name
-            )
-            LOGGER.debug(api_response)
-            time.sleep(15)
-            LOGGER.info(f"Volume Snapshot Content Delete : Checking deletion {vs_content_name}")
-            val += 1
-        except ApiException:
-            LOGGER.info(f"Volume Snapshot Content Delete : {vs_content_name} deletion confirmed")
-            return
+    if kubeinformer.wait_for_deletion("vscontent", api_instance.list_cluster_custom_object, vs_content_name, 180,
+                                      f"volume snapshot content {vs_content_name}", group="snapshot.storage.k8s.io",
+                                      version="v1", plural="volumesnapshotcontents"):
+        LOGGER.info(f"Volume Snapshot Content Delete : {vs_content_name} deletion confirmed")
+        return
     LOGGER.error(f"Volume Snapshot Content Delete : {vs_content_name} is not deleted , asserting")
     clean_with_created_objects(created_objects)
     assert False
@@ -1848,6 +2185,8 @@ def delete_vs(vs_name, created_objects):
     """
     delete volume snapshot vs_name
     """
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
     custom_object_api_instance = client.CustomObjectsApi()
@@ -1872,26 +2211,16 @@ def check_vs_deleted(vs_name, created_objects):
     """
     if volume snapshot vs_name exists , it asserts
     """
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
     api_instance = client.CustomObjectsApi()
-    val = 0
-    while val < 12:
-        try:
-            api_response = api_instance.get_namespaced_custom_object(
-                group="snapshot.storage.k8s.io",
-                version="v1",
-                plural="volumesnapshots",
-                name=vs_name,
-                namespace=namespace_value
-            )
-            LOGGER.debug(api_response)
-            time.sleep(15)
-            LOGGER.info(f"Volume Snapshot Delete : Checking deletion for {vs_name}")
-            val += 1
-        except ApiException:
-            LOGGER.info(f"Volume Snapshot Delete : {vs_name} deletion confirmed")
-            return
+    if kubeinformer.wait_for_deletion("vs", api_instance.list_namespaced_custom_object, vs_name, 180, f"volume snapshot {vs_name}",
+                                      group="snapshot.storage.k8s.io", version="v1", plural="volumesnapshots",
+                                      namespace=namespace_value):
+        LOGGER.info(f"Volume Snapshot Delete : {vs_name} deletion confirmed")
+        return
     LOGGER.error(f"Volume Snapshot Delete : {vs_name} is not deleted , asserting")
     clean_with_created_objects(created_objects)
     assert False
@@ -1901,6 +2230,7 @@ def delete_vs_class(vs_class_name, created_objects):
     """
     deletes volume snapshot class vs_class_name
     """
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
     custom_object_api_instance = client.CustomObjectsApi()
@@ -1924,6 +2254,7 @@ def check_vs_class_deleted(vs_class_name, created_objects):
     """
     if volume snapshot class vs_class_name  exists ,  assert
     """
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
     api_instance = client.CustomObjectsApi()
@@ -1943,6 +2274,8 @@ def check_vs_class_deleted(vs_class_name, created_objects):
 
 
 def delete_ds(ds_name, created_objects):
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
     api_instance = client.AppsV1Api()
@@ -1959,6 +2292,8 @@ def delete_ds(ds_name, created_objects):
 
 
 def check_ds_deleted(ds_name, created_objects):
+    keep_objects = runcontext.get().keep_objects
+    namespace_value = runcontext.get().namespace
     if keep_objects:
         return
 
@@ -1982,19 +2317,9 @@ def get_filesetname_from_pv(volume_name, created_objects):
 
     if volume_name is not None:
         try:
-            api_response = api_instance.read_persistent_volume(
-            name=volume_name, pretty=True)
+            api_response = kubeinformer.read_object("pv", api_instance.read_persistent_volume, volume_name)
             LOGGER.debug(str(api_response))
-            volume_handle = api_response.spec.csi.volume_handle
-            volume_handle = volume_handle.split(";")
-            if len(volume_handle)==3:
-                fileset_name = ""
-            elif len(volume_handle)<=4:
-                fileset_name= volume_handle[2][12:]
-            else:
-                fileset_name= volume_handle[5]
-            if fileset_name == "":
-                fileset_name = "LW"
+            fileset_name = get_filesetname_from_volume_handle(api_response.spec.csi.volume_handle)
         except ApiException as e:
             LOGGER.error(
                 f"Exception when calling CoreV1Api->read_persistent_volume: {e}")
@@ -2008,6 +2333,22 @@ def get_filesetname_from_pv(volume_name, created_objects):
     return fileset_name
 
 
+def get_filesetname_from_volume_handle(volume_handle):
+    """
+    return filesetname from VolumeHandle of PV , "LW" for lightweight volume
+    """
+    volume_handle = volume_handle.split(";")
+    if len(volume_handle)==3:
+        fileset_name = ""
+    elif len(volume_handle)<=4:
+        fileset_name= volume_handle[2][12:]
+    else:
+        fileset_name= volume_handle[5]
+    if fileset_name == "":
+        fileset_name = "LW"
+    return fileset_name
+
+
 def get_cg_filesetname_from_pv(volume_name, created_objects):
     """
     return consistency group filesetname from VolumeHandle of PV
@@ -2017,8 +2358,7 @@ def get_cg_filesetname_from_pv(volume_name, created_objects):
 
     if volume_name is not None:
         try:
-            api_response = api_instance.read_persistent_volume(
-            name=volume_name, pretty=True)
+            api_response = kubeinformer.read_object("pv", api_instance.read_persistent_volume, volume_name)
             LOGGER.debug(str(api_response))
             volume_handle = api_response.spec.csi.volume_handle
             volume_handle = volume_handle.split(";")
@@ -2037,15 +2377,17 @@ def get_cg_filesetname_from_pv(volume_name, created_objects):
 
 
 def check_cg_fileset_deleted(cg_fileset_name, created_objects):
+    keep_objects = runcontext.get().keep_objects
     if keep_objects:
         return
 
-    for _ in range(0,24):
+    def cg_fileset_deleted():
         LOGGER.info(f"Checking for deletion of consistency group fileset {cg_fileset_name}")
-        if not(filesetfunc.created_fileset_exists(cg_fileset_name)):
-            created_objects["cg"].remove(cg_fileset_name)
-            LOGGER.info(f"Consistency group fileset {cg_fileset_name} is deleted")
-            break
+        return not(filesetfunc.created_fileset_exists(cg_fileset_name, timeout=0))
+
+    if waitfunc.wait_until(cg_fileset_deleted, 240, f"consistency group fileset {cg_fileset_name} deletion", max_interval=10):
+        created_objects["cg"].remove(cg_fileset_name)
+        LOGGER.info(f"Consistency group fileset {cg_fileset_name} is deleted")
     else:
         created_objects["cg"].remove(cg_fileset_name)
         LOGGER.error(f"Consistency group fileset {cg_fileset_name} is not deleted")
@@ -0,0 +1,328 @@
+import time
+import logging
+import threading
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_watch_function as kubewatchfunc
+LOGGER = logging.getLogger()
+
+# seconds to wait for initial listing of an informer before falling back to direct API calls
+SYNC_TIMEOUT = 30
+# seconds to wait before listing again after a failed list or watch
+RETRY_INTERVAL = 2
+
+# (kind , namespace) -> informer , namespace is None for cluster scoped kinds
+informers = {}
+informers_lock = threading.Lock()
+# kind -> functions called with (event type , object) for every change seen by informers of kind , see add_listener
+listeners = {}
+
+
+class Informer:
+    """
+    In-memory store of all objects of one kind , kept current by a list-watch thread
+
+    Objects are listed once and then updated from a watch resumed from the last
+    resourceVersion , so readers answer from memory and block on change
+    notifications instead of sending requests to the API server.
+    """
+
+    def __init__(self, kind, list_function, **kwargs):
+        self.kind = kind
+        self.list_function = list_function
+        self.kwargs = kwargs
+        self.store = {}
+        # incremented on every change of store , lets waiters detect changes they have not seen
+        self.version = 0
+        self.resource_version = None
+        self.changed = threading.Condition()
+        self.synced = threading.Event()
+        # set after first list attempt , successful or not , so readers do not wait for a kind which cannot be listed
+        self.listed = threading.Event()
+        self.stopped = threading.Event()
+        self.kube_watch = None
+        self.thread = threading.Thread(target=self.run, name=f"informer-{kind}", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        if self.kube_watch is not None:
+            self.kube_watch.stop()
+        with self.changed:
+            self.changed.notify_all()
+
+    def relist(self):
+        try:
+            response = self.list_function(**self.kwargs)
+        except Exception:
+            self.listed.set()
+            raise
+        if isinstance(response, dict):
+            items, resource_version = response.get("items", []), response["metadata"]["resourceVersion"]
+        else:
+            items, resource_version = response.items, response.metadata.resource_version
+        with self.changed:
+            self.store = {get_name(item): item for item in items}
+            self.resource_version = resource_version
+            self.version += 1
+            self.changed.notify_all()
+        for item in items:
+            self.notify("LISTED", item)
+        self.synced.set()
+        self.listed.set()
+        LOGGER.debug(f"Informer : {len(items)} {self.kind} listed")
+
+    def run(self):
+        while not self.stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+                self.kube_watch = watch.Watch()
+                for event in self.kube_watch.stream(self.list_function, resource_version=self.resource_version,
+                                                    timeout_seconds=kubewatchfunc.WATCH_REQUEST_TIMEOUT, **self.kwargs):
+                    kube_object = event["object"]
+                    if event["type"] not in ["ADDED", "MODIFIED", "DELETED"]:
+                        LOGGER.debug(f"Informer : watch of {self.kind} returned {event['type']} {kube_object}")
+                        self.resource_version = None
+                        break
+                    name = get_name(kube_object)
+                    with self.changed:
+                        if event["type"] == "DELETED":
+                            self.store.pop(name, None)
+                        else:
+                            self.store[name] = kube_object
+                        self.resource_version = kubewatchfunc.get_resource_version(kube_object)
+                        self.version += 1
+                        self.changed.notify_all()
+                    self.notify(event["type"], kube_object)
+                    if self.stopped.is_set():
+                        break
+            except ApiException as e:
+                if e.status != 410:
+                    LOGGER.debug(f"Informer : watch of {self.kind} failed : {e}")
+                    time.sleep(RETRY_INTERVAL)
+                self.resource_version = None
+            except Exception as e:
+                LOGGER.debug(f"Informer : watch of {self.kind} failed : {e}")
+                time.sleep(RETRY_INTERVAL)
+                self.resource_version = None
+
+    def notify(self, event_type, kube_object):
+        """ calls listeners of kind with change , failures of listeners do not stop the watch """
+        for listener in listeners.get(self.kind, []):
+            try:
+                listener(event_type, kube_object)
+            except Exception as e:
+                LOGGER.debug(f"Informer : listener of {self.kind} failed : {e}")
+
+    def get(self, name):
+        """ return object name from store , None if it does not exist """
+        with self.changed:
+            return self.store.get(name)
+
+    def list(self, matches=None):
+        """ return objects from store , optionally only those for which matches(object) is True """
+        with self.changed:
+            return [item for item in self.store.values() if matches is None or matches(item)]
+
+    def wait_for(self, name, condition, timeout, description, read=None):
+        """
+        waits till condition(object name) is truthy , condition is called with None when object does not exist
+        condition is re-evaluated on every change of store , returns last value of condition
+        while object is not in store it is read with read() if given , so an object created just
+        before its ADDED event reached the store is not taken as not existing
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        remaining_test_time = waitfunc.remaining_test_time()
+        test_deadline_reached = False
+        if remaining_test_time is not None and start + remaining_test_time < deadline:
+            deadline = start + remaining_test_time
+            test_deadline_reached = True
+
+        changes = 0
+        with self.changed:
+            kube_object = self.store.get(name)
+        result = condition(self.read_missing(kube_object, read))
+        while not result:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.stopped.is_set():
+                waitfunc.record_timeout(description, timeout, start, changes, test_deadline_reached, result)
+                return result
+            with self.changed:
+                changed_object = self.store.get(name)
+                if changed_object is kube_object:
+                    self.changed.wait(remaining)
+                    changed_object = self.store.get(name)
+            changes += 1
+            if changed_object is kube_object:
+                continue
+            kube_object = changed_object
+            result = condition(self.read_missing(kube_object, read))
+        return result
+
+    def read_missing(self, kube_object, read):
+        """ return kube_object , or read() if kube_object is None (not in store) and read is given """
+        if kube_object is None and read is not None:
+            return read()
+        return kube_object
+
+    def wait_until(self, predicate, timeout, description, max_wait=None):
+        """
+        waits till predicate() is truthy , predicate is re-evaluated on every change of store
+        and at least every max_wait seconds (for predicates which also look at other stores)
+        returns last value of predicate
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        remaining_test_time = waitfunc.remaining_test_time()
+        test_deadline_reached = False
+        if remaining_test_time is not None and start + remaining_test_time < deadline:
+            deadline = start + remaining_test_time
+            test_deadline_reached = True
+
+        attempts = 0
+        while True:
+            with self.changed:
+                version = self.version
+            attempts += 1
+            result = predicate()
+            if result:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.stopped.is_set():
+                waitfunc.record_timeout(description, timeout, start, attempts, test_deadline_reached, result)
+                return result
+            if max_wait is not None:
+                remaining = min(remaining, max_wait)
+            with self.changed:
+                if self.version == version:
+                    self.changed.wait(remaining)
+
+
+def get_name(kube_object):
+    if isinstance(kube_object, dict):
+        return kube_object.get("metadata", {}).get("name")
+    return kube_object.metadata.name
+
+
+def start_informers(namespace):
+    """
+    starts informers for PVCs , PVs , Pods , Events , StorageClasses , VolumeSnapshots ,
+    VolumeSnapshotContents and VolumeAttachments , namespaced informers watch namespace.
+    informers of other namespaces keep running for tests run in parallel in them ,
+    cluster scoped informers are shared.
+    """
+    core_api = client.CoreV1Api()
+    storage_api = client.StorageV1Api()
+    custom_api = client.CustomObjectsApi()
+    snapshot_group = {"group": "snapshot.storage.k8s.io", "version": "v1"}
+    kinds = {
+        "pvc": (core_api.list_namespaced_persistent_volume_claim, {"namespace": namespace}),
+        "pod": (core_api.list_namespaced_pod, {"namespace": namespace}),
+        "event": (core_api.list_namespaced_event, {"namespace": namespace}),
+        "vs": (custom_api.list_namespaced_custom_object, {**snapshot_group, "plural": "volumesnapshots", "namespace": namespace}),
+        "pv": (core_api.list_persistent_volume, {}),
+        "sc": (storage_api.list_storage_class, {}),
+        "vscontent": (custom_api.list_cluster_custom_object, {**snapshot_group, "plural": "volumesnapshotcontents"}),
+        "va": (storage_api.list_volume_attachment, {}),
+    }
+    with informers_lock:
+        for kind, (list_function, kwargs) in kinds.items():
+            key = (kind, kwargs.get("namespace"))
+            if key not in informers:
+                informers[key] = Informer(kind, list_function, **kwargs).start()
+    LOGGER.info(f"Informer : watching objects of namespace {namespace}")
+
+
+def add_listener(kind, listener):
+    """
+    calls listener(event type , object) from informer threads for every object of kind listed
+    (event type LISTED) or changed (ADDED , MODIFIED , DELETED) by informers started later or running
+    """
+    with informers_lock:
+        if listener not in listeners.setdefault(kind, []):
+            listeners[kind].append(listener)
+
+
+def stop_informers(namespace=None):
+    """ stops informers watching namespace , all informers if namespace is None """
+    with informers_lock:
+        for key in [key for key in informers if namespace is None or key[1] == namespace]:
+            informers.pop(key).stop()
+
+
+def get_informer(kind, namespace=None):
+    """
+    return synced informer of kind watching namespace (None for cluster scoped kinds)
+    return None if no such informer is running , callers then use the API server directly
+    """
+    with informers_lock:
+        informer = informers.get((kind, namespace))
+    if informer is None or informer.stopped.is_set():
+        return None
+    informer.listed.wait(SYNC_TIMEOUT)
+    if not(informer.synced.is_set()):
+        LOGGER.debug(f"Informer : {kind} is not synced , using API server")
+        return None
+    return informer
+
+
+def wait_for_object(kind, list_function, name, condition, timeout, description, **kwargs):
+    """
+    waits till condition is met for object name of kind , answered from informer store
+    if informer of kind is running for kwargs namespace , else from a watch of the API server
+    see kubernetes_watch_function.wait_for_object for arguments
+    """
+    informer = get_informer(kind, kwargs.get("namespace"))
+    if informer is not None:
+        return informer.wait_for(name, condition, timeout, description,
+                                 lambda: kubewatchfunc.list_object(list_function, name, **kwargs)[0])
+    return kubewatchfunc.wait_for_object(list_function, name, condition, timeout, description, **kwargs)
+
+
+def wait_for_deletion(kind, list_function, name, timeout, description, **kwargs):
+    """ waits till object name of kind is deleted , returns True if deleted within timeout """
+    return bool(wait_for_object(kind, list_function, name, lambda kube_object: kube_object is None,
+                                timeout, f"{description} deletion", **kwargs))
+
+
+def wait_until(kind, predicate, timeout, description, namespace=None, max_wait=None):
+    """
+    waits till predicate() is truthy , re-evaluated on every change of informer kind watching namespace
+    if such informer is running , else polled with wait_functions.wait_until
+    """
+    informer = get_informer(kind, namespace)
+    if informer is not None:
+        return informer.wait_until(predicate, timeout, description, max_wait)
+    return waitfunc.wait_until(predicate, timeout, description, max_interval=max_wait or waitfunc.DEFAULT_MAX_INTERVAL)
+
+
+def read_object(kind, read_function, name, **kwargs):
+    """
+    return object name of kind from informer store , objects not (yet) in store are read
+    with read_function(name=name, **kwargs) which raises ApiException if object does not exist
+    """
+    informer = get_informer(kind, kwargs.get("namespace"))
+    if informer is not None:
+        kube_object = informer.get(name)
+        if kube_object is not None:
+            return kube_object
+    return read_function(name=name, **kwargs)
+
+
+def list_objects(kind, list_function, matches, **kwargs):
+    """
+    return objects of kind for which matches(object) is True , from informer store
+    if informer of kind is running for kwargs namespace , else list_function(**kwargs).items filtered by matches
+    """
+    informer = get_informer(kind, kwargs.get("namespace"))
+    if informer is not None:
+        return informer.list(matches)
+    response = list_function(**kwargs)
+    items = response["items"] if isinstance(response, dict) else response.items
+    return [item for item in items if matches(item)]
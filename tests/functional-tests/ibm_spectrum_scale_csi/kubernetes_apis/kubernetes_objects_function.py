@@ -1,4 +1,3 @@
-import time
 import logging
 import copy
 import re
@@ -6,6 +5,7 @@ import base64
 import urllib3
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 LOGGER = logging.getLogger()
 
@@ -369,25 +369,13 @@ def check_crd_deleted():
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 12
     crd_name = "csiscaleoperators.csi.ibm.com"
     custom_object_api_instance = client.CustomObjectsApi()
-    while (count > 0):
-        try:
-            custom_object_api_response = custom_object_api_instance.get_cluster_custom_object(
-                group="apiextensions.k8s.io",
-                version="v1",
-                plural="customresourcedefinitions",
-                name=crd_name
-            )
-            LOGGER.debug(custom_object_api_response)
-            LOGGER.info("still deleting crd")
-            count -= 1
-            time.sleep(5)
-
-        except ApiException:
-            LOGGER.info("crd deleted")
-            return
+    if waitfunc.wait_for_deletion(lambda: custom_object_api_instance.get_cluster_custom_object(
+            group="apiextensions.k8s.io", version="v1", plural="customresourcedefinitions", name=crd_name),
+            60, f"crd {crd_name}", max_interval=5):
+        LOGGER.info("crd deleted")
+        return
 
     LOGGER.error("crd is not deleted")
     assert False
@@ -402,19 +390,11 @@ def check_namespace_deleted(namespace_name):
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 18
     list_namespace_api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            list_namespace_api_response = list_namespace_api_instance.read_namespace(
-                name=namespace_name, pretty=True)
-            LOGGER.debug(str(list_namespace_api_response))
-            LOGGER.info(f'Namespace Delete : still deleting {namespace_name}')
-            count = count-1
-            time.sleep(10)
-        except ApiException:
-            LOGGER.info(f'Namespace Delete : {namespace_name} is deleted')
-            return
+    if waitfunc.wait_for_deletion(lambda: list_namespace_api_instance.read_namespace(name=namespace_name, pretty=True),
+                                  180, f"namespace {namespace_name}", max_interval=10):
+        LOGGER.info(f'Namespace Delete : {namespace_name} is deleted')
+        return
 
     LOGGER.error(f'namespace  {namespace_name} is not deleted')
     assert False
@@ -429,19 +409,12 @@ def check_deployment_deleted():
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 6
     api_instance = client.AppsV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_deployment(
-                name="ibm-spectrum-scale-csi-operator", namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info('Still Deleting ibm-spectrum-scale-csi-operator deployment')
-            count = count-1
-            time.sleep(5)
-        except ApiException:
-            LOGGER.info("Deployment ibm-spectrum-scale-csi-operator is deleted")
-            return
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_namespaced_deployment(
+            name="ibm-spectrum-scale-csi-operator", namespace=namespace_value, pretty=True),
+            30, "deployment ibm-spectrum-scale-csi-operator", max_interval=5):
+        LOGGER.info("Deployment ibm-spectrum-scale-csi-operator is deleted")
+        return
 
     LOGGER.error("deployment is not deleted")
     assert False
@@ -459,19 +432,12 @@ def check_service_account_deleted(service_account_name):
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 6
     api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_service_account(
-                name=service_account_name, namespace=namespace_value, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'Still deleting ServiceAccount {service_account_name}')
-            count = count-1
-            time.sleep(5)
-        except ApiException:
-            LOGGER.info(f'ServiceAccount {service_account_name} is deleted')
-            return
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_namespaced_service_account(
+            name=service_account_name, namespace=namespace_value, pretty=True),
+            30, f"ServiceAccount {service_account_name}", max_interval=5):
+        LOGGER.info(f'ServiceAccount {service_account_name} is deleted')
+        return
 
     LOGGER.error("service account is not deleted")
     assert False
@@ -489,19 +455,11 @@ def check_cluster_role_deleted(cluster_role_name):
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 6
     api_instance = client.RbacAuthorizationV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_cluster_role(
-                name=cluster_role_name, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'Still deleting ClusterRole {cluster_role_name} ')
-            count = count-1
-            time.sleep(5)
-        except ApiException:
-            LOGGER.info(f'ClusterRole {cluster_role_name} is deleted')
-            return
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_cluster_role(name=cluster_role_name, pretty=True),
+                                  30, f"ClusterRole {cluster_role_name}", max_interval=5):
+        LOGGER.info(f'ClusterRole {cluster_role_name} is deleted')
+        return
 
     LOGGER.error(f'ClusterRole {cluster_role_name} is not deleted')
     assert False
@@ -519,19 +477,11 @@ def check_cluster_role_binding_deleted(cluster_role_binding_name):
         Raises an exception on kubernetes client api failure and asserts
 
     """
-    count = 6
     api_instance = client.RbacAuthorizationV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_cluster_role_binding(
-                name=cluster_role_binding_name, pretty=True)
-            LOGGER.debug(str(api_response))
-            LOGGER.info(f'Still deleting ClusterRoleBinding {cluster_role_binding_name}')
-            count = count-1
-            time.sleep(5)
-        except ApiException:
-            LOGGER.info(f'ClusterRoleBinding {cluster_role_binding_name} is deleted')
-            return
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_cluster_role_binding(name=cluster_role_binding_name, pretty=True),
+                                  30, f"ClusterRoleBinding {cluster_role_binding_name}", max_interval=5):
+        LOGGER.info(f'ClusterRoleBinding {cluster_role_binding_name} is deleted')
+        return
 
     LOGGER.error(f'ClusterRoleBinding {cluster_role_binding_name} is not deleted')
     assert False
@@ -892,24 +842,15 @@ def check_secret_is_deleted(secret_name):
     Args:
        param1: secret_name - name of secret to be checked
     """
-    var = True
-    count = 12
     api_instance = client.CoreV1Api()
-    while (var and count > 0):
-        try:
-            api_response = api_instance.read_namespaced_secret(
-                name=secret_name, namespace=namespace_value, pretty=True)
-            LOGGER.info("still deleting secret")
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(10)
-        except ApiException:
-            LOGGER.info(f"Secret {secret_name} has been deleted")
-            var = False
-
-    if count <= 0:
-        LOGGER.error(f"Secret {secret_name} is not deleted")
-        assert False
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_namespaced_secret(
+            name=secret_name, namespace=namespace_value, pretty=True),
+            120, f"secret {secret_name}", max_interval=10):
+        LOGGER.info(f"Secret {secret_name} has been deleted")
+        return
+
+    LOGGER.error(f"Secret {secret_name} is not deleted")
+    assert False
 
 
 def create_configmap(file_path, make_cacert_wrong, configmap_name):
@@ -1029,22 +970,12 @@ def check_configmap_is_deleted(configmap_name):
     Args:
        param1: configmap_name - name of configmap to be checked
     """
-    count = 12
     api_instance = client.CoreV1Api()
-    while (count > 0):
-        try:
-            api_response = api_instance.read_namespaced_config_map(
-                namespace=namespace_value,
-                name=configmap_name,
-                pretty=True,
-            )
-            LOGGER.info("still deleting configmap")
-            LOGGER.debug(str(api_response))
-            count = count-1
-            time.sleep(10)
-        except ApiException:
-            LOGGER.info(f"configmap {configmap_name} deletion confirmed")
-            return
+    if waitfunc.wait_for_deletion(lambda: api_instance.read_namespaced_config_map(
+            namespace=namespace_value, name=configmap_name, pretty=True),
+            120, f"configmap {configmap_name}", max_interval=10):
+        LOGGER.info(f"configmap {configmap_name} deletion confirmed")
+        return
 
     LOGGER.error(f"configmap {configmap_name} is not deleted")
     assert False
@@ -1057,22 +988,22 @@ def check_pod_running(pod_name):
     """
 
     api_instance = client.CoreV1Api()
-    val = 0
-    while val < 12:
+
+    def pod_running():
         try:
             api_response = api_instance.read_namespaced_pod(
                 name=pod_name, namespace=namespace_value, pretty=True)
             LOGGER.debug(str(api_response))
-            if api_response.status.phase == "Running":
-                LOGGER.info(f'POD Check : POD {pod_name} is Running')
-                return
-            time.sleep(5)
-            val += 1
+            return api_response.status.phase == "Running"
         except ApiException as e:
             LOGGER.error(
                 f"Exception when calling CoreV1Api->read_namespaced_pod: {e}")
             LOGGER.info(f"POD Check : POD {pod_name} does not exists on Cluster")
             assert False
+
+    if waitfunc.wait_until(pod_running, 60, f"pod {pod_name} Running", max_interval=5):
+        LOGGER.info(f'POD Check : POD {pod_name} is Running')
+        return
     LOGGER.error(f'POD Check : POD {pod_name} is not Running')
     assert False
 
@@ -1092,6 +1023,7 @@ def get_driver_ds_pod_name():
 
 
 def get_driver_image():
+    """ logs and returns image of CSI driver container , None if it cannot be read """
     pod_name = get_driver_ds_pod_name()
     api_instance = client.CoreV1Api()
     try:
@@ -1101,8 +1033,10 @@ def get_driver_image():
             if(container.name == "ibm-spectrum-scale-csi"):
                 LOGGER.info(f"CSI driver image :  {container.image}")
                 LOGGER.info(f"CSI driver image id : {container.image_id}")
+                return container.image
     except ApiException:
         LOGGER.info("Unable to get driver image")
+    return None
 
 
 def check_pod_image(pod_name, image_name):
@@ -1133,23 +1067,21 @@ def check_pod_image(pod_name, image_name):
 
 def get_pod_list_and_check_running(label, required_pods):
     api_instance = client.CoreV1Api()
-    for _ in range(0,24):
+    pod_list = {"api_response": None}
+
+    def pods_running():
         try:
             api_response = api_instance.list_pod_for_all_namespaces( pretty=True,label_selector=label)
-            pod_status = True
-            for pod_info in api_response.items:
-                if not(pod_info.status.phase == "Running"):
-                    pod_status = False
-                    break
-            if pod_status is True and (len(api_response.items) ==  required_pods):
-                return 
-            time.sleep(20)
-            LOGGER.info(f"Checking for pod with label {label}")
+            pod_list["api_response"] = api_response
         except ApiException as e:
             LOGGER.error(f"Exception when calling CoreV1Api->list_pod_for_all_namespaces: {e}")
             assert False
-    else:
-        LOGGER.error(f"Pods with label {label} are not in expected state {api_response}")
+        LOGGER.info(f"Checking for pod with label {label}")
+        pod_status = all(pod_info.status.phase == "Running" for pod_info in api_response.items)
+        return pod_status is True and (len(api_response.items) ==  required_pods)
+
+    if not(waitfunc.wait_until(pods_running, 480, f"{required_pods} pods with label {label} Running", max_interval=20)):
+        LOGGER.error(f"Pods with label {label} are not in expected state {pod_list['api_response']}")
         assert False
 
 
@@ -0,0 +1,108 @@
+import time
+import logging
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
+LOGGER = logging.getLogger()
+
+# server side timeout of one watch request , watch is resumed from last resourceVersion after it
+WATCH_REQUEST_TIMEOUT = 60
+
+
+def get_resource_version(kube_object):
+    """ return resourceVersion of kubernetes object , object can be model or dict (custom objects) """
+    if isinstance(kube_object, dict):
+        return kube_object.get("metadata", {}).get("resourceVersion")
+    return kube_object.metadata.resource_version
+
+
+def list_object(list_function, name, **kwargs):
+    """
+    lists object name with list_function
+
+    Returns:
+       object (None if it does not exist) , resourceVersion of the list to start watch from
+    """
+    response = list_function(field_selector=f"metadata.name={name}", **kwargs)
+    if isinstance(response, dict):
+        items = response.get("items", [])
+        resource_version = response["metadata"]["resourceVersion"]
+    else:
+        items = response.items
+        resource_version = response.metadata.resource_version
+    if len(items) == 0:
+        return None, resource_version
+    return items[0], resource_version
+
+
+def wait_for_object(list_function, name, condition, timeout, description, **kwargs):
+    """
+    waits till condition is met for kubernetes object name using a watch
+
+    object is listed once and then watched from the resourceVersion of that list ,
+    so every change is seen as soon as API server sends it. watch requests are
+    resumed from last seen resourceVersion and object is listed again if that
+    version is too old (410 Gone). wait also ends at the test deadline.
+
+    Args:
+        param1: list_function - list function of kubernetes client for object kind
+                                e.g. client.CoreV1Api().list_namespaced_pod
+        param2: name - name of object
+        param3: condition - function called with object (None when object does not exist
+                            or is deleted) , waiting ends when it returns a truthy value
+        param4: timeout - maximum seconds to wait
+        param5: description - what is waited for , used in timeout diagnostics
+        param6: kwargs - other arguments of list_function e.g. namespace
+
+    Returns:
+       last value returned by condition , falsy value means timeout
+
+    Raises:
+       exceptions raised by condition or list_function (other than 410 Gone) are not handled
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    remaining_test_time = waitfunc.remaining_test_time()
+    test_deadline_reached = False
+    if remaining_test_time is not None and start + remaining_test_time < deadline:
+        deadline = start + remaining_test_time
+        test_deadline_reached = True
+
+    kube_object, resource_version = list_object(list_function, name, **kwargs)
+    result = condition(kube_object)
+    events = 0
+    kube_watch = watch.Watch()
+    while not result:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            waitfunc.record_timeout(description, timeout, start, events, test_deadline_reached, result)
+            return result
+        try:
+            for event in kube_watch.stream(list_function, field_selector=f"metadata.name={name}",
+                                           resource_version=resource_version,
+                                           timeout_seconds=max(int(min(remaining, WATCH_REQUEST_TIMEOUT)), 1), **kwargs):
+                events += 1
+                kube_object = event["object"]
+                resource_version = get_resource_version(kube_object)
+                LOGGER.debug(f"Watch : {event['type']} event for {name}")
+                if event["type"] == "DELETED":
+                    kube_object = None
+                result = condition(kube_object)
+                if result or time.monotonic() >= deadline:
+                    kube_watch.stop()
+                    break
+        except ApiException as e:
+            if e.status != 410:
+                raise
+            LOGGER.debug(f"Watch : resourceVersion {resource_version} of {name} is too old , listing again")
+            kube_object, resource_version = list_object(list_function, name, **kwargs)
+            result = condition(kube_object)
+
+    LOGGER.debug(f"Watch : {description} satisfied after {events} events in {time.monotonic() - start:.2f}s")
+    return result
+
+
+def wait_for_deletion(list_function, name, timeout, description, **kwargs):
+    """ waits till kubernetes object name is deleted , returns True if deleted within timeout """
+    return bool(wait_for_object(list_function, name, lambda kube_object: kube_object is None,
+                                timeout, f"{description} deletion", **kwargs))
@@ -0,0 +1,185 @@
+import time
+import uuid
+import base64
+import logging
+import threading
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from kubernetes.stream import stream
+from websocket import WebSocketException
+LOGGER = logging.getLogger()
+
+# seconds a command may run in an exec session before session is given up
+EXEC_TIMEOUT = 300
+# reads one "<id> <base64 command>" line at a time from stdin , runs command with /bin/sh and
+# writes one "<marker> <id> <exit status> <base64 output>" line , output is stdout and stderr
+# of command like a single exec stream returns it , base64 keeps every frame on one line
+SHELL_LOOP = """while read -r id command; do
+output=$(echo "$command" | base64 -d | /bin/sh 2>&1)
+status=$?
+echo "{marker} $id $status $(printf '%s' "$output" | base64 | tr -d '\\n')"
+done"""
+
+
+class ExecSessionError(Exception):
+    pass
+
+
+class ExecSessionUnsupported(ExecSessionError):
+    pass
+
+
+class ExecSession:
+    """
+    One exec stream to pod_name running SHELL_LOOP , commands are written to its stdin and their
+    output is read back from its stdout , so every command after the first reuses the
+    websocket connection through apiserver and kubelet instead of opening a new one
+    """
+
+    def __init__(self, namespace, pod_name):
+        self.namespace = namespace
+        self.pod_name = pod_name
+        self.lock = threading.Lock()
+        self.marker = f"exec-session-{uuid.uuid4().hex}"
+        self.command_id = 0
+        self.output = ""
+        api_instance = client.CoreV1Api()
+        self.resp = stream(api_instance.connect_get_namespaced_pod_exec,
+                           pod_name,
+                           namespace,
+                           command=['/bin/sh', '-c', SHELL_LOOP.format(marker=self.marker)],
+                           stderr=True, stdin=True,
+                           stdout=True, tty=False,
+                           _preload_content=False)
+        # shell of pod must have base64 , else commands would silently run empty
+        try:
+            output, status = self.run("echo ready", EXEC_TIMEOUT)
+        except ExecSessionError:
+            self.close()
+            raise
+        if output != "ready" or status != 0:
+            self.close()
+            raise ExecSessionUnsupported(f"shell of pod {pod_name} cannot run exec session loop , got {output!r}")
+
+    def is_open(self):
+        return self.resp.is_open()
+
+    def read_result(self, command_id):
+        """ return (output , exit status) of command_id if its frame was read , frames of earlier commands are dropped """
+        lines = self.output.split("\n")
+        self.output = lines.pop()
+        result = None
+        for line in lines:
+            fields = line.split(" ")
+            if fields[0] != self.marker or len(fields) < 3:
+                continue
+            if int(fields[1]) == command_id:
+                encoded = fields[3] if len(fields) > 3 else ""
+                result = (base64.b64decode(encoded).decode(errors="replace"), int(fields[2]))
+        return result
+
+    def run(self, command, timeout=EXEC_TIMEOUT):
+        """
+        runs command with /bin/sh in the pod , return (output , exit status)
+        raises ExecSessionError if session is closed or command does not finish in timeout seconds
+        """
+        with self.lock:
+            self.command_id += 1
+            encoded = base64.b64encode(command.encode()).decode()
+            deadline = time.monotonic() + timeout
+            try:
+                self.resp.write_stdin(f"{self.command_id} {encoded}\n")
+                while True:
+                    result = self.read_result(self.command_id)
+                    if result is not None:
+                        return result
+                    if not(self.resp.is_open()):
+                        raise ExecSessionError(f"exec session of pod {self.pod_name} closed")
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise ExecSessionError(f"command did not finish in {timeout} seconds in pod {self.pod_name}")
+                    self.resp.update(timeout=min(remaining, 1))
+                    self.output += self.resp.read_stdout(timeout=0)
+                    errors = self.resp.read_stderr(timeout=0)
+                    if errors != "":
+                        LOGGER.debug(f"POD Exec : {self.pod_name} session stderr {errors}")
+            except (WebSocketException, OSError) as e:
+                raise ExecSessionError(f"exec session of pod {self.pod_name} failed : {e}")
+
+    def close(self):
+        self.resp.close()
+
+
+sessions = {}
+# (namespace , pod name) of pods whose shell cannot run SHELL_LOOP , they always get a new exec stream
+unsupported = set()
+sessions_lock = threading.Lock()
+
+
+def get_session(namespace, pod_name):
+    """ return open ExecSession of pod_name , opens a new one if there is none or it was closed """
+    key = (namespace, pod_name)
+    with sessions_lock:
+        session = sessions.get(key)
+    if session is not None and session.is_open():
+        return session
+    # opened outside of sessions_lock so pods checked from several threads open their sessions together
+    try:
+        session = ExecSession(namespace, pod_name)
+    except ExecSessionUnsupported:
+        with sessions_lock:
+            unsupported.add(key)
+        raise
+    with sessions_lock:
+        current = sessions.get(key)
+        if current is not None and current is not session and current.is_open():
+            session.close()
+            return current
+        sessions[key] = session
+    return session
+
+
+def run_once(namespace, pod_name, command):
+    """ runs command with /bin/sh over a new exec stream , return its output """
+    api_instance = client.CoreV1Api()
+    return stream(api_instance.connect_get_namespaced_pod_exec,
+                  pod_name,
+                  namespace,
+                  command=['/bin/sh', '-c', command],
+                  stderr=True, stdin=False,
+                  stdout=True, tty=False)
+
+
+def run(namespace, pod_name, command, timeout=EXEC_TIMEOUT):
+    """
+    runs command in pod_name over its exec session (see ExecSession) , return its output (stdout and stderr)
+    if session cannot be opened or fails , it is closed and command is run over a new exec stream
+    """
+    if (namespace, pod_name) in unsupported:
+        return run_once(namespace, pod_name, command)
+    try:
+        output, status = get_session(namespace, pod_name).run(command, timeout)
+        LOGGER.debug(f"POD Exec : {pod_name} {command!r} exited with {status}")
+        return output
+    except (ExecSessionError, ApiException, WebSocketException, OSError) as e:
+        LOGGER.warning(f"POD Exec : exec session of pod {pod_name} not usable ({e}) , using a new exec stream")
+        close_session(namespace, pod_name)
+    return run_once(namespace, pod_name, command)
+
+
+def close_session(namespace, pod_name):
+    """ closes exec session of pod_name if there is one , called before pod is deleted """
+    with sessions_lock:
+        session = sessions.pop((namespace, pod_name), None)
+    if session is not None:
+        session.close()
+
+
+def close_sessions():
+    """ closes exec sessions of all pods """
+    with sessions_lock:
+        closing = list(sessions.values())
+        sessions.clear()
+        unsupported.clear()
+    for session in closing:
+        session.close()
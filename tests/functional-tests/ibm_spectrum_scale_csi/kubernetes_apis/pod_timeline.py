@@ -0,0 +1,160 @@
+import time
+import logging
+import threading
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.common_utils.statistics_functions as statfunc
+LOGGER = logging.getLogger()
+
+# stages of a pod in the order they are reached , seconds after pod was first seen
+STAGES = ["scheduled", "attach_started", "attached", "mounted", "containers_ready"]
+# pod conditions which mark a stage when they become True
+CONDITION_STAGES = {"PodScheduled": "scheduled", "ContainersReady": "containers_ready"}
+# kubelet pulls images and creates containers only after all volumes are mounted (NodePublishVolume) ,
+# so first of these events of a pod marks its volumes as mounted
+MOUNTED_EVENT_REASONS = ["Pulling", "Pulled", "Created", "Started"]
+# span name -> (stages where span starts , first one reached is used , stage where span ends)
+SPANS = {
+    "schedule": (["created"], "scheduled"),
+    "attach": (["attach_started"], "attached"),
+    "mount": (["attached", "scheduled"], "mounted"),
+    "start": (["mounted"], "containers_ready"),
+    "total": (["created"], "containers_ready"),
+}
+
+
+class PodTimelines:
+    """
+    Time (time.monotonic) at which every stage of every pod was first seen by the pod , event
+    and volumeattachment informers
+
+    A pod is created when it is first seen , scheduled and containers_ready when its
+    PodScheduled and ContainersReady conditions are first seen True , attach_started when
+    the VolumeAttachment of its volume on its node is first seen , attached when that
+    VolumeAttachment is first seen attached (or the SuccessfulAttachVolume event arrives)
+    and mounted when kubelet reports the first image pull or container event (see MOUNTED_EVENT_REASONS).
+    Stages of objects which existed before the pod , like an attachment shared with an
+    earlier pod on the same node , are not counted.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (namespace , pod name) -> stage -> time , "created" included
+        self.stages = {}
+        # (namespace , pod name) -> (pv name , node name) of its volumes
+        self.pod_volumes = {}
+        # (pv name , node name) -> time first seen , time first seen attached
+        self.attach_started = {}
+        self.attached = {}
+
+    def mark(self, key, stage, seen_at):
+        if key in self.stages:
+            self.stages[key].setdefault(stage, seen_at)
+
+    def on_pod(self, event_type, pod):
+        seen_at = time.monotonic()
+        if event_type == "DELETED":
+            return
+        key = (pod.metadata.namespace, pod.metadata.name)
+        with self.lock:
+            # pods listed when informer starts were created earlier , their stages are unknown
+            if event_type == "LISTED" and key not in self.stages:
+                return
+            self.stages.setdefault(key, {"created": seen_at})
+            for condition in (pod.status.conditions if pod.status is not None else None) or []:
+                if condition.type in CONDITION_STAGES and condition.status == "True":
+                    self.mark(key, CONDITION_STAGES[condition.type], seen_at)
+            if not(pod.spec.node_name) or key in self.pod_volumes:
+                return
+        # pvcs of a pod are bound before it is scheduled , pvs are looked up once while pvcs exist
+        claim_names = [volume.persistent_volume_claim.claim_name for volume in pod.spec.volumes or []
+                       if volume.persistent_volume_claim is not None]
+        volume_names = self.get_volume_names(pod.metadata.namespace, claim_names)
+        with self.lock:
+            self.pod_volumes[key] = [(volume_name, pod.spec.node_name) for volume_name in volume_names]
+
+    def on_event(self, event_type, event):
+        seen_at = time.monotonic()
+        if event_type == "DELETED" or event.involved_object.kind != "Pod":
+            return
+        key = (event.involved_object.namespace, event.involved_object.name)
+        with self.lock:
+            if event.reason == "SuccessfulAttachVolume":
+                self.mark(key, "attached", seen_at)
+            elif event.reason in MOUNTED_EVENT_REASONS:
+                self.mark(key, "mounted", seen_at)
+
+    def on_volume_attachment(self, event_type, volume_attachment):
+        seen_at = time.monotonic()
+        if event_type in ["DELETED", "LISTED"] or volume_attachment.spec.source.persistent_volume_name is None:
+            return
+        attachment = (volume_attachment.spec.source.persistent_volume_name, volume_attachment.spec.node_name)
+        with self.lock:
+            self.attach_started.setdefault(attachment, seen_at)
+            if volume_attachment.status is not None and volume_attachment.status.attached:
+                self.attached.setdefault(attachment, seen_at)
+
+    def get_volume_names(self, namespace, claim_names):
+        informer = kubeinformer.get_informer("pvc", namespace)
+        if informer is None:
+            return []
+        pvcs = [informer.get(claim_name) for claim_name in claim_names]
+        return [pvc.spec.volume_name for pvc in pvcs if pvc is not None and pvc.spec.volume_name]
+
+    def get_stages(self, namespace, pod_name):
+        """ return dict stage -> seconds after pod was first seen , for stages pod has reached """
+        key = (namespace, pod_name)
+        with self.lock:
+            stages = dict(self.stages.get(key, {}))
+            attachments = self.pod_volumes.get(key, [])
+            started = [self.attach_started[attachment] for attachment in attachments if attachment in self.attach_started]
+            attached = [self.attached[attachment] for attachment in attachments if attachment in self.attached]
+        if "created" not in stages:
+            return {}
+        if len(started) > 0 and min(started) >= stages["created"]:
+            stages["attach_started"] = min(started)
+            if len(attached) == len(attachments):
+                # all volumes are attached , SuccessfulAttachVolume event may have been seen earlier
+                stages["attached"] = min(stages.get("attached", max(attached)), max(attached))
+        created = stages.pop("created")
+        return {stage: round(stages[stage] - created, 3) for stage in STAGES if stage in stages}
+
+    def get_spans(self, stages):
+        """ return dict span -> seconds for SPANS of which start and end stage are in stages """
+        stages = {"created": 0, **stages}
+        spans = {}
+        for name, (starts, end) in SPANS.items():
+            start = next((stages[stage] for stage in starts if stage in stages), None)
+            if start is not None and end in stages:
+                spans[name] = round(stages[end] - start, 3)
+        return spans
+
+    def get_summary(self):
+        """ return dict span -> latency summary (see statistics_functions.summarize) over all pods seen """
+        with self.lock:
+            keys = list(self.stages)
+        spans = {name: [] for name in SPANS}
+        for namespace, pod_name in keys:
+            for name, seconds in self.get_spans(self.get_stages(namespace, pod_name)).items():
+                spans[name].append(seconds)
+        return {name: statfunc.summarize(values) for name, values in spans.items() if len(values) > 0}
+
+
+timelines = PodTimelines()
+
+
+def start():
+    """ records timelines of pods seen by informers from now on , see PodTimelines """
+    kubeinformer.add_listener("pod", timelines.on_pod)
+    kubeinformer.add_listener("event", timelines.on_event)
+    kubeinformer.add_listener("va", timelines.on_volume_attachment)
+
+
+def log_timeline(namespace, pod_name):
+    """ logs stages and spans of pod_name reached so far """
+    stages = timelines.get_stages(namespace, pod_name)
+    if len(stages) > 0:
+        LOGGER.info(f"POD Timeline : {pod_name} {stages} , spans {timelines.get_spans(stages)}")
+
+
+def get_summary():
+    return timelines.get_summary()
@@ -0,0 +1,184 @@
+import os
+import sys
+import json
+import logging
+import argparse
+import concurrent.futures
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.common_utils.input_data_functions as inputfunc
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_functions as filesetfunc
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_inventory as filesetinventory
+import ibm_spectrum_scale_csi.spectrum_scale_apis.scale_rest_client as scalerestclient
+LOGGER = logging.getLogger()
+
+NAMESPACED_CATEGORIES = ["pvc", "restore_pvc", "clone_pvc", "pod", "restore_pod", "clone_pod", "vs", "ds"]
+SCALE_CATEGORIES = ["dir", "cg", "scalesnapshot"]
+SNAPSHOT_GROUP = {"group": "snapshot.storage.k8s.io", "version": "v1"}
+
+
+def list_names(list_function, **kwargs):
+    """ return names of all objects returned by list_function , empty set if they cannot be listed """
+    try:
+        response = list_function(**kwargs)
+    except ApiException as e:
+        if e.status != 404:
+            LOGGER.warning(f"Sweep : listing failed : {e}")
+        return set()
+    if isinstance(response, dict):
+        return {item["metadata"]["name"] for item in response.get("items", [])}
+    return {item.metadata.name for item in response.items}
+
+
+def get_existing_kubernetes_objects(namespaces):
+    """ return dict (category , namespace) -> names of existing objects , listed once per kind and namespace """
+    core_api = client.CoreV1Api()
+    apps_api = client.AppsV1Api()
+    custom_api = client.CustomObjectsApi()
+    existing = {
+        ("pv", None): list_names(core_api.list_persistent_volume),
+        ("sc", None): list_names(client.StorageV1Api().list_storage_class),
+        ("vscontent", None): list_names(custom_api.list_cluster_custom_object, plural="volumesnapshotcontents", **SNAPSHOT_GROUP),
+        ("vsclass", None): list_names(custom_api.list_cluster_custom_object, plural="volumesnapshotclasses", **SNAPSHOT_GROUP),
+    }
+    for namespace in namespaces:
+        pvcs = list_names(core_api.list_namespaced_persistent_volume_claim, namespace=namespace)
+        pods = list_names(core_api.list_namespaced_pod, namespace=namespace)
+        for category in ["pvc", "restore_pvc", "clone_pvc"]:
+            existing[(category, namespace)] = pvcs
+        for category in ["pod", "restore_pod", "clone_pod"]:
+            existing[(category, namespace)] = pods
+        existing[("vs", namespace)] = list_names(custom_api.list_namespaced_custom_object, plural="volumesnapshots",
+                                                 namespace=namespace, **SNAPSHOT_GROUP)
+        existing[("ds", namespace)] = list_names(apps_api.list_namespaced_daemon_set, namespace=namespace)
+    return existing
+
+
+def scale_object_exists(entry, fileset_names, rest_client, test_data):
+    """ return True if Spectrum Scale object of entry (dir , cg fileset or snapshot) exists """
+    if entry["category"] == "cg":
+        return entry["name"] in fileset_names
+    if entry["category"] == "dir":
+        return filesetfunc.check_dir(entry["name"], timeout=0)
+    snapshot_name, fileset_name = entry["name"]
+    if fileset_name not in fileset_names:
+        return False
+    return any(snapshot["snapshotName"] == snapshot_name
+               for snapshot in rest_client.iter_snapshots(test_data["primaryFs"], fileset_name))
+
+
+def sweep(test_data, ledger_dir=resourceledger.DEFAULT_LEDGER_DIR):
+    """
+    deletes objects recorded in journals of ledger_dir by sessions which did not delete them
+
+    existence of recorded objects is checked with one listing per kind and namespace (and one
+    fileset listing) , existing objects are deleted with clean_with_created_objects per namespace
+    and orphaned consistency group filesets are unlinked and deleted concurrently. journals are
+    removed once all their objects are deleted. objects of other Spectrum Scale GUIs are skipped.
+
+    Returns:
+       True if all orphans are deleted , False otherwise
+    """
+    orphans = resourceledger.get_orphans(ledger_dir)
+    entries = [entry for journal_entries in orphans.values() for entry in journal_entries]
+    LOGGER.info(f"Sweep : {len(entries)} objects recorded as not deleted in {len(orphans)} journals")
+    if len(entries) == 0:
+        for path in orphans:
+            os.remove(path)
+        return True
+
+    skipped = [entry for entry in entries if entry["category"] in SCALE_CATEGORIES and
+               (entry.get("guiHost") not in [None, test_data["guiHost"]] or entry.get("filesystem") not in [None, test_data["primaryFs"]])]
+    for entry in skipped:
+        LOGGER.warning(f"Sweep : skipping {entry['category']} {entry['name']} of {entry.get('guiHost')} filesystem {entry.get('filesystem')}")
+    entries = [entry for entry in entries if entry not in skipped]
+
+    namespaces = {entry.get("namespace") for entry in entries if entry["category"] in NAMESPACED_CATEGORIES}
+    existing = get_existing_kubernetes_objects(namespaces)
+    rest_client = scalerestclient.get_client(test_data)
+    inventory = filesetinventory.get_inventory(test_data)
+    inventory.invalidate()
+    fileset_names = set(inventory.names())
+
+    created_objects_by_namespace = {}
+    cg_filesets = set()
+    for entry in entries:
+        category, name, namespace = entry["category"], entry["name"], entry.get("namespace")
+        if category in SCALE_CATEGORIES:
+            if not(scale_object_exists(entry, fileset_names, rest_client, test_data)):
+                continue
+            if category == "cg":
+                cg_filesets.add(name)
+                continue
+        else:
+            scope = namespace if category in NAMESPACED_CATEGORIES else None
+            if name not in existing.get((category, scope), set()):
+                continue
+        created_objects = created_objects_by_namespace.setdefault(namespace, {category: [] for category in csistoragefunc.CLEANUP_DEPENDENCIES})
+        if name not in created_objects[category]:
+            created_objects[category].append(name)
+
+    swept = True
+    for namespace, created_objects in created_objects_by_namespace.items():
+        LOGGER.info(f"Sweep : deleting orphans of namespace {namespace} : {json.dumps(created_objects)}")
+        with runcontext.activate(runcontext.get().copy(namespace=namespace, keep_objects=False)):
+            try:
+                csistoragefunc.clean_with_created_objects(created_objects)
+            except AssertionError:
+                LOGGER.error(f"Sweep : not all orphans of namespace {namespace} could be deleted")
+                swept = False
+
+    remaining_cg_filesets = [name for name in cg_filesets if filesetfunc.created_fileset_exists(name, timeout=0)]
+    if len(remaining_cg_filesets) > 0:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(filesetfunc.MAX_CLEANUP_WORKERS, len(remaining_cg_filesets))) as executor:
+            timings = list(executor.map(runcontext.bind(lambda name: filesetfunc.unlink_and_delete_fileset(rest_client, name)),
+                                        remaining_cg_filesets))
+        for timing in timings:
+            inventory.invalidate(timing["name"])
+            if timing["status"] != "COMPLETED":
+                swept = False
+
+    if swept and len(skipped) == 0:
+        for path in orphans:
+            os.remove(path)
+        LOGGER.info(f"Sweep : all orphans deleted , {len(orphans)} journals removed")
+    return swept
+
+
+def main(argv=None):
+    """
+    sweeps orphans without running any test or checking the operator , e.g. after a killed CI job
+    python -m ibm_spectrum_scale_csi.kubernetes_apis.sweep_function --testconfig config/test.config --kubeconfig <kubeconfig>
+
+    Returns:
+       exit status , 0 if all orphans are deleted
+    """
+    parser = argparse.ArgumentParser(description="delete objects left by killed test sessions (see ledger_dir in test.config)")
+    parser.add_argument("--kubeconfig", help="kubeconfig , same default as pytest --kubeconfig")
+    parser.add_argument("--clusterconfig", help="cr file used if cr cannot be read from cluster , same default as pytest --clusterconfig")
+    parser.add_argument("--operatornamespace", default="ibm-spectrum-scale-csi-driver")
+    parser.add_argument("--testnamespace", default="ibm-spectrum-scale-csi-test")
+    parser.add_argument("--testconfig", default="config/test.config")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-6s  %(message)s")
+
+    cmd_values = {"kubeconfig_value": args.kubeconfig or inputfunc.get_default_kubeconfig(),
+                  "clusterconfig_value": args.clusterconfig or inputfunc.get_default_clusterconfig(),
+                  "test_namespace": args.testnamespace,
+                  "operator_namespace": args.operatornamespace,
+                  "test_config": args.testconfig}
+    test_data = inputfunc.read_driver_data(cmd_values)
+    filesetfunc.cred_check(test_data)
+    filesetfunc.set_data(test_data)
+    try:
+        swept = sweep(test_data, test_data.get("ledger_dir", resourceledger.DEFAULT_LEDGER_DIR))
+    finally:
+        scalerestclient.close_clients()
+    return 0 if swept else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,28 @@
 import logging
 import time
-import re
+import concurrent.futures
 import json
-import requests
 import urllib3
+from datetime import datetime
+import ibm_spectrum_scale_csi.spectrum_scale_apis.scale_rest_client as scalerestclient
+import ibm_spectrum_scale_csi.spectrum_scale_apis.fileset_inventory as filesetinventory
+import ibm_spectrum_scale_csi.spectrum_scale_apis.filesystem_metadata as filesystemmetadata
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 LOGGER = logging.getLogger()
 
+DEFAULT_CLEANUP_WORKERS = 8
+MAX_CLEANUP_WORKERS = 16
+# seconds to wait for a fileset created or deleted by the driver to show up in REST API
+FILESET_SETTLE_TIMEOUT = 10
+# format of submitted and completed times of GUI jobs
+JOB_TIME_FORMAT = "%Y-%m-%d %H:%M:%S,%f"
+
 
 def set_data(data):
-    global test
-    test = data
+    """ sets Spectrum Scale configuration used by fileset functions in current test context """
+    runcontext.get().test_data = data
 
 
 def delete_fileset(test_data):
@@ -29,25 +41,19 @@ def delete_fileset(test_data):
 
     """
     unlink_fileset(test_data)
-    delete_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}'
-    response = requests.delete(
-        delete_link, verify=False, auth=(test_data["username"], test_data["password"]))
-    LOGGER.debug(response.text)
-    time.sleep(10)
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets/'
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    rest_client = scalerestclient.get_client(test_data)
+    inventory = filesetinventory.get_inventory(test_data)
+    response = rest_client.delete(f'filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}')
     LOGGER.debug(response.text)
-    search_format = f'"{test_data["primaryFset"]}",'
+    rest_client.wait_for_job(response)
+    inventory.invalidate(test_data["primaryFset"])
 
-    search_result = re.search(search_format, str(response.text))
-    LOGGER.debug(search_result)
-    if search_result is None:
+    if not(inventory.exists(test_data["primaryFset"])):
         LOGGER.info(
             f'Success : Fileset {test_data["primaryFset"]} has been deleted')
     else:
         LOGGER.error(
             f'Failed : Fileset {test_data["primaryFset"]} has not been deleted')
-        LOGGER.error(get_link)
         LOGGER.error(response.text)
         assert False
 
@@ -66,13 +72,15 @@ def unlink_fileset(test_data):
        None
 
     """
-    time.sleep(10)
-    unlink_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}/link'
-    response = requests.delete(
-        unlink_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    rest_client = scalerestclient.get_client(test_data)
+    response = rest_client.delete(f'filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}/link')
     LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Fileset {test_data["primaryFset"]} unlink failed : {job["result"]}')
+        return
+    filesetinventory.get_inventory(test_data).invalidate(test_data["primaryFset"])
     LOGGER.info(f'Fileset {test_data["primaryFset"]} unlinked')
-    time.sleep(10)
 
 
 def fileset_exists(test_data):
@@ -91,16 +99,10 @@ def fileset_exists(test_data):
        None
 
     """
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets/'
-    time.sleep(10)
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
-    LOGGER.debug(response.text)
-    search_format = f'"{test_data["primaryFset"]}",'
-
-    search_result = re.search(search_format, str(response.text))
-    if search_result is None:
-        return False
-    return True
+    # primaryFset is created and deleted by the driver , so always re-read it
+    inventory = filesetinventory.get_inventory(test_data)
+    return bool(waitfunc.wait_until(lambda: inventory.exists(test_data["primaryFset"], refresh=True), FILESET_SETTLE_TIMEOUT,
+                                    f'fileset {test_data["primaryFset"]} exists', max_interval=5))
 
 
 def cred_check(test_data):
@@ -110,9 +112,8 @@ def cred_check(test_data):
 
     if API gives any error , It asserts
     """
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/cluster'
     try:
-        response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+        response = scalerestclient.get_client(test_data).get("cluster")
         LOGGER.debug(response.text)
     except:
         LOGGER.error(f'not able to use Scale REST API , Check cr file (guiHost = {test_data["guiHost"]})')
@@ -141,12 +142,15 @@ def link_fileset(test_data):
        None
 
     """
-    fileset_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}/link'
-    response = requests.post(fileset_link, verify=False,
-                             auth=(test_data["username"], test_data["password"]))
+    rest_client = scalerestclient.get_client(test_data)
+    response = rest_client.post(f'filesystems/{test_data["primaryFs"]}/filesets/{test_data["primaryFset"]}/link')
     LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Fileset {test_data["primaryFset"]} link failed : {job["result"]}')
+        return
+    filesetinventory.get_inventory(test_data).invalidate(test_data["primaryFset"])
     LOGGER.info(f'Fileset {test_data["primaryFset"]} linked')
-    time.sleep(5)
 
 
 def create_fileset(test_data):
@@ -163,32 +167,34 @@ def create_fileset(test_data):
        None
 
     """
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/'
-    time.sleep(2)
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    rest_client = scalerestclient.get_client(test_data)
+    response = rest_client.get(f'filesystems/{test_data["primaryFs"]}/')
     LOGGER.debug(response.text)
     response_dict = json.loads(response.text)
     scalehostpath = response_dict["filesystems"][0]["mount"]["mountPoint"]
-    create_fileset_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/filesets'
     headers = {
         'content-type': 'application/json',
         'accept': 'application/json',
     }
     data = f'{{"filesetName":"{test_data["primaryFset"]}","path":"{scalehostpath}/{test_data["primaryFset"]}"}}'
    
-    response = requests.post(create_fileset_link, headers=headers,
-                             data=data, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = rest_client.post(f'filesystems/{test_data["primaryFs"]}/filesets', headers=headers, data=data)
     LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Fileset {test_data["primaryFset"]} create failed : {job["result"]}')
+        return
+    filesetinventory.get_inventory(test_data).invalidate(test_data["primaryFset"])
     LOGGER.info(f'Fileset {test_data["primaryFset"]} created and linked')
-    time.sleep(5)
 
 
-def unmount_fs(test_data):
+def unmount_fs(test_data, invalidate_metadata=True):
     """
     unmount primaryFs provided in configuration file
 
     Args:
         param1: test_data : contents of configuration file
+        param2: invalidate_metadata : drop cached FSUID , mount point and version of primaryFs
 
     Returns:
        None
@@ -197,20 +203,19 @@ def unmount_fs(test_data):
        None
 
     """
-    unmount_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/unmount'
-    LOGGER.debug(unmount_link)
+    rest_client = scalerestclient.get_client(test_data)
     headers = {
         'content-type': 'application/json',
         'accept': 'application/json',
     }
     data = f'{{"nodes":["{test_data["guiHost"]}"],"force": false}}'
-    response = requests.put(unmount_link, headers=headers,
-                            data=data, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = rest_client.put(f'filesystems/{test_data["primaryFs"]}/unmount', headers=headers, data=data)
     LOGGER.debug(response.text)
-    time.sleep(5)
+    rest_client.wait_for_job(response)
+    if invalidate_metadata:
+        filesystemmetadata.invalidate_metadata(test_data)
 
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}'
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = rest_client.get(f'filesystems/{test_data["primaryFs"]}')
     response_dict = json.loads(response.text)
     mounted_on = response_dict["filesystems"][0]["mount"]["nodesMountedReadWrite"]
 
@@ -221,12 +226,13 @@ def unmount_fs(test_data):
     LOGGER.info(f'primaryFS {test_data["primaryFs"]} unmounted from {test_data["guiHost"]}')
 
 
-def mount_fs(test_data):
+def mount_fs(test_data, invalidate_metadata=True):
     """
     mount primaryFs provided in configuration file
 
     Args:
         param1: test_data : contents of configuration file
+        param2: invalidate_metadata : drop cached FSUID , mount point and version of primaryFs
 
     Returns:
        None
@@ -235,20 +241,19 @@ def mount_fs(test_data):
        None
 
     """
-    mount_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}/mount'
-    LOGGER.debug(mount_link)
+    rest_client = scalerestclient.get_client(test_data)
     headers = {
         'content-type': 'application/json',
         'accept': 'application/json',
     }
     data = f'{{"nodes":["{test_data["guiHost"]}"]}}'
-    response = requests.put(mount_link, headers=headers,
-                            data=data, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = rest_client.put(f'filesystems/{test_data["primaryFs"]}/mount', headers=headers, data=data)
     LOGGER.debug(response.text)
-    time.sleep(5)
+    rest_client.wait_for_job(response)
+    if invalidate_metadata:
+        filesystemmetadata.invalidate_metadata(test_data)
 
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["primaryFs"]}'
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = rest_client.get(f'filesystems/{test_data["primaryFs"]}')
     response_dict = json.loads(response.text)
     mounted_on = response_dict["filesystems"][0]["mount"]["nodesMountedReadWrite"]
 
@@ -260,6 +265,10 @@ def cleanup():
     deletes all primaryFsets that matches pattern pvc-
     used for cleanup in case of parallel pvc.
 
+    filesets are unlinked and deleted by up to cleanup_workers (test.config) threads ,
+    capped at MAX_CLEANUP_WORKERS and at scale_rest_pool_size so the GUI node is not overloaded.
+    deletion of all filesets is verified against a single inventory refresh.
+
     Args:
        None
 
@@ -267,38 +276,68 @@ def cleanup():
        None
 
     Raises:
-       None
+       assert False , if any fileset is not deleted
 
     """
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/'
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
-    lst = re.findall(r'\S+pvc-\S+', response.text)
-    lst2 = []
-    for la in lst:
-        lst2.append(la[1:-2])
-    for res in lst2:
-        volume_name = res
-        unlink_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/link'
-        response = requests.delete(
-            unlink_link, verify=False, auth=(test["username"], test["password"]))
-        LOGGER.debug(response.text)
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    inventory = filesetinventory.get_inventory(test)
+    inventory.invalidate()
+    volume_names = inventory.names("pvc-")
+    if len(volume_names) == 0:
+        LOGGER.info("Fileset Cleanup : no pvc- filesets found")
+        return
+
+    workers = min(int(test.get("cleanup_workers", DEFAULT_CLEANUP_WORKERS)), MAX_CLEANUP_WORKERS,
+                  int(test.get("scale_rest_pool_size", scalerestclient.DEFAULT_POOL_SIZE)), len(volume_names))
+    workers = max(workers, 1)
+    LOGGER.info(f"Fileset Cleanup : deleting {len(volume_names)} filesets using {workers} workers")
+
+    start_time = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        timings = list(executor.map(runcontext.bind(lambda volume_name: unlink_and_delete_fileset(rest_client, volume_name)),
+                                    volume_names))
+    total_time = time.monotonic() - start_time
+
+    inventory.invalidate()
+    remaining = set(inventory.names("pvc-")) & set(volume_names)
+    for timing in timings:
+        LOGGER.info(f'Fileset Cleanup : {timing["name"]} unlink {timing["unlink"]:.2f}s , '
+                    f'delete {timing["delete"]:.2f}s , status {timing["status"]}')
+    LOGGER.info(f"Fileset Cleanup : {len(volume_names) - len(remaining)} of {len(volume_names)} filesets deleted in {total_time:.2f}s")
+    if len(remaining) > 0:
+        LOGGER.error(f"Fileset Cleanup : filesets {sorted(remaining)} are not deleted")
+        assert False
+
+
+def unlink_and_delete_fileset(rest_client, volume_name):
+    """
+    unlinks and deletes fileset volume_name , used by cleanup workers
+
+    Returns:
+       dict with fileset name , seconds taken by unlink and delete and final job status
+    """
+    test = runcontext.get().test_data
+    timing = {"name": volume_name}
+    start_time = time.monotonic()
+    response = rest_client.delete(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}/link')
+    LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    timing["unlink"] = time.monotonic() - start_time
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Fileset {volume_name} unlink failed : {job["result"]}')
+    else:
         LOGGER.info(f"Fileset {volume_name} unlinked")
-        time.sleep(5)
-        delete_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/link'
-        response = requests.delete(
-            delete_link, verify=False, auth=(test["username"], test["password"]))
-        LOGGER.debug(response.text)
-        time.sleep(10)
-        get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/'
-        response = requests.get(get_link, verify=False,
-                                auth=(test["username"], test["password"]))
-        LOGGER.debug(response.text)
-        search_result = re.search(volume_name, str(response.text))
-        if search_result is None:
-            LOGGER.info(f'Fileset {volume_name} deleted successfully')
-        else:
-            LOGGER.error(f'Fileset {volume_name} is not deleted')
-            assert False
+
+    start_time = time.monotonic()
+    response = rest_client.delete(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}')
+    LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    timing["delete"] = time.monotonic() - start_time
+    timing["status"] = job["status"]
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Fileset {volume_name} delete failed : {job["result"]}')
+    return timing
 
 
 def delete_created_fileset(volume_name):
@@ -315,49 +354,42 @@ def delete_created_fileset(volume_name):
        None
 
     """
+    test = runcontext.get().test_data
     if volume_name is None:
         return
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/'
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
-    LOGGER.debug(response.text)
-    search_result = re.search(volume_name, str(response.text))
-    LOGGER.debug(search_result)
-    if search_result is None:
+    rest_client = scalerestclient.get_client(test)
+    inventory = filesetinventory.get_inventory(test)
+    # fileset may already be deleted by the driver , so re-read it
+    if not(inventory.exists(volume_name, refresh=True)):
         LOGGER.info(f'Fileset Delete : Fileset {volume_name} has already been deleted')
     else:
-        unlink_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/link'
-        response = requests.delete(
-            unlink_link, verify=False, auth=(test["username"], test["password"]))
+        response = rest_client.delete(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}/link')
         LOGGER.debug(response.text)
+        rest_client.wait_for_job(response)
         LOGGER.info(f'Fileset {volume_name} has been unlinked')
-        time.sleep(5)
-        delete_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}'
-        response = requests.delete(
-            delete_link, verify=False, auth=(test["username"], test["password"]))
+        response = rest_client.delete(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}')
         LOGGER.debug(response.text)
+        rest_client.wait_for_job(response)
 
-        for _ in range(0, 12):
-            get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/'
-            response = requests.get(get_link, verify=False,
-                                    auth=(test["username"], test["password"]))
-            LOGGER.debug(response.text)
-            search_result = re.search(volume_name, str(response.text))
-            LOGGER.debug(search_result)
-            if search_result is None:
-                LOGGER.info(f'Fileset Delete : Fileset {volume_name} has been deleted successfully')
-                return
-            time.sleep(15)
+        def fileset_deleted():
+            inventory.invalidate(volume_name)
             LOGGER.info(f'Fileset Check : Checking for Fileset {volume_name}')
+            return not(inventory.exists(volume_name))
+
+        if waitfunc.wait_until(fileset_deleted, 180, f"fileset {volume_name} deletion", max_interval=15):
+            LOGGER.info(f'Fileset Delete : Fileset {volume_name} has been deleted successfully')
+            return
         LOGGER.error(f'Fileset Delete : Fileset {volume_name} deletion operation failed')
         assert False
 
 
-def created_fileset_exists(volume_name):
+def created_fileset_exists(volume_name, timeout=FILESET_SETTLE_TIMEOUT):
     """
     Checks fileset volume_name exists or not
 
     Args:
         param1: volume_name : fileset to be checked
+        param2: timeout : seconds to wait for fileset to appear
 
     Returns:
        returns True , if volume_name exists
@@ -367,15 +399,10 @@ def created_fileset_exists(volume_name):
        None
 
     """
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}'
-    time.sleep(10)
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
-    LOGGER.debug(response.text)
-    search_format = f'"{volume_name}",'
-    search_result = re.search(search_format, str(response.text))
-    if search_result is None:
-        return False
-    return True
+    test = runcontext.get().test_data
+    inventory = filesetinventory.get_inventory(test)
+    return bool(waitfunc.wait_until(lambda: inventory.exists(volume_name, refresh=True), timeout,
+                                    f"fileset {volume_name} exists", max_interval=5))
 
 
 def create_dir(dir_name):
@@ -392,19 +419,19 @@ def create_dir(dir_name):
        None
 
     """
-    if check_dir(dir_name) is True:
+    test = runcontext.get().test_data
+    if check_dir(dir_name, timeout=0) is True:
         return
 
-    dir_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/directory/{dir_name}'
-    LOGGER.debug(dir_link)
     headers = {
         'content-type': 'application/json',
         'accept': 'application/json',
     }
     data = f'{{ "user":"{test["uid_name"]}", "uid":{test["uid_number"]}, "group":"{test["gid_name"]}", "gid":{test["gid_number"]} }}'
-    response = requests.post(dir_link, headers=headers,
-                             data=data, verify=False, auth=(test["username"], test["password"]))
+    rest_client = scalerestclient.get_client(test)
+    response = rest_client.post(f'filesystems/{test["primaryFs"]}/directory/{dir_name}', headers=headers, data=data)
     LOGGER.debug(response.text)
+    rest_client.wait_for_job(response)
     LOGGER.info(f'Directory Create : Creating directory {dir_name}')
     if check_dir(dir_name) is True:
         LOGGER.info(f'Directory Check : directory {dir_name} created successfully')
@@ -414,27 +441,21 @@ def create_dir(dir_name):
     LOGGER.error(str(response.text))
     assert False
 
-def check_dir(dir_name):
+def check_dir(dir_name, timeout=180):
     """
     checks directory dir_name is present or not
-    asserts  if not present
-    """
-    val = 0
-    while val < 12:
-        check_dir_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/owner/{dir_name}'
-        LOGGER.debug(check_dir_link)
-        headers = {
-            'accept': 'application/json',
-        }
-        response = requests.get(check_dir_link, headers=headers,
-                                verify=False, auth=(test["username"], test["password"]))
+    waits up to timeout seconds for it to appear , returns False if not present
+    """
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+
+    def dir_present():
+        response = rest_client.get(f'filesystems/{test["primaryFs"]}/owner/{dir_name}')
         LOGGER.debug(response.text)
-        if response.status_code == 200:
-            return True
-        time.sleep(15)
         LOGGER.info(f'Directory Check : Checking for directory {dir_name}')
-        val += 1
-    return False
+        return response.status_code == 200
+
+    return bool(waitfunc.wait_until(dir_present, timeout, f"directory {dir_name} present", max_interval=15))
 
 
 def delete_dir(dir_name):
@@ -445,22 +466,25 @@ def delete_dir(dir_name):
        param1: dir_name : name of directory to be deleted
 
     Returns:
-       None
+       True if directory is deleted , False otherwise
 
     Raises:
        None
 
     """
-    dir_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/directory/{dir_name}'
-    LOGGER.debug(dir_link)
+    test = runcontext.get().test_data
     headers = {
         'content-type': 'application/json',
     }
-    response = requests.delete(
-        dir_link, headers=headers, verify=False, auth=(test["username"], test["password"]))
+    rest_client = scalerestclient.get_client(test)
+    response = rest_client.delete(f'filesystems/{test["primaryFs"]}/directory/{dir_name}', headers=headers)
     LOGGER.debug(response.text)
+    job = rest_client.wait_for_job(response)
+    if job["status"] != "COMPLETED":
+        LOGGER.error(f'Directory {dir_name} delete failed : {job["result"]}')
+        return False
     LOGGER.info(f'Deleted directory {dir_name}')
-    time.sleep(5)
+    return True
 
 
 def get_FSUID():
@@ -477,12 +501,8 @@ def get_FSUID():
        None
 
     """
-    info_filesystem = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}?fields=:all:'
-    response = requests.get(info_filesystem, verify=False,
-                            auth=(test["username"], test["password"]))
-    LOGGER.debug(response.text)
-    lst = re.findall(r'\S+uuid[\S.\s]+', response.text)
-    FSUID = str(lst[0][10:27])
+    test = runcontext.get().test_data
+    FSUID = filesystemmetadata.get_metadata(test).fsuid()
     LOGGER.debug(FSUID)
     return FSUID
 
@@ -501,27 +521,18 @@ def get_mount_point():
        None
 
     """
-
+    test = runcontext.get().test_data
     if "type_remote" in test:
-        info_filesystem = f'https://{test["type_remote"]["guiHost"]}:{test["type_remote"]["port"]}/scalemgmt/v2/filesystems/{test["remoteFs"]}?fields=:all:'
-        response = requests.get(info_filesystem, verify=False,
-                                auth=(test["type_remote"]["username"], test["type_remote"]["password"]))
+        mount_point = filesystemmetadata.get_metadata(test["type_remote"], test["remoteFs"]).mount_point()
     else:
-        info_filesystem = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}?fields=:all:'
-        response = requests.get(info_filesystem, verify=False,
-                                auth=(test["username"], test["password"]))
-    LOGGER.debug(response.text)
-    response_dict = json.loads(response.text)
-    mount_point = response_dict["filesystems"][0]["mount"]["mountPoint"]
+        mount_point = filesystemmetadata.get_metadata(test).mount_point()
     LOGGER.debug(mount_point)
     return mount_point
 
 
 def get_remoteFs_remotename_and_remoteid(test_data):
     """ return name of remote filesystem's remote name """
-    info_filesystem = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/filesystems/{test_data["remoteFs"]}'
-    response = requests.get(info_filesystem, verify=False,
-                            auth=(test_data["username"], test_data["password"]))
+    response = scalerestclient.get_client(test_data).get(f'filesystems/{test_data["remoteFs"]}')
     LOGGER.debug(response.text)
     if not(response.status_code == 200):
         LOGGER.error(response.text)
@@ -545,13 +556,16 @@ def get_remoteFs_remotename_and_remoteid(test_data):
         if test_data["guiHost"] != cluster["restApi"][0]["guiHost"]:
             remote_sec_name = cluster["secrets"]
             remote_gui_host = cluster["restApi"][0]["guiHost"]
-            remote_username = test_data['remote_username'][remote_sec_name]
-            remote_password = test_data['remote_password'][remote_sec_name]
-            get_link = f'https://{remote_gui_host}:{test_data["remote_port"]}/scalemgmt/v2/cluster'
-            response = requests.get(get_link, verify=False, auth=(remote_username, remote_password))
+            remote_client_data = {"guiHost": remote_gui_host,
+                                  "port": test_data["remote_port"],
+                                  "username": test_data['remote_username'][remote_sec_name],
+                                  "password": test_data['remote_password'][remote_sec_name],
+                                  "cacert_path": test_data["remote_cacert_path"].get(cluster.get("cacert"), "")}
+            remote_client = scalerestclient.get_client(remote_client_data)
+            response = remote_client.get("cluster")
             if not(response.status_code == 200):
                 LOGGER.error(response.text)
-                LOGGER.error(get_link)
+                LOGGER.error(remote_client.url("cluster"))
                 assert False
             response_dict = json.loads(response.text)
             this_cluster_name = response_dict["cluster"]["clusterSummary"]["clusterName"]          
@@ -568,71 +582,56 @@ def check_snapshot_exists(snapshot_name, volume_name):
     if created returns True
     else return False
     """
-    val = 0
-    while val < 12:
-        snap_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots'
-        response = requests.get(snap_link, verify=False,
-                                auth=(test["username"], test["password"]))
-        LOGGER.debug(response.text)
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+
+    def snapshot_present():
         LOGGER.info(f"Snapshot Fileset Check : Checking for Snapshot {snapshot_name} of Fileset {volume_name}")
-        response_dict = json.loads(response.text)
-        LOGGER.debug(response_dict)
-
-        for snapshot in response_dict["snapshots"]:
-            if snapshot["snapshotName"] == snapshot_name:
-                return True
-        val += 1
-        time.sleep(5)
-    return False
+        snapshots = rest_client.iter_snapshots(test["primaryFs"], volume_name)
+        return any(snapshot["snapshotName"] == snapshot_name for snapshot in snapshots)
+
+    return bool(waitfunc.wait_until(snapshot_present, 60, f"snapshot {snapshot_name} of fileset {volume_name} present", max_interval=5))
 
 
 def create_snapshot(snapshot_name, volume_name, created_objects):
     """
     create snapshot snapshot_name for volume_name
     """
+    test = runcontext.get().test_data
     headers = {
         'content-type': 'application/json',
         'accept': 'application/json',
     }
 
     data= f'{{ "snapshotName": "{snapshot_name}" }}'
-    snap_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots'
-    response = requests.post(snap_link, headers=headers, data=data, verify=False,
-                             auth=(test["username"], test["password"]))
+    rest_client = scalerestclient.get_client(test)
+    response = rest_client.post(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots', headers=headers, data=data)
     LOGGER.debug(response.text)
+    rest_client.wait_for_job(response)
     created_objects["scalesnapshot"].append([snapshot_name, volume_name])
     LOGGER.info(f"Static Snapshot Create :snapshot {snapshot_name} created for volume {volume_name}")
 
 
 def delete_snapshot(snapshot_name, volume_name, created_objects):
-    snap_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots/{snapshot_name}'
-    response = requests.delete(snap_link, verify=False, auth=(test["username"], test["password"]))
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    response = rest_client.delete(f'filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots/{snapshot_name}')
     LOGGER.debug(response.text)
+    rest_client.wait_for_job(response)
     created_objects["scalesnapshot"].remove([snapshot_name, volume_name])
     LOGGER.info(f"Scale Snapshot Delete :snapshot {snapshot_name} of volume {volume_name} is deleted")
 
 
 def check_snapshot_deleted(snapshot_name, volume_name):
-    val = 0
-    while val < 12:
-        snap_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}/snapshots'
-        response = requests.get(snap_link, verify=False,
-                                auth=(test["username"], test["password"]))
-        LOGGER.debug(response.text)
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+
+    def snapshot_deleted():
         LOGGER.info(f"Snapshot Check : Checking for deletion of snapshot {snapshot_name} of volume {volume_name}")
-        response_dict = json.loads(response.text)
-        LOGGER.debug(response_dict)
-
-        snapshots_list = []
-        for snapshot in response_dict["snapshots"]:
-            snapshots_list.append(snapshot["snapshotName"])
-
-        if snapshot_name in snapshots_list:
-            val += 1
-            time.sleep(10)
-        else:
-            return True
-    return False
+        snapshots = rest_client.iter_snapshots(test["primaryFs"], volume_name)
+        return not(any(snapshot["snapshotName"] == snapshot_name for snapshot in snapshots))
+
+    return bool(waitfunc.wait_until(snapshot_deleted, 120, f"snapshot {snapshot_name} of fileset {volume_name} deletion", max_interval=10))
 
 
 def feature_available(feature_name):
@@ -640,34 +639,23 @@ def feature_available(feature_name):
     returns True , if passed feature_name available in scale version
     else , returns False
     """
-    features = {"snapshot": 5110, "permissions": 5112}
-    scale_version = return_scale_version()
-    if int(scale_version) >= features[feature_name]:
-        return True
-    return False
+    test = runcontext.get().test_data
+    return filesystemmetadata.get_metadata(test).feature_available(feature_name)
 
 
 def return_scale_version():
     """
     get spectrum scale version and return it
     """
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/info'
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
-    LOGGER.debug(response.text)
-
-    response_dict = json.loads(response.text)
-    LOGGER.info(f'scale version is {response_dict["info"]["serverVersion"]}')
-    scale_version = response_dict["info"]["serverVersion"]
-    scale_version = scale_version[0] + scale_version[2] + scale_version[4] + scale_version[6]
-    return scale_version
+    test = runcontext.get().test_data
+    return filesystemmetadata.get_metadata(test).scale_version()
 
 
 def get_scale_version(test_data):
     """
     get spectrum scale version and display it
     """
-    get_link = f'https://{test_data["guiHost"]}:{test_data["port"]}/scalemgmt/v2/info'
-    response = requests.get(get_link, verify=False, auth=(test_data["username"], test_data["password"]))
+    response = scalerestclient.get_client(test_data).get("info")
     LOGGER.debug(response.text)
 
     response_dict = json.loads(response.text)
@@ -704,11 +692,11 @@ def get_and_verify_fileset_permissions(volume_name, mode):
        so for permissions=777, we need to ensure that "rwx" is present for all
        i.e. for owner, group and everyone
     """
+    test = runcontext.get().test_data
 
-    # get acl for a path
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/acl/{volume_name}%2F{volume_name}-data'
-
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
+    # get acl entries for a path , only fields read below are requested
+    response = scalerestclient.get_client(test).get(f'filesystems/{test["primaryFs"]}/acl/{volume_name}%2F{volume_name}-data'
+                                                    '?fields=entries.type,entries.who,entries.permissions')
     LOGGER.debug(response.text)
 
     # store acl string as python dictionary
@@ -771,10 +759,77 @@ def get_and_verify_fileset_permissions(volume_name, mode):
     return status
 
 
-def check_fileset_quota(volume_name, fileset_size, max_inode_from_sc):
-    get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/quotas?filter=objectName={volume_name}'
+def get_fileset(volume_name, fields=None):
+    """
+    return fileset document of volume_name from primaryFs
+
+    Args:
+        param1: volume_name : name of fileset
+        param2: fields : comma separated fields to request (e.g. "filesetName,config.maxNumInodes")
+                         full document is requested if None
+
+    Returns:
+       fileset dict , None if fileset does not exist
+    """
+    test = runcontext.get().test_data
+    path = f'filesystems/{test["primaryFs"]}/filesets/{volume_name}'
+    if fields is not None:
+        path = f'{path}?fields={fields}'
+    response = scalerestclient.get_client(test).get(path)
+    LOGGER.debug(response.text)
+    if not(response.status_code == 200):
+        return None
+    filesets = response.json().get("filesets", [])
+    if len(filesets) == 0:
+        return None
+    return filesets[0]
+
+
+def get_job_duration(job):
+    """ return seconds from submission to completion of GUI job , None if job has not completed """
+    try:
+        submitted = datetime.strptime(job["submitted"], JOB_TIME_FORMAT)
+        completed = datetime.strptime(job["completed"], JOB_TIME_FORMAT)
+    except (KeyError, TypeError, ValueError):
+        return None
+    return (completed - submitted).total_seconds()
+
+
+def get_copy_job_durations(volume_names):
+    """
+    return dict volume name -> seconds taken by completed directoryCopy GUI job copying data into it ,
+    jobs are matched by volume name in targetPath of the request , volumes without such job are left out
+    """
+    test = runcontext.get().test_data
+    durations = {}
+    for job in scalerestclient.get_client(test).iter_collection("jobs?fields=:all:", "jobs"):
+        request = job.get("request") or {}
+        if "directoryCopy" not in request.get("url", "") or job.get("status") != "COMPLETED":
+            continue
+        target = json.dumps(request.get("data", ""))
+        for volume_name in volume_names:
+            if volume_name in target:
+                duration = get_job_duration(job)
+                if duration is not None:
+                    durations[volume_name] = duration
+    LOGGER.info(f"Copy Job Check : copy jobs found for {len(durations)} of {len(volume_names)} volumes")
+    return durations
+
+
+def check_fileset_quota(volume_name, fileset_size, max_inode_from_sc, fileset=None):
+    """
+    checks quota blockLimit of volume_name is not less than fileset_size
+    and then checks maximum inodes of volume_name
+
+    fileset is an already fetched document of volume_name (with config.maxNumInodes),
+    passed on to check_fileset_max_inode to avoid fetching it again
+    """
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    quota_path = f'filesystems/{test["primaryFs"]}/quotas?filter=objectName={volume_name}&fields=blockLimit'
+    get_link = rest_client.url(quota_path)
     LOGGER.debug(get_link)
-    response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
+    response = rest_client.get(quota_path)
     LOGGER.debug(response.text)
 
     if not(response.status_code == 200):
@@ -784,6 +839,18 @@ def check_fileset_quota(volume_name, fileset_size, max_inode_from_sc):
 
     response_dict = json.loads(response.text)
     quota_from_api = int(response_dict["quotas"][0]["blockLimit"])
+    quota_from_pvc = get_quota_from_size(fileset_size)
+
+    LOGGER.info(f"PVC Check : Minimum quota expected = {quota_from_pvc}   Actual quota set = {quota_from_api}")
+
+    if quota_from_api >= quota_from_pvc:
+        expected_max_inode = get_expected_max_inode(quota_from_pvc, max_inode_from_sc)
+        return (check_fileset_max_inode(volume_name, expected_max_inode, fileset))
+    return False
+
+
+def get_quota_from_size(fileset_size):
+    """ return minimum quota blockLimit (in KiB) expected for pvc storage fileset_size """
     quota_from_pvc = 0
 
     power_of_10 = {"M": int(1000**2 / 1024), "G": int(1000**3 / 1024), "T": int(1000**4 / 1024)}
@@ -795,41 +862,151 @@ def check_fileset_quota(volume_name, fileset_size, max_inode_from_sc):
         quota_from_pvc = int(fileset_size[:-2]) * power_of_2[fileset_size[-2:]]
     if quota_from_pvc < int(1024**2):
         quota_from_pvc = int(1024**2)
+    return quota_from_pvc
 
-    LOGGER.info(f"PVC Check : Minimum quota expected = {quota_from_pvc}   Actual quota set = {quota_from_api}")
 
-    if quota_from_api >= quota_from_pvc:
-        if max_inode_from_sc is None:
-            expected_max_inode = 200000 if quota_from_pvc > int(1024*1024*10) else 100000
-        else:
-            expected_max_inode = int(max_inode_from_sc)
-        return (check_fileset_max_inode(volume_name, expected_max_inode))
-    return False
+def get_expected_max_inode(quota_from_pvc, max_inode_from_sc):
+    """ return minimum maxNumInodes expected for fileset with quota_from_pvc , max_inode_from_sc is inodeLimit of SC """
+    if max_inode_from_sc is None:
+        return 200000 if quota_from_pvc > int(1024*1024*10) else 100000
+    return int(max_inode_from_sc)
 
 
-def check_fileset_max_inode(volume_name, expected_max_inode):
-    count = 15
-    while count > 0:
-        get_link = f'https://{test["guiHost"]}:{test["port"]}/scalemgmt/v2/filesystems/{test["primaryFs"]}/filesets/{volume_name}'
-        response = requests.get(get_link, verify=False, auth=(test["username"], test["password"]))
+def check_filesets_batch(volumes):
+    """
+    checks existence , quota and maximum inodes of many filesets of primaryFs at once
+    filesets and fileset quotas of primaryFs are listed once , all filesets are checked in memory
+
+    Args:
+        param1: volumes : dict of fileset name -> {"storage": pvc storage , "max_inode": inodeLimit of SC}
+                          quota and inodes are not checked for fileset with storage None
+
+    Returns:
+       returns True , if all filesets exist with expected quota and maximum inodes
+       returns False , otherwise
+    """
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    filesets = {}
+    for fileset in rest_client.iter_filesets(test["primaryFs"], fields="filesetName,config.maxNumInodes"):
+        if fileset["filesetName"] in volumes:
+            filesets[fileset["filesetName"]] = fileset
+    quotas = {}
+    for quota in rest_client.iter_collection(f'filesystems/{test["primaryFs"]}/quotas?filter=quotaType=FILESET&fields=objectName,blockLimit', "quotas"):
+        if quota.get("objectName") in volumes:
+            quotas[quota["objectName"]] = int(quota["blockLimit"])
+    LOGGER.info(f"PVC Check : {len(filesets)} of {len(volumes)} filesets found in single listing of {test['primaryFs']}")
+
+    status = True
+    pending_inode = {}
+    for volume_name, values in volumes.items():
+        if volume_name not in filesets:
+            LOGGER.error(f"PVC Check : Fileset {volume_name} doesn't exists")
+            status = False
+            continue
+        if values["storage"] is None:
+            continue
+        quota_from_pvc = get_quota_from_size(values["storage"])
+        quota_from_api = quotas.get(volume_name, 0)
+        if quota_from_api < quota_from_pvc:
+            LOGGER.error(f"PVC Check : Fileset {volume_name} minimum quota expected = {quota_from_pvc}   Actual quota set = {quota_from_api}")
+            status = False
+            continue
+        pending_inode[volume_name] = get_expected_max_inode(quota_from_pvc, values["max_inode"])
+
+    def max_inodes_matched():
+        if len(pending_inode) > 0 and all(filesets[volume_name] is None for volume_name in pending_inode):
+            LOGGER.info(f"PVC Check : Checking maximun number of inodes for {len(pending_inode)} filesets")
+            for fileset in rest_client.iter_filesets(test["primaryFs"], fields="filesetName,config.maxNumInodes"):
+                if fileset["filesetName"] in pending_inode:
+                    filesets[fileset["filesetName"]] = fileset
+        for volume_name in list(pending_inode):
+            config = (filesets[volume_name] or {}).get("config", {})
+            if "maxNumInodes" in config and int(config["maxNumInodes"]) >= pending_inode[volume_name]:
+                del pending_inode[volume_name]
+            else:
+                filesets[volume_name] = None
+        return len(pending_inode) == 0
+
+    waitfunc.wait_until(max_inodes_matched, 300, f"maximum inodes of {len(pending_inode)} filesets", max_interval=20)
+
+    for volume_name, expected_max_inode in pending_inode.items():
+        LOGGER.error(
+            f"PVC Check : Either actual max inode number of {volume_name} is smaller than expected max inodes {expected_max_inode}"
+            f" or response does not contain 'maxNumInodes' ( for more info STG Defect 285687)")
+        status = False
+    return status
+
+
+def wait_for_fileset_quotas(volumes, timeout=300):
+    """
+    waits till quota blockLimit of all filesets of primaryFs in volumes is not less than their storage ,
+    fileset quotas of primaryFs are listed once per poll for all filesets
+
+    Args:
+        param1: volumes : dict of fileset name -> pvc storage
+        param2: timeout : seconds to wait
+
+    Returns:
+       dict fileset name -> time (time.monotonic) at which expected quota was first seen
+    """
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    expected = {volume_name: get_quota_from_size(storage) for volume_name, storage in volumes.items()}
+    updated_at = {}
+
+    def quotas_updated():
+        LOGGER.info(f"PVC Check : Checking quota of {len(expected) - len(updated_at)} filesets")
+        now = time.monotonic()
+        for quota in rest_client.iter_collection(f'filesystems/{test["primaryFs"]}/quotas?filter=quotaType=FILESET&fields=objectName,blockLimit', "quotas"):
+            volume_name = quota.get("objectName")
+            if volume_name in expected and volume_name not in updated_at and int(quota["blockLimit"]) >= expected[volume_name]:
+                updated_at[volume_name] = now
+        return len(updated_at) == len(expected)
+
+    waitfunc.wait_until(quotas_updated, timeout, f"quota of {len(volumes)} filesets", max_interval=10)
+    return updated_at
 
-        if not(response.status_code == 200):
-            LOGGER.error(f"Response status code is not 200 for {get_link}")
-            LOGGER.error(response)
-            return False
 
-        response_dict = json.loads(response.text)
+def check_fileset_max_inode(volume_name, expected_max_inode, fileset=None):
+    """
+    checks maximum inodes of volume_name are not less than expected_max_inode
+    fileset document is used for first check if passed , later checks fetch only config.maxNumInodes
+    """
+    test = runcontext.get().test_data
+    rest_client = scalerestclient.get_client(test)
+    inode_path = f'filesystems/{test["primaryFs"]}/filesets/{volume_name}?fields=config.maxNumInodes'
+    get_link = rest_client.url(inode_path)
+    fetched = {"fileset": fileset}
+
+    def max_inode_matched():
+        """ return "matched" or "failed" to stop waiting , None to check again """
+        fileset = fetched.pop("fileset", None)
+        if fileset is None:
+            LOGGER.info(f"PVC Check : Checking maximun number of inodes for {volume_name} fileset")
+            response = rest_client.get(inode_path)
 
-        if "maxNumInodes" in response_dict["filesets"][0]["config"]:
-            actual_max_inode = int(response_dict["filesets"][0]["config"]['maxNumInodes'])
+            if not(response.status_code == 200):
+                LOGGER.error(f"Response status code is not 200 for {get_link}")
+                LOGGER.error(response)
+                return "failed"
+
+            fileset = json.loads(response.text)["filesets"][0]
+
+        if "maxNumInodes" in fileset.get("config", {}):
+            actual_max_inode = int(fileset["config"]['maxNumInodes'])
             if actual_max_inode >= expected_max_inode:
                 LOGGER.info(f"PVC Check : Actual maximun number of inodes {actual_max_inode} is greater than expected maximum inodes {expected_max_inode}")
-                return True
-        count -= 1
-        time.sleep(20)
-        LOGGER.info(f"PVC Check : Checking maximun number of inodes for {volume_name} fileset")
+                return "matched"
+        LOGGER.debug(fileset)
+        return None
+
+    result = waitfunc.wait_until(max_inode_matched, 300, f"maximum inodes of fileset {volume_name}", max_interval=20)
+    if result == "matched":
+        return True
+    if result == "failed":
+        return False
 
     LOGGER.error(
         f"PVC Check : Either actual max inode number is smaller than expected max inodes {expected_max_inode} or response does not contain 'maxNumInodes' ( for more info STG Defect 285687)")
-    LOGGER.error(response.text)
     return False
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+import ibm_spectrum_scale_csi.spectrum_scale_apis.scale_rest_client as scalerestclient
+LOGGER = logging.getLogger()
+
+DEFAULT_TTL = 30
+
+inventories = {}
+inventories_lock = threading.Lock()
+
+
+class FilesetInventory:
+    """
+    Fileset listing of one filesystem indexed by fileset name
+
+    The full listing is fetched (following REST paging) only when the inventory
+    is older than ttl seconds. Filesets changed by this test run are marked with
+    invalidate() and re-read one by one on next lookup instead of relisting.
+    """
+
+    def __init__(self, rest_client, filesystem, ttl=DEFAULT_TTL):
+        self.rest_client = rest_client
+        self.filesystem = filesystem
+        self.ttl = float(ttl)
+        self.filesets = {}
+        self.dirty = set()
+        self.refreshed_at = None
+        self.lock = threading.RLock()
+
+    def is_stale(self):
+        return self.refreshed_at is None or time.monotonic() - self.refreshed_at > self.ttl
+
+    def refresh(self):
+        """ fetch complete fileset listing and rebuild the index """
+        filesets = {}
+        for fileset in self.rest_client.iter_filesets(self.filesystem, fields="filesetName"):
+            filesets[fileset["filesetName"]] = fileset
+
+        with self.lock:
+            self.filesets = filesets
+            self.dirty.clear()
+            self.refreshed_at = time.monotonic()
+        LOGGER.debug(f'Fileset Inventory : {len(filesets)} filesets listed for {self.filesystem}')
+
+    def refresh_fileset(self, fileset_name):
+        """ re-read single fileset fileset_name and update the index , return True if it exists """
+        response = self.rest_client.get(f'filesystems/{self.filesystem}/filesets/{fileset_name}')
+        LOGGER.debug(response.text)
+        fileset = None
+        if response.status_code == 200:
+            filesets = response.json().get("filesets", [])
+            if len(filesets) > 0:
+                fileset = filesets[0]
+        with self.lock:
+            self.dirty.discard(fileset_name)
+            if fileset is None:
+                self.filesets.pop(fileset_name, None)
+                return False
+            self.filesets[fileset_name] = fileset
+            return True
+
+    def invalidate(self, fileset_name=None):
+        """ mark fileset_name to be re-read on next lookup , if None whole listing is refreshed """
+        with self.lock:
+            if fileset_name is None:
+                self.refreshed_at = None
+            else:
+                self.dirty.add(fileset_name)
+
+    def exists(self, fileset_name, refresh=False):
+        """
+        return True if fileset_name exists on filesystem
+
+        Args:
+            param1: fileset_name - exact name of fileset
+            param2: refresh - re-read fileset_name from REST API , use when it may
+                              have been changed outside this test run (e.g. by the driver)
+        """
+        if refresh:
+            return self.refresh_fileset(fileset_name)
+        if self.is_stale():
+            self.refresh()
+        with self.lock:
+            dirty = fileset_name in self.dirty
+            present = fileset_name in self.filesets
+        if dirty:
+            return self.refresh_fileset(fileset_name)
+        return present
+
+    def names(self, pattern=None):
+        """ return fileset names , optionally only those containing pattern """
+        if self.is_stale():
+            self.refresh()
+        for fileset_name in list(self.dirty):
+            self.refresh_fileset(fileset_name)
+        with self.lock:
+            return [name for name in self.filesets if pattern is None or pattern in name]
+
+
+def get_inventory(test_data, filesystem=None):
+    """
+    return FilesetInventory for filesystem (default primaryFs) of guiHost in test_data
+    one inventory is kept per (guiHost, filesystem) for the whole session
+    """
+    if filesystem is None:
+        filesystem = test_data["primaryFs"]
+    key = (test_data["guiHost"], str(test_data["port"]), filesystem)
+    with inventories_lock:
+        if key not in inventories:
+            inventories[key] = FilesetInventory(scalerestclient.get_client(test_data), filesystem,
+                                                test_data.get("fileset_inventory_ttl", DEFAULT_TTL))
+        return inventories[key]
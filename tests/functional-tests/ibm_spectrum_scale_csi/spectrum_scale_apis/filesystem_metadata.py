@@ -0,0 +1,92 @@
+import logging
+import threading
+import ibm_spectrum_scale_csi.spectrum_scale_apis.scale_rest_client as scalerestclient
+LOGGER = logging.getLogger()
+
+FEATURES = {"snapshot": 5110, "permissions": 5112, "clone": 5121}
+
+metadata_cache = {}
+metadata_lock = threading.Lock()
+
+
+class FilesystemMetadata:
+    """
+    Values of one filesystem which do not change during a test session
+
+    FSUID and mount point are fetched together on first use , with only the
+    fields needed , scale version on first use of scale_version/feature_available.
+    """
+
+    def __init__(self, rest_client, filesystem):
+        self.rest_client = rest_client
+        self.filesystem = filesystem
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def fetch_filesystem(self):
+        response = self.rest_client.get(f'filesystems/{self.filesystem}?fields=uuid,mount.mountPoint')
+        LOGGER.debug(response.text)
+        if response.status_code != 200:
+            LOGGER.error(f'Unable to get details of filesystem {self.filesystem} : {response.text}')
+            assert False
+        filesystem = response.json()["filesystems"][0]
+        self.values["fsuid"] = filesystem["uuid"]
+        self.values["mount_point"] = filesystem["mount"]["mountPoint"]
+
+    def fetch_version(self):
+        response = self.rest_client.get("info")
+        LOGGER.debug(response.text)
+        if response.status_code != 200:
+            LOGGER.error(f'Unable to get scale version from {self.rest_client.gui_host} : {response.text}')
+            assert False
+        server_version = response.json()["info"]["serverVersion"]
+        LOGGER.info(f'scale version is {server_version}')
+        self.values["scale_version"] = server_version[0] + server_version[2] + server_version[4] + server_version[6]
+
+    def get(self, name, fetch):
+        with self.lock:
+            if name not in self.values:
+                fetch()
+            return self.values[name]
+
+    def fsuid(self):
+        return self.get("fsuid", self.fetch_filesystem)
+
+    def mount_point(self):
+        return self.get("mount_point", self.fetch_filesystem)
+
+    def scale_version(self):
+        """ return scale version as string of 4 digits e.g. "5112" """
+        return self.get("scale_version", self.fetch_version)
+
+    def feature_available(self, feature_name):
+        """ return True , if feature_name (key of FEATURES) is available in scale version """
+        return int(self.scale_version()) >= FEATURES[feature_name]
+
+    def invalidate(self):
+        with self.lock:
+            self.values.clear()
+
+
+def get_metadata(test_data, filesystem=None):
+    """
+    return FilesystemMetadata for filesystem (default primaryFs) of guiHost in test_data
+    one object is kept per (guiHost, filesystem) for the whole session
+    """
+    if filesystem is None:
+        filesystem = test_data["primaryFs"]
+    key = (test_data["guiHost"], filesystem)
+    with metadata_lock:
+        if key not in metadata_cache:
+            metadata_cache[key] = FilesystemMetadata(scalerestclient.get_client(test_data), filesystem)
+        return metadata_cache[key]
+
+
+def invalidate_metadata(test_data, filesystem=None):
+    """ drop cached values of filesystem (default primaryFs) of guiHost in test_data """
+    if filesystem is None:
+        filesystem = test_data["primaryFs"]
+    with metadata_lock:
+        metadata = metadata_cache.get((test_data["guiHost"], filesystem))
+    if metadata is not None:
+        metadata.invalidate()
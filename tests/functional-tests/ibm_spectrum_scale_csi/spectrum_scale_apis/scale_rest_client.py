@@ -0,0 +1,200 @@
+import logging
+import threading
+import time
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+LOGGER = logging.getLogger()
+
+DEFAULT_POOL_SIZE = 10
+JOB_POLL_INTERVAL = 0.5
+JOB_MAX_POLL_INTERVAL = 8
+JOB_TIMEOUT = 300
+
+clients = {}
+clients_lock = threading.Lock()
+
+
+class ScaleRestClient:
+    """
+    Keep-alive client for one Spectrum Scale GUI (REST API v2) endpoint
+
+    All requests for a cluster go through a single requests.Session, so the
+    TCP connection and TLS session to the GUI node are set up once and then
+    reused from the connection pool instead of being renegotiated per call.
+    """
+
+    def __init__(self, gui_host, port, username, password, cacert_path="", pool_size=DEFAULT_POOL_SIZE):
+        self.gui_host = gui_host
+        self.port = port
+        self.base_url = f'https://{gui_host}:{port}/scalemgmt/v2'
+        self.session = requests.Session()
+        self.session.auth = (username, password)
+        # verify GUI certificate only when a cacert is provided , as done by the driver
+        self.session.verify = cacert_path if cacert_path not in [None, ""] else False
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=int(pool_size), pool_block=True)
+        self.session.mount("https://", self.adapter)
+        self.session.headers.update({"accept": "application/json"})
+
+    def url(self, path):
+        """ return full REST url for path relative to /scalemgmt/v2 , absolute urls are returned as is """
+        if path.startswith("https://"):
+            return path
+        return f'{self.base_url}/{path}'
+
+    def request(self, method, path, **kwargs):
+        link = self.url(path)
+        LOGGER.debug(f'{method} {link}')
+        return self.session.request(method, link, **kwargs)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def iter_collection(self, path, key):
+        """
+        yields records of collection key (e.g. "filesets") returned by GET path
+        pages are requested one at a time following paging.next of each response ,
+        so records are yielded as soon as their page arrives and only one page is held in memory
+
+        Args:
+            param1: path - collection path relative to /scalemgmt/v2
+            param2: key - name of list holding the records in response
+
+        Raises:
+            assert False , if any page can not be fetched
+        """
+        while path is not None:
+            response = self.get(path)
+            if response.status_code != 200:
+                LOGGER.error(f'Unable to list {key} from {self.url(path)} : {response.text}')
+                assert False
+            response_dict = response.json()
+            records = response_dict.get(key, [])
+            LOGGER.debug(f'{len(records)} {key} received from {self.url(path)}')
+            yield from records
+            path = response_dict.get("paging", {}).get("next")
+
+    def iter_filesets(self, filesystem, fields=None):
+        """ yields filesets of filesystem , fields limits returned attributes (e.g. "filesetName") """
+        path = f'filesystems/{filesystem}/filesets'
+        if fields is not None:
+            path = f'{path}?fields={fields}'
+        return self.iter_collection(path, "filesets")
+
+    def iter_snapshots(self, filesystem, fileset):
+        """ yields snapshots of fileset in filesystem """
+        return self.iter_collection(f'filesystems/{filesystem}/filesets/{fileset}/snapshots', "snapshots")
+
+    def wait_for_job(self, response, timeout=JOB_TIMEOUT):
+        """
+        waits for asynchronous job returned by a Scale REST mutation to finish
+        job is polled starting at JOB_POLL_INTERVAL seconds , doubling up to JOB_MAX_POLL_INTERVAL
+
+        Args:
+            param1: response - response of POST/PUT/DELETE request
+            param2: timeout - seconds to wait for job completion
+
+        Returns:
+           job record from /jobs/{jobId} , job["status"] is "COMPLETED" on success
+           if request was not accepted or job did not finish , job["status"] is "FAILED"
+           and job["result"]["stderr"] contains the error
+        """
+        try:
+            response_dict = response.json()
+            job_id = response_dict["jobs"][0]["jobId"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            LOGGER.error(f'Unable to get job details for {response.request.method} {response.url} : {response.text}')
+            return {"status": "FAILED", "result": {"stderr": [response.text]}}
+
+        wait_time = JOB_POLL_INTERVAL
+        deadline = time.monotonic() + timeout
+        while True:
+            job_response = self.get(f'jobs/{job_id}?fields=:all:')
+            LOGGER.debug(job_response.text)
+            try:
+                job = job_response.json()["jobs"][0]
+            except (ValueError, KeyError, IndexError, TypeError):
+                LOGGER.error(f'Unable to get job {job_id} details : {job_response.text}')
+                return {"jobId": job_id, "status": "FAILED", "result": {"stderr": [job_response.text]}}
+
+            if job["status"] != "RUNNING":
+                break
+            if time.monotonic() + wait_time > deadline:
+                LOGGER.error(f'Job {job_id} is still running after {timeout} seconds')
+                job["status"] = "FAILED"
+                job.setdefault("result", {})["stderr"] = [f'job {job_id} timed out after {timeout} seconds']
+                return job
+            time.sleep(wait_time)
+            wait_time = min(wait_time * 2, JOB_MAX_POLL_INTERVAL)
+
+        if job["status"] != "COMPLETED":
+            LOGGER.error(f'Job {job_id} failed : {job.get("result")}')
+        return job
+
+    def connection_stats(self):
+        """
+        return number of requests sent and connections opened to GUI host
+        every request above number of connections reused an open connection
+        """
+        num_requests, num_connections = 0, 0
+        pools = self.adapter.poolmanager.pools
+        for pool_key in pools.keys():
+            pool = pools[pool_key]
+            num_requests += pool.num_requests
+            num_connections += pool.num_connections
+        return {"requests": num_requests,
+                "connections": num_connections,
+                "reused": max(num_requests - num_connections, 0)}
+
+    def close(self):
+        self.session.close()
+
+
+def get_client(test_data):
+    """
+    return ScaleRestClient for guiHost in test_data
+    one client (and so one session) is created per cluster and reused by all callers
+
+    Args:
+        param1: test_data - dict with guiHost, port, username, password
+                            and optionally cacert_path, scale_rest_pool_size
+
+    Returns:
+       ScaleRestClient
+    """
+    cacert_path = test_data.get("cacert_path", "")
+    key = (test_data["guiHost"], str(test_data["port"]), test_data["username"], cacert_path)
+    with clients_lock:
+        if key not in clients:
+            pool_size = test_data.get("scale_rest_pool_size", DEFAULT_POOL_SIZE)
+            clients[key] = ScaleRestClient(test_data["guiHost"], test_data["port"], test_data["username"],
+                                           test_data["password"], cacert_path, pool_size)
+            LOGGER.debug(f'Created Scale REST client for {test_data["guiHost"]} with pool size {pool_size}')
+        return clients[key]
+
+
+def log_connection_stats():
+    """ logs connection reuse counters of all Scale REST clients """
+    with clients_lock:
+        for client in clients.values():
+            stats = client.connection_stats()
+            LOGGER.info(f'Scale REST client {client.gui_host} : {stats["requests"]} requests sent over '
+                        f'{stats["connections"]} connections , {stats["reused"]} requests reused an open connection')
+
+
+def close_clients():
+    """ closes sessions of all Scale REST clients """
+    with clients_lock:
+        for client in clients.values():
+            client.close()
+        clients.clear()
@@ -0,0 +1,27 @@
+import logging
+import pytest
+import ibm_spectrum_scale_csi.benchmarks.clone_benchmark as clonebenchmark
+import ibm_spectrum_scale_csi.benchmarks.snapshot_benchmark as snapbenchmark
+LOGGER = logging.getLogger()
+pytestmark = [pytest.mark.benchmark, pytest.mark.stresstest, pytest.mark.localcluster]
+
+
+@pytest.fixture(autouse=True)
+def values(data_fixture, check_csi_operator, local_cluster_fixture, benchmark_report):
+    global data, report  # are required in every testcase
+    data = data_fixture["driver_data"]
+    report = benchmark_report
+
+
+@pytest.mark.parametrize("file_count, file_size_mb", snapbenchmark.DATASETS)
+@pytest.mark.parametrize("clones", clonebenchmark.FAN_OUTS)
+def test_clone_fanout_benchmark(clones, file_count, file_size_mb):
+    for node_class in data.get("clone_benchmark_node_classes", clonebenchmark.DEFAULT_NODE_CLASSES):
+        clonebenchmark.run(data, "fanout", clones, file_count, file_size_mb, node_class, report)
+
+
+@pytest.mark.parametrize("file_count, file_size_mb", snapbenchmark.DATASETS)
+@pytest.mark.parametrize("depth", clonebenchmark.CHAIN_DEPTHS)
+def test_clone_chain_benchmark(depth, file_count, file_size_mb):
+    for node_class in data.get("clone_benchmark_node_classes", clonebenchmark.DEFAULT_NODE_CLASSES):
+        clonebenchmark.run(data, "chain", depth, file_count, file_size_mb, node_class, report)
@@ -1,4 +1,6 @@
 from datetime import datetime
+import time
+import threading
 import pytest
 from py.xml import html
 import logging
@@ -8,18 +10,44 @@ import ibm_spectrum_scale_csi.common_utils.input_data_functions as inputfunc
 import ibm_spectrum_scale_csi.kubernetes_apis.csi_object_function as csiobjectfunc
 import ibm_spectrum_scale_csi.kubernetes_apis.csi_storage_function as csistoragefunc
 import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_objects_function as kubeobjectfunc
+import ibm_spectrum_scale_csi.kubernetes_apis.kubernetes_informer as kubeinformer
+import ibm_spectrum_scale_csi.kubernetes_apis.pod_timeline as podtimeline
+import ibm_spectrum_scale_csi.kubernetes_apis.pod_exec_session as podexec
+import ibm_spectrum_scale_csi.spectrum_scale_apis.scale_rest_client as scalerestclient
+import ibm_spectrum_scale_csi.common_utils.wait_functions as waitfunc
+import ibm_spectrum_scale_csi.common_utils.run_context as runcontext
+import ibm_spectrum_scale_csi.common_utils.timing_database as timingdb
+import ibm_spectrum_scale_csi.common_utils.resource_ledger as resourceledger
+import ibm_spectrum_scale_csi.kubernetes_apis.sweep_function as sweepfunc
+import ibm_spectrum_scale_csi.benchmarks.benchmark_report as benchreport
 
 LOGGER = logging.getLogger()
 
+# pytest-parallel runs session fixtures once per worker thread , process wide setup and teardown
+# is done by the first and last of them
+session_lock = threading.Lock()
+active_sessions = 0
+
 def pytest_addoption(parser):
     parser.addoption("--kubeconfig", action="store")
     parser.addoption("--clusterconfig", action="store")
     parser.addoption("--testnamespace", default="ibm-spectrum-scale-csi-test",action="store")
     parser.addoption("--operatornamespace", default="ibm-spectrum-scale-csi-driver", action="store")
     parser.addoption("--runslow", action="store_true", help="run slow tests")
+    parser.addoption("--runbenchmark", action="store_true", help="run benchmark tests")
     parser.addoption("--operatoryaml", action="store")
     parser.addoption("--testconfig", default="config/test.config", action="store")
     parser.addoption("--createnamespace", action="store_true", help="will create seperate namespace for each testcase")
+    parser.addoption("--testdeadline", default=0, type=float, action="store",
+                     help="overall seconds for all waits of one testcase , 0 for no deadline")
+    parser.addoption("--sweep", action="store_true",
+                     help="delete objects left by earlier killed sessions (see ledger_dir in test.config) before running tests")
+    parser.addoption("--timingdb", default=timingdb.DEFAULT_TIMING_DB, action="store",
+                     help="SQLite database where duration of every test and its phases is recorded , empty to not record")
+    parser.addoption("--durationorder", action="store_true",
+                     help="run longest tests first , using durations recorded in --timingdb")
+    parser.addoption("--shard", action="store",
+                     help="run only shard K/N of the tests , shards are balanced using durations recorded in --timingdb")
 
 def pytest_html_results_table_header(cells):
     cells.pop()
@@ -30,6 +58,7 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     report.description = str(item.function.__doc__)
+    setattr(item, "rep_" + report.when, report)
 
 
 now = datetime.now()
@@ -42,9 +71,21 @@ def pytest_configure(config):
     if not config.option.htmlpath:
         config.option.htmlpath = default_html_path
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line("markers", "benchmark: mark test as benchmark , run with --runbenchmark")
 
 
 def pytest_collection_modifyitems(config, items):
+    if config.getoption("--durationorder") or config.getoption("--shard"):
+        selected, deselected = timingdb.schedule(items, config.getoption("--timingdb"),
+                                                 config.getoption("--durationorder"), config.getoption("--shard"))
+        if len(deselected) > 0:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+    if not(config.getoption("--runbenchmark")):
+        skip_benchmark = pytest.mark.skip(reason="need --runbenchmark option to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
     if config.getoption("--runslow"):
         # --runslow given in cli: do not skip slow tests
         return
@@ -54,6 +95,39 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_slow)
 
 
+@pytest.fixture(autouse=True)
+def test_context(request):
+    started_at = time.monotonic()
+    with runcontext.activate(runcontext.get().copy()) as context:
+        yield context
+        record_timing(request, time.monotonic() - started_at, context.phase_times)
+
+
+def record_timing(request, duration, phase_times):
+    path = request.config.getoption("--timingdb")
+    if not(path):
+        return
+    report = getattr(request.node, "rep_call", None) or getattr(request.node, "rep_setup", None)
+    outcome = report.outcome if report is not None else "unknown"
+    LOGGER.info(f"Test Timing : {request.node.nodeid} {outcome} in {round(duration, 1)} seconds , phases "
+                f"{ {name: round(seconds, 1) for name, seconds in phase_times.items()} }")
+    try:
+        timingdb.TimingDatabase(path).record(request.node.nodeid, outcome, duration, phase_times)
+    except Exception as e:
+        LOGGER.warning(f"Test Timing : could not record in {path} : {e}")
+
+
+@pytest.fixture(autouse=True)
+def test_deadline(request, test_context):
+    waitfunc.set_test_deadline(request.config.getoption("--testdeadline"), request.node.name)
+    yield
+    timeouts = waitfunc.clear_test_deadline()
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed:
+        for diagnostics in timeouts:
+            LOGGER.error(f"Wait Timeout : {diagnostics}")
+
+
 @pytest.fixture(scope='session')
 def data_fixture(request):
     data_fixture = {}
@@ -85,7 +159,8 @@ def data_fixture(request):
     data_fixture["driver_object"] = baseclass.Driver(data_fixture["cmd_values"]["kubeconfig_value"], data_fixture["value_pvc"], 
                            data_fixture["value_pod"], data_fixture["driver_data"]["id"], data_fixture["cmd_values"]["test_namespace"], 
                            data_fixture["driver_data"]["keepobjects"], data_fixture["driver_data"]["image_name"], 
-                           data_fixture["driver_data"]["pluginNodeSelector"])
+                           data_fixture["driver_data"]["pluginNodeSelector"],
+                           data_fixture["driver_data"].get("parallel_pvc_concurrency", baseclass.bulkpvcfunc.DEFAULT_CONCURRENCY))
 
     data_fixture["snapshot_object"] = baseclass.Snapshot(data_fixture["cmd_values"]["kubeconfig_value"], 
                            data_fixture["cmd_values"]["test_namespace"], data_fixture["driver_data"]["keepobjects"],
@@ -97,9 +172,43 @@ def data_fixture(request):
 
     
 @pytest.fixture(scope='session')
-def check_csi_operator(data_fixture):
+def check_csi_operator(request, data_fixture):
+    global active_sessions
     baseclass.filesetfunc.cred_check(data_fixture["driver_data"])
     baseclass.filesetfunc.set_data(data_fixture["driver_data"])
+    with session_lock:
+        if active_sessions == 0:
+            start_session(request, data_fixture)
+        active_sessions += 1
+        check_operator(data_fixture)
+    yield
+    with session_lock:
+        active_sessions -= 1
+        if active_sessions == 0:
+            csistoragefunc.delete_pooled_storage_classes()
+            resourceledger.close_journal()
+            log_pod_timelines()
+            podexec.close_sessions()
+            kubeinformer.stop_informers()
+            scalerestclient.log_connection_stats()
+            scalerestclient.close_clients()
+
+
+def start_session(request, data_fixture):
+    ledger_dir = data_fixture["driver_data"].get("ledger_dir", resourceledger.DEFAULT_LEDGER_DIR)
+    podtimeline.start()
+    if request.config.getoption("--sweep"):
+        sweepfunc.sweep(data_fixture["driver_data"], ledger_dir)
+    if data_fixture["driver_data"]["keepobjects"] is False:
+        resourceledger.start_journal(ledger_dir)
+
+
+def log_pod_timelines():
+    for span, summary in podtimeline.get_summary().items():
+        LOGGER.info(f"POD Timeline : {span} {summary}")
+
+
+def check_operator(data_fixture):
     operator = baseclass.Scaleoperator(data_fixture["cmd_values"]["kubeconfig_value"],
                            data_fixture["cmd_values"]["operator_namespace"], data_fixture["cmd_values"]["operator_file"])
     operator_object = baseclass.Scaleoperatorobject(data_fixture["operator_data"], data_fixture["cmd_values"]["kubeconfig_value"])
@@ -120,21 +229,37 @@ def check_csi_operator(data_fixture):
             assert False
 
 
+@pytest.fixture(scope='session')
+def benchmark_report(data_fixture, check_csi_operator):
+    report = benchreport.BenchmarkReport({"driver_image": baseclass.kubeobjectfunc.get_driver_image(),
+                                          "scale_version": baseclass.filesetfunc.return_scale_version()})
+    yield report
+    # pod timelines are recorded per process , see pod_timeline.PodTimelines
+    for span, summary in podtimeline.get_summary().items():
+        report.add("pod timeline", {"span": span}, {"operation": span, "completed": summary["count"], "latency": summary})
+    report.write(data_fixture["driver_data"].get("benchmark_report_dir", benchreport.DEFAULT_REPORT_DIR))
+
+
 @pytest.fixture
-def new_namespace(data_fixture):
+def new_namespace(data_fixture, test_context):
+    # every worker of a parallel run (pytest-parallel or pytest-xdist) gets its own namespace and directory prefix
+    test_namespace = runcontext.get_worker_namespace(data_fixture["cmd_values"]["test_namespace"])
     if data_fixture["cmd_values"]["createnamespace"] is True:
-        data_fixture["cmd_values"]["test_namespace"] = csistoragefunc.get_random_name("csi-test")
+        test_namespace = csistoragefunc.get_random_name("csi-test")
 
-    if not(kubeobjectfunc.check_namespace_exists(data_fixture["cmd_values"]["test_namespace"])):
-        kubeobjectfunc.create_namespace(data_fixture["cmd_values"]["test_namespace"])
+    if not(kubeobjectfunc.check_namespace_exists(test_namespace)):
+        kubeobjectfunc.create_namespace(test_namespace)
 
-    data_fixture["driver_object"].test_ns = data_fixture["cmd_values"]["test_namespace"]
-    data_fixture["snapshot_object"].test_namespace = data_fixture["cmd_values"]["test_namespace"]
-    csistoragefunc.set_test_namespace_value(data_fixture["cmd_values"]["test_namespace"])       
+    data_fixture["driver_object"].test_ns = test_namespace
+    data_fixture["snapshot_object"].test_namespace = test_namespace
+    csistoragefunc.set_test_namespace_value(test_namespace)
+    test_context.dir_prefix = runcontext.get_worker_dir_prefix()
+    kubeinformer.start_informers(test_namespace)
     yield
     if data_fixture["cmd_values"]["createnamespace"] is True and data_fixture["driver_data"]["keepobjects"] is False:
-        kubeobjectfunc.delete_namespace(data_fixture["cmd_values"]["test_namespace"])
-        kubeobjectfunc.check_namespace_deleted(data_fixture["cmd_values"]["test_namespace"])
+        kubeinformer.stop_informers(test_namespace)
+        kubeobjectfunc.delete_namespace(test_namespace)
+        kubeobjectfunc.check_namespace_deleted(test_namespace)
 
 
 @pytest.fixture
@@ -0,0 +1,18 @@
+import logging
+import pytest
+import ibm_spectrum_scale_csi.benchmarks.expansion_benchmark as expbenchmark
+LOGGER = logging.getLogger()
+pytestmark = [pytest.mark.benchmark, pytest.mark.stresstest, pytest.mark.localcluster]
+
+
+@pytest.fixture(autouse=True)
+def values(data_fixture, check_csi_operator, local_cluster_fixture, benchmark_report):
+    global data, report  # are required in every testcase
+    data = data_fixture["driver_data"]
+    report = benchmark_report
+
+
+@pytest.mark.parametrize("concurrency", expbenchmark.CONCURRENCY_LEVELS)
+@pytest.mark.parametrize("volume_type", expbenchmark.VOLUME_TYPES)
+def test_expansion_benchmark(volume_type, concurrency):
+    expbenchmark.run(volume_type, data, concurrency, report)
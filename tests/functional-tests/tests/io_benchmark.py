@@ -0,0 +1,17 @@
+import logging
+import pytest
+import ibm_spectrum_scale_csi.benchmarks.io_benchmark as iobenchmark
+LOGGER = logging.getLogger()
+pytestmark = [pytest.mark.benchmark, pytest.mark.stresstest, pytest.mark.localcluster]
+
+
+@pytest.fixture(autouse=True)
+def values(data_fixture, check_csi_operator, local_cluster_fixture, benchmark_report):
+    global data, report  # are required in every testcase
+    data = data_fixture["driver_data"]
+    report = benchmark_report
+
+
+@pytest.mark.parametrize("volume_type", iobenchmark.VOLUME_TYPES)
+def test_io_benchmark(volume_type):
+    iobenchmark.run(volume_type, data, data.get("io_probe"), report)
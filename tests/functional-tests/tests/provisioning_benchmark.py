@@ -0,0 +1,19 @@
+import logging
+import pytest
+import ibm_spectrum_scale_csi.benchmarks.provisioning_benchmark as provbenchmark
+LOGGER = logging.getLogger()
+pytestmark = [pytest.mark.benchmark, pytest.mark.stresstest, pytest.mark.localcluster]
+
+
+@pytest.fixture(autouse=True)
+def values(data_fixture, check_csi_operator, local_cluster_fixture, benchmark_report):
+    global data, value_pvc, report  # are required in every testcase
+    data = data_fixture["driver_data"]
+    value_pvc = data_fixture["value_pvc"][0]
+    report = benchmark_report
+
+
+@pytest.mark.parametrize("concurrency", provbenchmark.CONCURRENCY_LEVELS)
+@pytest.mark.parametrize("volume_type", provbenchmark.VOLUME_TYPES)
+def test_provisioning_benchmark(volume_type, concurrency):
+    provbenchmark.run(volume_type, data, value_pvc, concurrency, report)
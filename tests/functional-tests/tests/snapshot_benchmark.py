@@ -0,0 +1,20 @@
+import logging
+import pytest
+import ibm_spectrum_scale_csi.benchmarks.snapshot_benchmark as snapbenchmark
+LOGGER = logging.getLogger()
+pytestmark = [pytest.mark.benchmark, pytest.mark.stresstest, pytest.mark.localcluster]
+
+
+@pytest.fixture(autouse=True)
+def values(data_fixture, check_csi_operator, local_cluster_fixture, benchmark_report):
+    global data, report  # are required in every testcase
+    data = data_fixture["driver_data"]
+    report = benchmark_report
+
+
+@pytest.mark.parametrize("file_count, file_size_mb", snapbenchmark.DATASETS)
+def test_snapshot_benchmark(file_count, file_size_mb):
+    snapbenchmark.run(data, file_count, file_size_mb, report,
+                      data.get("snapshot_benchmark_snapshots", snapbenchmark.DEFAULT_SNAPSHOTS),
+                      data.get("snapshot_benchmark_snapshots_per_minute", snapbenchmark.DEFAULT_SNAPSHOTS_PER_MINUTE),
+                      data.get("snapshot_benchmark_restores", snapbenchmark.DEFAULT_RESTORES))